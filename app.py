@@ -1,58 +1,97 @@
 import streamlit as st
-import yt_dlp
 import os
 import pandas as pd
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 from keyword_analyzer import KeywordAnalyzer, KeywordDataExporter
+from download_service import DownloadService
+from channel_cache import ChannelCache
+from channel_resolver import ChannelResolver
 import plotly.express as px
 import plotly.graph_objects as go
 
+@st.cache_resource
+def get_analyzer():
+    """Streamlit 재실행 사이에 공유하는 키워드 분석기 (HTTP 커넥션 풀, 특징 캐시, DB 연결 재사용)"""
+    return KeywordAnalyzer()
+
+@st.cache_resource
+def get_exporter():
+    """Streamlit 재실행 사이에 공유하는 키워드 데이터 내보내기 도구"""
+    return KeywordDataExporter()
+
+@st.cache_resource
+def get_channel_resolver():
+    """채널 URL → 채널 ID 변환기 (결과는 파일에 저장해서 재사용)"""
+    return ChannelResolver(os.getenv('CHANNEL_ID_CACHE_PATH', 'channel_ids.db'))
+
 def get_channel_id(channel_url):
     """채널 URL에서 채널 ID를 추출하거나 조회합니다."""
     try:
-        response = requests.get(channel_url)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            # 채널 ID가 포함된 메타 태그 찾기
-            meta_tags = soup.find_all('meta', {'property': 'og:url'})
-            for tag in meta_tags:
-                content = tag.get('content', '')
-                if 'channel/' in content:
-                    return content.split('channel/')[-1]
+        return get_channel_resolver().resolve(channel_url)
     except Exception as e:
         st.error(f"채널 ID 조회 실패: {str(e)}")
     return None
 
-def get_channel_info(channel_url):
-    """채널 정보와 비디오 목록을 가져옵니다."""
-    ydl_opts = {
-        'quiet': True,
-        'extract_flat': True,
-        'force_generic_extractor': True,
-        'no_warnings': True,
-        'ignoreerrors': True
-    }
-    
+def resolve_channel_url(channel_url):
+    """채널 URL을 비디오 목록 URL로 변환합니다. (채널 ID 를 찾지 못하면 None)"""
+    channel_id = get_channel_id(channel_url)
+    if channel_id:
+        return f"https://www.youtube.com/channel/{channel_id}/videos"
+    return None
+
+@st.cache_resource
+def get_channel_cache():
+    """Streamlit 재실행 사이에 공유하는 채널 메타데이터 캐시"""
+    return ChannelCache(
+        os.getenv('CHANNEL_CACHE_PATH', 'channel_cache.db'),
+        ttl=float(os.getenv('CHANNEL_CACHE_TTL', '3600')),
+        resolver=resolve_channel_url
+    )
+
+def get_channel_info(channel_url, force_refresh=False):
+    """채널 정보와 비디오 목록을 가져옵니다. (캐시, TTL 이 지나면 새 업로드만 추가로 조회)"""
     try:
-        # 먼저 채널 ID 가져오기
-        channel_id = get_channel_id(channel_url)
-        if channel_id:
-            channel_url = f"https://www.youtube.com/channel/{channel_id}/videos"
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            result = ydl.extract_info(channel_url, download=False)
-            if result and 'entries' in result:
-                return result
-            else:
-                # 채널 URL로 시도
-                result = ydl.extract_info(channel_url.replace("/videos", ""), download=False)
-                return result
+        return get_channel_cache().get(channel_url, force_refresh=force_refresh)
     except Exception as e:
         st.error(f"채널 정보 가져오기 실패: {str(e)}")
         return None
 
+@st.cache_resource
+def get_download_service():
+    """모든 세션이 공유하는 백그라운드 다운로드 서비스 (스크립트 재실행과 무관하게 계속 실행)"""
+    return DownloadService(
+        os.getenv('DOWNLOAD_JOBS_PATH', 'download_jobs.db'),
+        workers=int(os.getenv('DOWNLOAD_WORKERS', '4')),
+        per_host_limit=int(os.getenv('DOWNLOAD_PER_HOST_LIMIT', '4'))
+    )
+
+@st.fragment(run_every=2)
+def show_download_jobs():
+    """이 세션이 등록한 다운로드 작업의 진행 상황 (2초마다 이 부분만 갱신)"""
+    job_ids = st.session_state.get('download_job_ids', [])
+    if not job_ids:
+        return
+
+    service = get_download_service()
+    st.subheader('다운로드 작업')
+    for job_id in job_ids:
+        job = service.job(job_id)
+        if job is None:
+            continue
+
+        st.progress(job['fraction'], text=f"{job['label'] or job_id} - {job['status']}")
+        st.caption(
+            f"{job['completed']}/{job['total']} 완료 (실패 {job['failed']}, 건너뜀 {job['skipped']}) | "
+            f"{job['bytes'] / 1024 / 1024:.1f} MB, {job['bytes_per_s'] / 1024 / 1024:.1f} MB/s, "
+            f"{job['videos_per_min']:.1f} videos/min"
+            + (f" | 다운로드 중: {', '.join(job['current'][:3])}" if job['current'] else '')
+        )
+        if job['status'] in ('queued', 'running'):
+            if st.button('취소', key=f'cancel_{job_id}'):
+                service.cancel(job_id)
+        for failure in job['failures']:
+            st.error(f"다운로드 실패: {failure['title']} - {failure['error']}")
+
 def format_duration(duration):
     """초 단위 시간을 MM:SS 형식으로 변환합니다."""
     if not duration:
@@ -80,15 +119,16 @@ tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
     '⚙️ Settings'
 ])
 
-# Initialize keyword analyzer
-analyzer = KeywordAnalyzer()
-exporter = KeywordDataExporter()
+# Initialize keyword analyzer (재실행 사이에 커넥션 풀 / 특징 캐시 유지)
+analyzer = get_analyzer()
+exporter = get_exporter()
 
 with tab1:
 
     # 채널 URL 또는 username 입력
     channel_input = st.text_input('YouTube 채널 URL 또는 username을 입력하세요:',
                                 help='예: https://www.youtube.com/@Seul_Ku 또는 @Seul_Ku')
+    refresh_channel = st.button('채널 목록 새로고침', help='캐시된 목록에 새 업로드를 추가로 조회합니다.')
 
     if channel_input:
         try:
@@ -100,7 +140,7 @@ with tab1:
                     channel_input = f"https://www.youtube.com/{channel_input}"
 
                 # 채널 정보 가져오기
-                channel_info = get_channel_info(channel_input)
+                channel_info = get_channel_info(channel_input, force_refresh=refresh_channel)
 
                 if not channel_info or 'entries' not in channel_info:
                     st.error('채널 정보를 가져올 수 없습니다. 다른 URL 형식을 시도해보세요.')
@@ -120,6 +160,7 @@ with tab1:
                 for entry in channel_info['entries']:
                     if entry:
                         videos.append({
+                            'id': entry['id'],
                             'title': entry.get('title', 'Unknown'),
                             'url': f"https://www.youtube.com/watch?v={entry['id']}",
                             'duration': format_duration(entry.get('duration', 0)),
@@ -141,33 +182,24 @@ with tab1:
                         format_option = st.selectbox('포맷 선택:',
                                                    ['mp4', 'mkv'])
 
-                    # 진행 상황 표시를 위한 상태 표시줄
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        use_archive = st.checkbox('이미 받은 비디오 건너뛰기 (아카이브)', value=True)
+                    with col2:
+                        only_new = st.checkbox('새 업로드만 받기 (마지막 동기화 이후)', value=False,
+                                               disabled=not use_archive,
+                                               help='완료된 비디오는 파일을 지웠어도 다시 받지 않습니다. '
+                                                    '실패하거나 중단된 비디오는 다시 받습니다.')
 
-                    # 다운로드 버튼
+                    # 다운로드 버튼 - 백그라운드 서비스에 작업을 등록하고 바로 반환
                     if st.button('선택한 비디오 다운로드'):
-                        total_videos = len(videos)
-                        for i, video in enumerate(videos):
-                            try:
-                                ydl_opts = {
-                                    'format': f'bestvideo[height<={resolution[:-1]}]+bestaudio/best[height<={resolution[:-1]}]',
-                                    'outtmpl': os.path.join(download_path, '%(title)s.%(ext)s'),
-                                    'merge_output_format': format_option,
-                                    'quiet': True,
-                                }
-
-                                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                                    status_text.text(f'다운로드 중: {video["title"]}')
-                                    ydl.download([video['url']])
-                                    progress = (i + 1) / total_videos
-                                    progress_bar.progress(progress)
-                                    st.success(f'다운로드 완료: {video["title"]}')
-
-                            except Exception as e:
-                                st.error(f'다운로드 실패: {video["title"]} - {str(e)}')
-
-                        status_text.text('모든 다운로드가 완료되었습니다!')
+                        job_id = get_download_service().submit(
+                            videos, download_path, resolution, format_option,
+                            use_archive=use_archive, only_new=only_new,
+                            label=channel_info.get('uploader', 'Unknown')
+                        )
+                        st.session_state['download_job_ids'] = [job_id] + st.session_state.get('download_job_ids', [])
+                        st.info(f'다운로드 작업이 등록되었습니다: {job_id}')
                 else:
                     st.warning('비디오 정보를 가져올 수 없습니다.')
 
@@ -175,6 +207,8 @@ with tab1:
             st.error(f'에러가 발생했습니다: {str(e)}')
             st.info('올바른 채널 URL이나 username을 입력했는지 확인해주세요.')
 
+    show_download_jobs()
+
 # Tab 2: Keyword Analysis
 with tab2:
     st.header('🔍 포털 키워드 분석')
@@ -831,7 +865,7 @@ with tab6:
             if st.button('🗑️ 데이터베이스 초기화'):
                 try:
                     if os.path.exists(analyzer.db.db_path):
-                        os.remove(analyzer.db.db_path)
+                        analyzer.db.reset()
                         st.success('✅ 데이터베이스가 초기화되었습니다.')
                     else:
                         st.info('데이터베이스가 없습니다.')
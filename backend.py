@@ -3,20 +3,38 @@ FastAPI Backend for Keyword Analysis
 Keyword Analyzer와 Notion DB를 연동하는 백엔드
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 from typing import List, Optional
 import os
+import json
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from keyword_analyzer import AdvancedKeywordAnalyzer, AdvancedKeywordDataExporter
+from keyword_analyzer import AdvancedKeywordAnalyzer, AdvancedKeywordDataExporter, TopKRecommendations
 from notion_db import NotionDB
+from notion_queue import NotionWriteQueue
+from notion_mirror import NotionMirror
+from response_cache import ResponseCache, SQLiteCacheBackend
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Notion 전송 워커 시작/종료 (남은 작업은 spool 에 남아 다음 실행 때 전송)"""
+    notion_queue.start()
+    yield
+    notion_queue.stop()
 
 # FastAPI 앱 초기화
 app = FastAPI(
     title="YouTube Keyword Analyzer API",
     description="Advanced keyword analysis with Notion integration",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (Vercel 프론트엔드 접근 허용)
@@ -28,10 +46,53 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 초기화
-analyzer = AdvancedKeywordAnalyzer()
+# ==================== Analyzer 실행 계층 ====================
+# 분석기 메서드는 동기 I/O (HTTP, SQLite) 를 하므로 이벤트 루프 대신 전용 스레드 풀에서 실행
+# ANALYZER_WORKERS: 동시에 실행할 분석 작업 수 (0 이면 이벤트 루프에서 직접 실행)
+# ANALYZER_MAX_PENDING: 실행 + 대기 중인 작업 상한 (초과 시 503)
+ANALYZER_WORKERS = int(os.getenv("ANALYZER_WORKERS", "16"))
+ANALYZER_MAX_PENDING = int(os.getenv("ANALYZER_MAX_PENDING", "256"))
+
+# 초기화 (포털 요청 풀은 분석 작업당 포털 3개를 동시에 처리할 수 있는 크기)
+analyzer = AdvancedKeywordAnalyzer(max_workers=max(12, ANALYZER_WORKERS * 3))
 exporter = AdvancedKeywordDataExporter()
 
+analyzer_executor = (
+    ThreadPoolExecutor(max_workers=ANALYZER_WORKERS, thread_name_prefix="analyzer")
+    if ANALYZER_WORKERS > 0 else None
+)
+_analyzer_slots = asyncio.Semaphore(ANALYZER_MAX_PENDING)
+
+async def run_analyzer(func, *args, **kwargs):
+    """동기 분석 함수를 제한된 스레드 풀에서 실행"""
+    if analyzer_executor is None:
+        return func(*args, **kwargs)
+
+    if _analyzer_slots.locked():
+        raise HTTPException(status_code=503, detail="Analyzer is busy, try again later")
+
+    async with _analyzer_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            analyzer_executor, functools.partial(func, *args, **kwargs)
+        )
+
+# ==================== 응답 캐시 ====================
+# 같은 (엔드포인트, 키워드, 파라미터) 요청은 TTL 동안 재사용하고, 동시에 들어온 요청은 한 번만 계산
+# RESPONSE_CACHE_TTL: 유효 시간 (초), RESPONSE_CACHE_SIZE: 최대 항목 수
+# RESPONSE_CACHE_BACKEND: memory (워커별) | sqlite (RESPONSE_CACHE_PATH 파일을 워커끼리 공유)
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "2048"))
+
+if os.getenv("RESPONSE_CACHE_BACKEND", "memory") == "sqlite":
+    response_cache = ResponseCache(SQLiteCacheBackend(
+        os.getenv("RESPONSE_CACHE_PATH", "response_cache.db"),
+        maxsize=RESPONSE_CACHE_SIZE,
+        ttl=RESPONSE_CACHE_TTL
+    ))
+else:
+    response_cache = ResponseCache(ttl=RESPONSE_CACHE_TTL, maxsize=RESPONSE_CACHE_SIZE)
+
 # Notion DB 초기화
 NOTION_API_TOKEN = os.getenv("NOTION_API_TOKEN", "ntn_T84053591181vVGMJGrESxdEGryJX6sO9EZIeeQ4OzS2YJ")
 notion_db = NotionDB(NOTION_API_TOKEN)
@@ -48,6 +109,22 @@ DB_IDS = {
 
 notion_db.set_database_ids(DB_IDS)
 
+# Notion 저장은 write-behind 큐로: 요청 처리 중에는 로컬 spool 에만 기록
+# NOTION_QUEUE_PATH: spool SQLite 파일
+# NOTION_QUEUE_WORKERS: 전송 워커 수 (0 이면 spool 만)
+notion_queue = NotionWriteQueue(
+    notion_db,
+    path=os.getenv("NOTION_QUEUE_PATH", "notion_queue.db"),
+    workers=int(os.getenv("NOTION_QUEUE_WORKERS", "2"))
+)
+
+# Notion 읽기는 로컬 미러에서 (NOTION_MIRROR_MAX_STALENESS 초가 지나면 조회 전에 증분 동기화)
+notion_mirror = NotionMirror(
+    notion_db,
+    path=os.getenv("NOTION_MIRROR_PATH", "notion_mirror.db"),
+    max_staleness=float(os.getenv("NOTION_MIRROR_MAX_STALENESS", "300"))
+)
+
 # ==================== Pydantic Models ====================
 
 class KeywordAnalysisRequest(BaseModel):
@@ -60,6 +137,8 @@ class MultiKeywordRequest(BaseModel):
 class RecommendationsRequest(BaseModel):
     keywords: List[str]
     channel_topic: Optional[str] = None
+    k: int = 20
+    per_keyword: int = 5
 
 class CompetitorRequest(BaseModel):
     competitor_keywords: List[str]
@@ -84,6 +163,23 @@ async def health_check():
         "notion_connected": bool(DB_IDS['keyword_analysis'])
     }
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """런타임 지표 (커넥션 풀 등)"""
+    return {
+        "analyzer_pool": {
+            "workers": ANALYZER_WORKERS,
+            "max_pending": ANALYZER_MAX_PENDING
+        },
+        "http_pool": analyzer.http.stats(),
+        "feature_cache": analyzer.feature_cache_stats(),
+        "response_cache": response_cache.stats(),
+        "notion_rate_limit": notion_db.rate_limiter.stats(),
+        "notion_queue": notion_queue.stats(),
+        "notion_mirror": notion_mirror.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
 # ==================== Keyword Analysis ====================
 
 @app.post("/api/analyze")
@@ -97,11 +193,22 @@ async def analyze_keyword(request: KeywordAnalysisRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        # 분석 실행
-        result = analyzer.analyze_multi_portal(keyword)
-
-        # Notion에 저장 (백그라운드)
-        save_to_notion_background(keyword, result)
+        async def compute():
+            result = await run_analyzer(analyzer.analyze_multi_portal, keyword)
+
+            # Notion에 저장 (새로 분석했을 때만, spool 후 백그라운드 전송)
+            if notion_queue.is_configured('keyword_analysis'):
+                await asyncio.to_thread(
+                    notion_queue.enqueue_keyword_analysis, keyword, notion_analysis_data(result)
+                )
+            return result
+
+        # 분석 실행 (캐시 / 동일 요청 합치기, 시간 초과된 부분 결과는 캐시하지 않음)
+        result = await response_cache.get_or_compute(
+            response_cache.make_key("analyze", keyword),
+            compute,
+            cache_if=lambda analysis: not analysis.get('partial')
+        )
 
         return {
             "success": True,
@@ -110,6 +217,8 @@ async def analyze_keyword(request: KeywordAnalysisRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -128,7 +237,7 @@ async def compare_keywords(request: MultiKeywordRequest):
             keywords = keywords[:5]
 
         # 비교 분석 실행
-        comparison_df = analyzer.compare_keywords(keywords)
+        comparison_df = await run_analyzer(analyzer.compare_keywords, keywords)
 
         # DataFrame을 딕셔너리로 변환
         result = {
@@ -142,6 +251,8 @@ async def compare_keywords(request: MultiKeywordRequest):
             "data": result
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Comparison failed: {str(e)}")
 
@@ -158,7 +269,7 @@ async def analyze_short_long(request: KeywordAnalysisRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        result = analyzer.analyze_short_long_keywords(keyword)
+        result = await run_analyzer(analyzer.analyze_short_long_keywords, keyword)
 
         return {
             "success": True,
@@ -167,6 +278,8 @@ async def analyze_short_long(request: KeywordAnalysisRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -181,14 +294,17 @@ async def get_recommendations(request: RecommendationsRequest):
         if not keywords:
             raise HTTPException(status_code=400, detail="Keywords cannot be empty")
 
-        recommendations = analyzer.get_realtime_recommendations(
+        recommendations = await run_analyzer(
+            analyzer.get_realtime_recommendations,
             keywords,
-            request.channel_topic or ""
+            request.channel_topic or "",
+            k=max(1, min(100, request.k)),
+            per_keyword=max(1, request.per_keyword)
         )
 
-        # Notion에 저장 (백그라운드)
-        for rec in recommendations:
-            save_recommendation_to_notion(keywords[0], rec)
+        # Notion에 저장 (spool 후 백그라운드 전송)
+        if notion_queue.is_configured('recommendation'):
+            await asyncio.to_thread(notion_queue.enqueue_recommendations, keywords[0], recommendations)
 
         return {
             "success": True,
@@ -198,16 +314,91 @@ async def get_recommendations(request: RecommendationsRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Recommendations failed: {str(e)}")
 
+@app.post("/api/recommendations/stream")
+async def stream_recommendations(request: RecommendationsRequest, format: str = "ndjson"):
+    """
+    실시간 키워드 추천 (스트리밍)
+
+    시드 키워드 하나가 처리될 때마다 한 줄씩 전송합니다.
+    - format=ndjson (기본): application/x-ndjson, 한 줄에 JSON 하나
+    - format=sse: text/event-stream
+
+    메시지 종류:
+    - {"type": "seed", "seed": ..., "recommendations": [...]}
+    - {"type": "summary", "recommendations": [...상위 k개...], "count": ...}
+    """
+    keywords = [kw.strip() for kw in request.keywords if kw.strip()]
+
+    if not keywords:
+        raise HTTPException(status_code=400, detail="Keywords cannot be empty")
+
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'sse'")
+
+    k = max(1, min(100, request.k))
+    per_keyword = max(1, request.per_keyword)
+
+    def encode(message: dict) -> str:
+        line = json.dumps(message, ensure_ascii=False, default=str)
+        return f"data: {line}\n\n" if format == "sse" else line + "\n"
+
+    # 스트림을 시작하기 전에 분석 풀이 가득 찼으면 503
+    if analyzer_executor is not None and _analyzer_slots.locked():
+        raise HTTPException(status_code=503, detail="Analyzer is busy, try again later")
+
+    async def generate():
+        # 시드 하나씩 run_analyzer 로 진행해서 다른 엔드포인트와 같은 제한된 풀을 사용
+        top = TopKRecommendations(k)
+        seeds = analyzer.iter_realtime_recommendations(keywords, request.channel_topic or "", per_keyword)
+        try:
+            while True:
+                item = await run_analyzer(next, seeds, None)
+                if item is None:
+                    break
+
+                seed, recs = item
+                for rec in recs:
+                    top.push(rec)
+                yield encode({"type": "seed", "seed": seed, "recommendations": recs})
+
+            recommendations = top.results()
+            saved.extend(recommendations)
+
+            yield encode({
+                "type": "summary",
+                "base_keywords": keywords,
+                "recommendations": recommendations,
+                "count": len(recommendations),
+                "timestamp": datetime.now().isoformat()
+            })
+        except HTTPException as e:
+            yield encode({"type": "error", "detail": e.detail})
+        except Exception as e:
+            yield encode({"type": "error", "detail": f"Recommendations failed: {str(e)}"})
+
+    # 스트림이 끝난 뒤 최종 상위 추천을 Notion 큐에 적재
+    saved = []
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        generate(),
+        media_type=media_type,
+        background=BackgroundTask(notion_queue.enqueue_recommendations, keywords[0], saved)
+        if notion_queue.is_configured('recommendation') else None
+    )
+
 @app.post("/api/competitor-analysis")
 async def analyze_competitors(request: CompetitorRequest):
     """
     경쟁사 키워드 분석
     """
     try:
-        result = analyzer.analyze_competitor_keywords(
+        result = await run_analyzer(
+            analyzer.analyze_competitor_keywords,
             request.competitor_keywords,
             request.your_keywords
         )
@@ -218,6 +409,8 @@ async def analyze_competitors(request: CompetitorRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -232,7 +425,7 @@ async def analyze_intent(request: KeywordAnalysisRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        result = analyzer.analyze_search_intent(keyword)
+        result = await run_analyzer(analyzer.analyze_search_intent, keyword)
 
         return {
             "success": True,
@@ -241,6 +434,8 @@ async def analyze_intent(request: KeywordAnalysisRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -258,7 +453,7 @@ async def analyze_trends(request: TrendRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        result = analyzer.get_trend_analysis(keyword, days)
+        result = await run_analyzer(analyzer.get_trend_analysis, keyword, days)
 
         return {
             "success": True,
@@ -268,6 +463,8 @@ async def analyze_trends(request: TrendRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -282,7 +479,10 @@ async def detect_seasonality(request: KeywordAnalysisRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        result = analyzer.detect_seasonality(keyword, days=365)
+        result = await response_cache.get_or_compute(
+            response_cache.make_key("seasonality", keyword, days=365),
+            lambda: run_analyzer(analyzer.detect_seasonality, keyword, days=365)
+        )
 
         return {
             "success": True,
@@ -291,6 +491,8 @@ async def detect_seasonality(request: KeywordAnalysisRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -306,7 +508,10 @@ async def predict_performance(request: PredictionRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        result = analyzer.predict_keyword_performance(keyword, months)
+        result = await response_cache.get_or_compute(
+            response_cache.make_key("prediction", keyword, months=months),
+            lambda: run_analyzer(analyzer.predict_keyword_performance, keyword, months)
+        )
 
         return {
             "success": True,
@@ -316,6 +521,8 @@ async def predict_performance(request: PredictionRequest):
             "timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -332,11 +539,11 @@ async def export_analysis(request: KeywordAnalysisRequest):
         if not keyword:
             raise HTTPException(status_code=400, detail="Keyword cannot be empty")
 
-        analysis = analyzer.analyze_multi_portal(keyword)
+        analysis = await run_analyzer(analyzer.analyze_multi_portal, keyword)
 
         # 파일로 내보내기
         filename = f"analysis_{keyword}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        exporter.export_to_json(analysis, filename)
+        await run_analyzer(exporter.export_to_json, analysis, filename)
 
         return {
             "success": True,
@@ -345,37 +552,44 @@ async def export_analysis(request: KeywordAnalysisRequest):
             "message": f"Analysis exported to {filename}"
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
-# ==================== Notion 동기화 헬퍼 ====================
+# ==================== Notion 조회 (로컬 미러) ====================
 
-def save_to_notion_background(keyword: str, analysis_result: dict):
-    """Notion DB에 분석 결과 저장"""
-    try:
-        analysis_data = {
-            'google_volume': analysis_result['portals'].get('Google', {}).get('estimated_search_volume', 0),
-            'naver_volume': analysis_result['portals'].get('Naver', {}).get('estimated_search_volume', 0),
-            'daum_volume': analysis_result['portals'].get('Daum', {}).get('estimated_search_volume', 0),
-            'youtube_volume': analysis_result['portals'].get('YouTube', {}).get('estimated_search_volume', 0),
-            'difficulty_score': analysis_result['portals'].get('Google', {}).get('keyword_difficulty_score', 0),
-            'google_cpc': analysis_result['portals'].get('Google', {}).get('cpc', 0),
-            'opportunity_score': analysis_result['portals'].get('Google', {}).get('opportunity_score', 0),
-            'google_trend': analysis_result['portals'].get('Google', {}).get('trend', 'stable'),
-            'search_intent': analysis_result['portals'].get('Google', {}).get('search_intent', {}).get('primary_intent', 'informational'),
-            'status': 'active'
-        }
+@app.get("/api/notion/keywords")
+async def list_notion_keywords(limit: int = 50):
+    """
+    Notion 에 저장된 활성 키워드 목록 (로컬 미러에서 조회)
+    """
+    keywords = await asyncio.to_thread(notion_mirror.get_all_keywords, max(1, min(500, limit)))
 
-        notion_db.sync_keyword_analysis(keyword, analysis_data)
-    except Exception as e:
-        print(f"Error saving to Notion: {str(e)}")
+    return {
+        "success": True,
+        "keywords": keywords,
+        "count": len(keywords),
+        "timestamp": datetime.now().isoformat()
+    }
 
-def save_recommendation_to_notion(base_keyword: str, recommendation: dict):
-    """Notion DB에 추천 키워드 저장"""
-    try:
-        notion_db.add_recommendation(base_keyword, recommendation)
-    except Exception as e:
-        print(f"Error saving recommendation to Notion: {str(e)}")
+# ==================== Notion 동기화 헬퍼 ====================
+
+def notion_analysis_data(analysis_result: dict) -> dict:
+    """다중 포털 분석 결과를 Notion 키워드 분석 속성 값으로 변환"""
+    portals = analysis_result['portals']
+    return {
+        'google_volume': portals.get('Google', {}).get('estimated_search_volume', 0),
+        'naver_volume': portals.get('Naver', {}).get('estimated_search_volume', 0),
+        'daum_volume': portals.get('Daum', {}).get('estimated_search_volume', 0),
+        'youtube_volume': portals.get('YouTube', {}).get('estimated_search_volume', 0),
+        'difficulty_score': portals.get('Google', {}).get('keyword_difficulty_score', 0),
+        'google_cpc': portals.get('Google', {}).get('cpc', 0),
+        'opportunity_score': portals.get('Google', {}).get('opportunity_score', 0),
+        'google_trend': portals.get('Google', {}).get('trend', 'stable'),
+        'search_intent': portals.get('Google', {}).get('search_intent', {}).get('primary_intent', 'informational'),
+        'status': 'active'
+    }
 
 # ==================== Root ====================
 
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Channel Resolver Benchmark
+저장해 둔 채널 페이지 (HTML) 로 채널 ID 추출 속도를 측정합니다.
+(기존 BeautifulSoup 전체 파싱 vs 스트리밍 og:url 스캐너)
+
+코퍼스 만들기 (예):
+curl -sL -H 'Accept-Language: en' https://www.youtube.com/@Seul_Ku > corpus/seul_ku.html
+
+사용법:
+python benchmark_channel_resolver.py --corpus corpus/
+python benchmark_channel_resolver.py --synthetic 50
+"""
+
+import argparse
+import codecs
+import glob
+import os
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from channel_resolver import OgUrlScanner, channel_id_from_url
+
+CHUNK_SIZE = 16384
+
+
+def legacy_channel_id(html: bytes):
+    """기존 get_channel_id (BeautifulSoup html.parser) - 비교 기준"""
+    soup = BeautifulSoup(html.decode('utf-8', errors='replace'), 'html.parser')
+    for tag in soup.find_all('meta', {'property': 'og:url'}):
+        content = tag.get('content', '')
+        if 'channel/' in content:
+            return content.split('channel/')[-1]
+    return None
+
+
+def streaming_channel_id(html: bytes):
+    """ChannelResolver.fetch_og_url 과 같은 방식 - (채널 ID, 읽은 바이트)"""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    scanner = OgUrlScanner()
+    read = 0
+    for offset in range(0, len(html), CHUNK_SIZE):
+        chunk = html[offset:offset + CHUNK_SIZE]
+        read += len(chunk)
+        scanner.feed(decoder.decode(chunk))
+        if scanner.done:
+            break
+    return channel_id_from_url(scanner.og_url), read
+
+
+def make_page(rng: random.Random) -> bytes:
+    """YouTube 채널 페이지와 비슷한 구조의 합성 페이지 (큰 인라인 스크립트 + 긴 본문)"""
+    channel_id = 'UC' + ''.join(rng.choice('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-')
+                                for _ in range(22))
+    script = 'var ytcfg = {' + ','.join(f'"k{i}": "{"x" * rng.randint(20, 200)}"' for i in range(400)) + '};'
+    body = ''.join(
+        f'<div class="item"><a href="/watch?v={i}">video {i}</a><span>{"y" * rng.randint(50, 500)}</span></div>'
+        for i in range(2000)
+    )
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f'<script nonce="abc">{script}</script>'
+        '<meta name="theme-color" content="rgba(255, 255, 255, 0.98)">'
+        '<meta property="og:title" content="Channel">'
+        f'<meta property="og:url" content="https://www.youtube.com/channel/{channel_id}">'
+        f'<link rel="canonical" href="https://www.youtube.com/channel/{channel_id}">'
+        f'<script>{script}</script></head><body>{body}</body></html>'
+    ).encode('utf-8')
+
+
+def time_it(func, pages, repeat: int) -> float:
+    """repeat 회 중 가장 빠른 전체 실행 시간 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the channel-id resolver')
+    parser.add_argument('--corpus', help='Directory of saved channel pages (*.html)')
+    parser.add_argument('--synthetic', type=int, default=20,
+                        help='Synthetic pages when no corpus is given (default: 20)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case, best is reported (default: 3)')
+
+    args = parser.parse_args()
+
+    if args.corpus:
+        paths = sorted(glob.glob(os.path.join(args.corpus, '*.html')))
+        pages = [open(path, 'rb').read() for path in paths]
+        source = f"corpus {args.corpus}"
+    else:
+        rng = random.Random(42)
+        pages = [make_page(rng) for _ in range(args.synthetic)]
+        source = "synthetic"
+
+    if not pages:
+        print("❌ No pages found")
+        return
+
+    total_bytes = sum(len(page) for page in pages)
+    print(f"\n{'='*60}")
+    print(f"  📊 {len(pages)} pages ({source}), {total_bytes / len(pages) / 1024:.0f} KB/page")
+    print(f"{'='*60}")
+
+    mismatches = 0
+    streamed_bytes = 0
+    for page in pages:
+        channel_id, read = streaming_channel_id(page)
+        streamed_bytes += read
+        if channel_id != legacy_channel_id(page):
+            mismatches += 1
+
+    legacy_ms = time_it(legacy_channel_id, pages, args.repeat)
+    streaming_ms = time_it(streaming_channel_id, pages, args.repeat)
+
+    print(f"{'BeautifulSoup (full)':<24} {legacy_ms:9.1f} ms  {legacy_ms / len(pages):7.2f} ms/page  "
+          f"{total_bytes / len(pages) / 1024:7.0f} KB read/page")
+    print(f"{'streaming og:url':<24} {streaming_ms:9.1f} ms  {streaming_ms / len(pages):7.2f} ms/page  "
+          f"{streamed_bytes / len(pages) / 1024:7.0f} KB read/page  (x{legacy_ms / streaming_ms:.1f})")
+    print(f"\nResults differing from BeautifulSoup: {mismatches}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Keyword History DB Benchmark
+keyword_history.db 조회 성능을 인덱스 적용 전/후로 측정합니다.
+
+사용법:
+python benchmark_keyword_db.py --rows 1000000 10000000
+"""
+
+import os
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+from datetime import datetime, timedelta, timezone
+from keyword_analyzer import KeywordDatabase
+
+PORTALS = ['Google', 'Naver', 'Daum']
+TRENDS = ['rising', 'stable', 'declining']
+
+
+def populate(conn: sqlite3.Connection, rows: int, keywords: int, chunk: int = 100000):
+    """365일에 걸친 합성 분석 히스토리 생성"""
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+
+    inserted = 0
+    while inserted < rows:
+        size = min(chunk, rows - inserted)
+        batch = [
+            (f"keyword {rng.randrange(keywords)}",
+             rng.choice(PORTALS),
+             rng.randrange(100, 20000),
+             rng.choice(TRENDS),
+             'Medium',
+             (now - timedelta(seconds=rng.randrange(365 * 86400))).strftime('%Y-%m-%d %H:%M:%S'))
+            for _ in range(size)
+        ]
+        with conn:
+            conn.executemany(KeywordDatabase.INSERT_ANALYSIS, batch)
+        inserted += size
+
+
+def time_query(conn: sqlite3.Connection, query: str, params_list: list) -> dict:
+    """쿼리 지연 시간 측정 (ms)"""
+    timings = []
+    for params in params_list:
+        start = time.perf_counter()
+        conn.execute(query, params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        'p50_ms': timings[len(timings) // 2],
+        'max_ms': timings[-1]
+    }
+
+
+def explain(conn: sqlite3.Connection, query: str, params: tuple) -> str:
+    rows = conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()
+    return ' / '.join(row[-1] for row in rows)
+
+
+def run(rows: int, keywords: int, samples: int, workdir: str) -> dict:
+    """rows 행 DB에서 스키마 v1(인덱스 없음) 과 최신 스키마 비교"""
+    db_path = os.path.join(workdir, f'bench_{rows}.db')
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    KeywordDatabase._migrate(conn, target_version=1)
+
+    print(f"\n📦 Populating {rows:,} rows ({keywords:,} distinct keywords)...")
+    start = time.perf_counter()
+    populate(conn, rows, keywords)
+    print(f"   done in {time.perf_counter() - start:.1f}s")
+
+    rng = random.Random(7)
+    history_params = [(f"keyword {rng.randrange(keywords)}", 30) for _ in range(samples)]
+    top_params = [(10,)] * max(1, samples // 10)
+
+    result = {'rows': rows}
+
+    for label in ('before', 'after'):
+        if label == 'after':
+            start = time.perf_counter()
+            KeywordDatabase._migrate(conn)
+            result['migration_s'] = time.perf_counter() - start
+
+        # 마이그레이션 전에는 롤업 테이블이 없으므로 원본 전체 집계 쿼리 사용
+        top_query = (KeywordDatabase.TOP_KEYWORDS_SCAN_QUERY if label == 'before'
+                     else KeywordDatabase.TOP_KEYWORDS_QUERY)
+
+        result[label] = {
+            'history': time_query(conn, KeywordDatabase.HISTORY_QUERY, history_params),
+            'top_keywords': time_query(conn, top_query, top_params),
+            'history_plan': explain(conn, KeywordDatabase.HISTORY_QUERY, history_params[0]),
+            'top_keywords_plan': explain(conn, top_query, top_params[0])
+        }
+
+    conn.close()
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    return result
+
+
+def print_result(result: dict):
+    print(f"\n{'='*60}")
+    print(f"  📊 {result['rows']:,} rows")
+    print(f"{'='*60}")
+    print(f"Migration to v{KeywordDatabase.SCHEMA_VERSION}: {result['migration_s']:.1f}s\n")
+
+    for query in ('history', 'top_keywords'):
+        before = result['before'][query]
+        after = result['after'][query]
+        speedup = before['p50_ms'] / after['p50_ms'] if after['p50_ms'] else float('inf')
+        print(f"{query}:")
+        print(f"   before p50 {before['p50_ms']:9.2f} ms  max {before['max_ms']:9.2f} ms")
+        print(f"   after  p50 {after['p50_ms']:9.2f} ms  max {after['max_ms']:9.2f} ms  (x{speedup:.1f})")
+        print(f"   plan before: {result['before'][query + '_plan']}")
+        print(f"   plan after:  {result['after'][query + '_plan']}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keyword history DB benchmark')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000000, 10000000],
+                        help='Row counts to benchmark (default: 1M 10M)')
+    parser.add_argument('--keywords', type=int, default=50000,
+                        help='Distinct keyword count (default: 50000)')
+    parser.add_argument('--samples', type=int, default=200,
+                        help='History queries per measurement (default: 200)')
+    parser.add_argument('--workdir', default=tempfile.gettempdir(),
+                        help='Directory for temporary DB files')
+
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print_result(run(rows, args.keywords, args.samples, args.workdir))
+
+
+if __name__ == "__main__":
+    main()
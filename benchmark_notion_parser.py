@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Notion Property Parser Benchmark
+합성 Notion 페이지로 속성 파서 처리 속도를 측정합니다.
+(기존 if/elif 파서 vs 디스패치 테이블, 속성 선택, DataFrame 일괄 변환)
+
+사용법:
+python benchmark_notion_parser.py --pages 10000
+"""
+
+import time
+import random
+import argparse
+from notion_db import NotionDB, pages_to_dataframe
+
+STATUSES = ['active', 'paused', 'archived']
+TRENDS = ['rising', 'stable', 'declining']
+TAGS = ['shorts', 'tutorial', 'review', 'vlog', 'music', 'gaming']
+
+# 속성 선택 모드에서 파싱할 속성
+PROJECTION = ['Keyword', 'Google Volume', 'Status']
+
+
+def _text(content: str) -> list:
+    return [{"type": "text", "text": {"content": content}, "plain_text": content}]
+
+
+def make_pages(count: int) -> list:
+    """키워드 분석 DB 형태의 합성 페이지 (자주 쓰는 속성 타입 혼합)"""
+    rng = random.Random(42)
+    pages = []
+
+    for i in range(count):
+        edited = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00.000Z"
+        pages.append({
+            "object": "page",
+            "id": f"page-{i}",
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "last_edited_time": edited,
+            "properties": {
+                "Keyword": {"type": "title", "title": _text(f"keyword {i}")},
+                "Google Volume": {"type": "number", "number": rng.randrange(100, 20000)},
+                "Naver Volume": {"type": "number", "number": rng.randrange(100, 20000)},
+                "Difficulty Score": {"type": "number", "number": rng.randrange(0, 100)},
+                "Google CPC": {"type": "number", "number": round(rng.uniform(0.1, 5), 2)},
+                "Status": {"type": "select", "select": {"name": rng.choice(STATUSES)}},
+                "Google Trend": {"type": "select", "select": {"name": rng.choice(TRENDS)}},
+                "Related Keywords": {"type": "multi_select",
+                                     "multi_select": [{"name": tag} for tag in rng.sample(TAGS, 3)]},
+                "Last Updated": {"type": "date", "date": {"start": edited[:10]}},
+                "Tracked": {"type": "checkbox", "checkbox": rng.random() < 0.5},
+                "Notes": {"type": "rich_text", "rich_text": _text(f"note {i}")},
+                "Source": {"type": "url", "url": f"https://example.com/{i}"},
+                "Trend Data": {"type": "relation", "relation": [{"id": f"trend-{i}"}]},
+                "Score": {"type": "formula", "formula": {"type": "number", "number": rng.random()}},
+            }
+        })
+
+    return pages
+
+
+def legacy_parse_page(page: dict) -> dict:
+    """기존 _parse_page / _parse_property (if/elif 체인) - 비교 기준"""
+    def parse_property(prop: dict):
+        prop_type = prop["type"]
+
+        if prop_type == "title":
+            return prop["title"][0]["text"]["content"] if prop["title"] else ""
+        elif prop_type == "text":
+            return prop["text"][0]["text"]["content"] if prop["text"] else ""
+        elif prop_type == "number":
+            return prop["number"]
+        elif prop_type == "select":
+            return prop["select"]["name"] if prop["select"] else None
+        elif prop_type == "multi_select":
+            return [item["name"] for item in prop["multi_select"]]
+        elif prop_type == "date":
+            return prop["date"]["start"] if prop["date"] else None
+        elif prop_type == "checkbox":
+            return prop["checkbox"]
+        elif prop_type == "relation":
+            return [item["id"] for item in prop["relation"]]
+        elif prop_type == "formula":
+            return prop["formula"]["string"] if prop["formula"]["type"] == "string" else prop["formula"]["number"]
+        else:
+            return None
+
+    parsed = {
+        "page_id": page["id"],
+        "created_time": page["created_time"],
+        "last_edited_time": page["last_edited_time"],
+        "properties": {}
+    }
+    for prop_name, prop_value in page["properties"].items():
+        parsed["properties"][prop_name] = parse_property(prop_value)
+    return parsed
+
+
+def time_it(func, repeat: int) -> float:
+    """repeat 회 중 가장 빠른 실행 시간 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Notion property parser')
+    parser.add_argument('--pages', type=int, default=10000, help='Synthetic pages (default: 10000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per case, best is reported (default: 5)')
+
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages)
+    notion = NotionDB('benchmark-token')
+
+    cases = [
+        ('legacy if/elif', lambda: [legacy_parse_page(page) for page in pages]),
+        ('dispatch table', lambda: [notion._parse_page(page) for page in pages]),
+        (f'projection ({len(PROJECTION)} props)',
+         lambda: [notion._parse_page(page, PROJECTION) for page in pages]),
+        ('DataFrame (all)', lambda: pages_to_dataframe(pages)),
+        (f'DataFrame ({len(PROJECTION)} props)', lambda: pages_to_dataframe(pages, PROJECTION)),
+    ]
+
+    print(f"\n{'='*60}")
+    print(f"  📊 {args.pages:,} pages x {len(pages[0]['properties'])} properties")
+    print(f"{'='*60}")
+
+    baseline = None
+    for label, func in cases:
+        elapsed = time_it(func, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{label:<24} {elapsed:9.1f} ms  {elapsed * 1000 / args.pages:7.2f} us/page  "
+              f"(x{baseline / elapsed:.2f})")
+
+    df = pages_to_dataframe(pages)
+    print(f"\nDataFrame dtypes:\n{df.dtypes.to_string()}\n")
+
+    # 속성 선택 결과도 전체 변환과 같은 dtype 이어야 함
+    projected = pages_to_dataframe(pages, PROJECTION).dtypes
+    mismatched = [name for name in PROJECTION if projected[name] != df.dtypes[name]]
+    if mismatched:
+        print(f"❌ Projected dtypes differ: {', '.join(mismatched)}")
+
+
+if __name__ == "__main__":
+    main()
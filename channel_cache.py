@@ -0,0 +1,220 @@
+"""
+Channel Cache Module
+YouTube 채널 메타데이터 (비디오 목록) 를 SQLite 에 캐시합니다.
+
+- ttl (초) 안에서는 네트워크 요청 없이 캐시된 목록 반환
+- ttl 이 지나면 최신 업로드부터 조금씩 받아 캐시에 있는 비디오가 나오면 중단 (증분 갱신)
+- 삭제/비공개된 비디오는 증분 갱신으로 알 수 없으므로 refresh(full=True) 로 정리
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import yt_dlp
+
+# 증분 갱신 시 차례로 늘려가며 받을 최신 비디오 수 (None: 전체)
+INCREMENTAL_WINDOWS = (30, 200, None)
+
+
+class ChannelCache:
+    """
+    채널 메타데이터 캐시
+
+    사용 예:
+        cache = ChannelCache('channel_cache.db', ttl=3600, resolver=resolve_channel_url)
+        info = cache.get('https://www.youtube.com/@Seul_Ku')   # {'uploader', ..., 'entries': [...]}
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS channel_cache (
+            channel_url TEXT PRIMARY KEY,
+            resolved_url TEXT NOT NULL,
+            info TEXT NOT NULL,
+            entries TEXT NOT NULL,
+            fetched_at REAL NOT NULL
+        );
+    '''
+
+    def __init__(self, path: str = 'channel_cache.db', ttl: float = 3600.0,
+                 resolver: Optional[Callable[[str], str]] = None,
+                 extract: Optional[Callable[[str, Optional[int]], Optional[Dict]]] = None):
+        """
+        Args:
+            path: 캐시 SQLite 파일 경로
+            ttl: 캐시 유효 시간 (초)
+            resolver: 입력 URL 을 비디오 목록 URL 로 바꾸는 함수
+                (캐시 미스일 때만 호출, 실패 시 None - 입력 URL 로 받고 다음 갱신 때 다시 해석)
+            extract: (URL, 최대 개수) 로 flat 목록을 받는 함수 (기본: yt-dlp)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.resolver = resolver or (lambda url: url)
+        self.extract = extract or self._extract_flat
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+
+        self.counters = {'hits': 0, 'incremental': 0, 'full': 0, 'new_entries': 0}
+
+    # ==================== 조회 ====================
+
+    def get(self, channel_url: str, force_refresh: bool = False) -> Optional[Dict]:
+        """
+        채널 정보 + 비디오 목록 (최신순)
+
+        Args:
+            channel_url: 사용자가 입력한 채널 URL
+            force_refresh: True 면 ttl 과 관계없이 증분 갱신
+        """
+        cached = self._load(channel_url)
+        if cached and not force_refresh and time.time() - cached['fetched_at'] < self.ttl:
+            self.counters['hits'] += 1
+            return cached['info']
+
+        return self.refresh(channel_url, cached=cached)
+
+    def refresh(self, channel_url: str, full: bool = False, cached: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        채널 목록 갱신 (캐시가 있으면 새 업로드만 받아 앞에 붙임)
+
+        Args:
+            channel_url: 사용자가 입력한 채널 URL
+            full: True 면 전체 목록을 다시 받아 교체
+        """
+        if cached is None and not full:
+            cached = self._load(channel_url)
+        if full:
+            cached = None
+
+        if cached and cached['resolved_url']:
+            resolved_url = cached['resolved_url']
+        else:
+            # 캐시 미스이거나 이전에 해석하지 못한 URL 이면 (다시) 해석
+            resolved_url = self.resolver(channel_url)
+        fetch_url = resolved_url or channel_url
+
+        if cached and cached['info']['entries']:
+            info = self._fetch_new(fetch_url, cached['info'])
+            self.counters['incremental'] += 1
+        else:
+            info, fetch_url = self._fetch_all(fetch_url)
+            self.counters['full'] += 1
+
+        if info is None:
+            # 갱신에 실패하면 이전 캐시라도 반환
+            return cached['info'] if cached else None
+
+        # 실제로 목록을 받은 URL 을 저장 (해석에 실패했으면 빈 값 - 다음 갱신 때 다시 해석)
+        self._store(channel_url, fetch_url if resolved_url else '', info)
+        return info
+
+    def _fetch_all(self, url: str) -> Tuple[Optional[Dict], str]:
+        """전체 목록과 실제로 받은 URL (비디오 탭 URL 에 비디오가 없으면 채널 URL 로 시도)"""
+        info = self.extract(url, None)
+        if not (info and info.get('entries')) and '/videos' in url:
+            fallback_url = url.replace('/videos', '')
+            fallback = self.extract(fallback_url, None)
+            if fallback and (fallback.get('entries') or not info):
+                info, url = fallback, fallback_url
+        if not info:
+            return None, url
+
+        info['entries'] = [entry for entry in info.get('entries') or [] if entry]
+        self.counters['new_entries'] += len(info['entries'])
+        return info, url
+
+    def _fetch_new(self, resolved_url: str, cached_info: Dict) -> Optional[Dict]:
+        """최신순으로 범위를 늘려가며 받아 캐시에 있는 비디오가 나오면 중단"""
+        known = {entry['id'] for entry in cached_info['entries']}
+
+        for window in INCREMENTAL_WINDOWS:
+            info = self.extract(resolved_url, window)
+            if not info or 'entries' not in info:
+                return None
+
+            raw = list(info['entries'] or [])
+            new_entries = []
+            overlap = False
+            for entry in raw:
+                if not entry:
+                    continue
+                if entry['id'] in known:
+                    overlap = True
+                    break
+                new_entries.append(entry)
+
+            if overlap:
+                info['entries'] = new_entries + cached_info['entries']
+                break
+            if window is None or len(raw) < window:
+                # 전체를 받았는데 겹치는 비디오가 없음 - 받은 목록으로 교체
+                info['entries'] = new_entries
+                break
+
+        self.counters['new_entries'] += len(new_entries)
+        return info
+
+    @staticmethod
+    def _extract_flat(url: str, limit: Optional[int]) -> Optional[Dict]:
+        ydl_opts = {
+            'quiet': True,
+            'extract_flat': True,
+            'force_generic_extractor': True,
+            'no_warnings': True,
+            'ignoreerrors': True
+        }
+        if limit:
+            ydl_opts['playlistend'] = limit
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
+    # ==================== 저장 ====================
+
+    def _load(self, channel_url: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT resolved_url, info, entries, fetched_at FROM channel_cache WHERE channel_url = ?',
+                (channel_url,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        info = json.loads(row[1])
+        info['entries'] = json.loads(row[2])
+        return {'resolved_url': row[0], 'info': info, 'fetched_at': row[3]}
+
+    def _store(self, channel_url: str, resolved_url: str, info: Dict):
+        meta = {key: value for key, value in info.items() if key != 'entries'}
+        with self._lock, self._conn:
+            self._conn.execute(
+                '''INSERT OR REPLACE INTO channel_cache
+                   (channel_url, resolved_url, info, entries, fetched_at)
+                   VALUES (?, ?, ?, ?, ?)''',
+                (channel_url, resolved_url,
+                 json.dumps(meta, ensure_ascii=False, default=str),
+                 json.dumps(info['entries'], ensure_ascii=False, default=str),
+                 time.time())
+            )
+
+    def invalidate(self, channel_url: Optional[str] = None):
+        """특정 채널 또는 전체 캐시 삭제"""
+        with self._lock, self._conn:
+            if channel_url is None:
+                self._conn.execute('DELETE FROM channel_cache')
+            else:
+                self._conn.execute('DELETE FROM channel_cache WHERE channel_url = ?', (channel_url,))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            channels = self._conn.execute('SELECT COUNT(*) FROM channel_cache').fetchone()[0]
+        return {'path': self.path, 'ttl': self.ttl, 'channels': channels, **self.counters}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,209 @@
+"""
+Channel Resolver Module
+YouTube 채널 URL (@handle, /c/이름 등) 을 채널 ID 로 변환합니다.
+
+- 응답을 스트리밍으로 읽으며 og:url 메타 태그가 나오면 바로 연결을 끊음 (전체 HTML 파싱 없음)
+- </head> 까지 og:url 이 없으면 중단
+- URL → 채널 ID 결과를 SQLite 에 저장해 재사용
+"""
+
+import codecs
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from http_pool import PooledHTTPClient
+
+_META_TAG = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+_OG_URL_PROPERTY = re.compile(r'''property\s*=\s*["']og:url["']''', re.IGNORECASE)
+_CONTENT = re.compile(r'''content\s*=\s*["']([^"']*)["']''', re.IGNORECASE)
+_HEAD_END = re.compile(r'</head\s*>', re.IGNORECASE)
+
+
+class OgUrlScanner:
+    """
+    HTML 조각을 차례로 받아 og:url 메타 태그를 찾는 스캐너
+
+    사용 예:
+        scanner = OgUrlScanner()
+        for text in chunks:
+            if scanner.feed(text) is not None or scanner.done:
+                break
+        scanner.og_url
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self.og_url: Optional[str] = None
+        self.done = False
+
+    def feed(self, text: str) -> Optional[str]:
+        """조각 추가 - og:url 을 찾으면 반환 (</head> 를 지나면 done)"""
+        if self.done:
+            return self.og_url
+
+        buffer = self._buffer + text
+        head_end = _HEAD_END.search(buffer)
+        end = head_end.start() if head_end else len(buffer)
+        scanned = 0
+        for match in _META_TAG.finditer(buffer, 0, end):
+            tag = match.group(0)
+            scanned = match.end()
+            if _OG_URL_PROPERTY.search(tag):
+                content = _CONTENT.search(tag)
+                if content:
+                    self.og_url = content.group(1)
+                    self.done = True
+                    return self.og_url
+
+        if head_end:
+            self.done = True
+            return None
+
+        # 닫히지 않은 태그 (다음 조각에서 이어짐) 만 남김
+        tail = buffer.rfind('<', scanned)
+        self._buffer = buffer[tail:] if tail != -1 and '>' not in buffer[tail:] else ''
+        return None
+
+
+def scan_og_url(chunks: Iterable[str]) -> Optional[str]:
+    """텍스트 조각들에서 og:url 찾기"""
+    scanner = OgUrlScanner()
+    for text in chunks:
+        scanner.feed(text)
+        if scanner.done:
+            break
+    return scanner.og_url
+
+
+def channel_id_from_url(url: Optional[str]) -> Optional[str]:
+    """.../channel/<ID> 형태의 URL 에서 채널 ID 추출"""
+    if not url or 'channel/' not in url:
+        return None
+    return url.split('channel/')[-1].split('/')[0].split('?')[0] or None
+
+
+class ChannelResolver:
+    """
+    채널 URL → 채널 ID 변환기
+
+    사용 예:
+        resolver = ChannelResolver('channel_ids.db')
+        resolver.resolve('https://www.youtube.com/@Seul_Ku')   # 'UC...'
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS channel_ids (
+            url_key TEXT PRIMARY KEY,
+            channel_id TEXT NOT NULL,
+            resolved_at REAL NOT NULL
+        );
+    '''
+
+    def __init__(self, path: str = 'channel_ids.db', http: Optional[PooledHTTPClient] = None,
+                 timeout: float = 10.0, chunk_size: int = 16384, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Args:
+            path: 변환 결과를 저장할 SQLite 파일 경로
+            http: 공유할 HTTP 클라이언트 (기본: 새 PooledHTTPClient)
+            timeout: 요청 타임아웃 (초)
+            chunk_size: 스트리밍으로 한 번에 읽을 바이트 수
+            max_bytes: 이만큼 읽어도 못 찾으면 중단
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.http = http or PooledHTTPClient(
+            headers={'User-Agent': 'Mozilla/5.0', 'Accept-Language': 'en-US,en;q=0.9'},
+            timeout=timeout
+        )
+
+        self._memo: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+
+        self.counters = {'hits': 0, 'fetches': 0, 'not_found': 0, 'bytes_read': 0}
+
+    @staticmethod
+    def url_key(url: str) -> str:
+        """같은 채널을 가리키는 URL 을 하나의 키로 (핸들/이름은 대소문자 구분 없음)"""
+        parsed = urlparse(url.strip())
+        path = parsed.path.rstrip('/')
+        for suffix in ('/videos', '/featured', '/streams', '/shorts'):
+            if path.endswith(suffix):
+                path = path[:-len(suffix)]
+        host = parsed.netloc.lower().replace('m.youtube.com', 'www.youtube.com')
+        return f"{host}{path}".lower()
+
+    def resolve(self, url: str) -> Optional[str]:
+        """채널 ID 반환 (못 찾으면 None, 결과는 저장해서 재사용)"""
+        channel_id = channel_id_from_url(url)
+        if channel_id:
+            return channel_id
+
+        key = self.url_key(url)
+        channel_id = self._lookup(key)
+        if channel_id:
+            self.counters['hits'] += 1
+            return channel_id
+
+        channel_id = channel_id_from_url(self.fetch_og_url(url))
+        if channel_id is None:
+            self.counters['not_found'] += 1
+            return None
+
+        with self._lock, self._conn:
+            self._memo[key] = channel_id
+            self._conn.execute(
+                'INSERT OR REPLACE INTO channel_ids (url_key, channel_id, resolved_at) VALUES (?, ?, ?)',
+                (key, channel_id, time.time())
+            )
+        return channel_id
+
+    def fetch_og_url(self, url: str) -> Optional[str]:
+        """페이지를 스트리밍으로 읽어 og:url 을 찾으면 연결을 끊고 반환"""
+        self.counters['fetches'] += 1
+        response = self.http.get(url, stream=True)
+        try:
+            if response.status_code != 200:
+                return None
+
+            decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+            scanner = OgUrlScanner()
+            read = 0
+            for chunk in response.iter_content(self.chunk_size):
+                read += len(chunk)
+                scanner.feed(decoder.decode(chunk))
+                if scanner.done or read >= self.max_bytes:
+                    break
+
+            self.counters['bytes_read'] += read
+            return scanner.og_url
+        finally:
+            # 남은 본문은 받지 않음 (커넥션은 풀로 돌아가지 않고 닫힘)
+            response.close()
+
+    def _lookup(self, key: str) -> Optional[str]:
+        with self._lock:
+            channel_id = self._memo.get(key)
+            if channel_id is None:
+                row = self._conn.execute(
+                    'SELECT channel_id FROM channel_ids WHERE url_key = ?', (key,)
+                ).fetchone()
+                if row:
+                    channel_id = self._memo[key] = row[0]
+        return channel_id
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stored = self._conn.execute('SELECT COUNT(*) FROM channel_ids').fetchone()[0]
+        return {'path': self.path, 'stored': stored, **self.counters}
+
+    def close(self):
+        self.http.close()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,153 @@
+"""
+Download Archive Module
+다운로드 폴더별 아카이브 인덱스 (video id 기준) - SQLite 파일을 다운로드 폴더 안에 저장합니다.
+
+- 완료된 비디오 (파일이 남아 있는 경우) 는 건너뜀
+- 중단된 비디오는 같은 파일명 (.part) 으로 이어받음
+- only_new=True 면 완료된 비디오는 파일이 없어도 건너뜀 (새 업로드 + 실패/중단된 비디오만 받음)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+ARCHIVE_FILENAME = '.download_archive.db'
+
+
+class DownloadArchive:
+    """
+    video id 기준 다운로드 아카이브
+
+    사용 예:
+        archive = DownloadArchive('downloads')
+        todo, skipped = archive.plan(videos, only_new=True)
+        scheduler = DownloadScheduler(build_ydl_opts('downloads'), archive=archive)
+        scheduler.start(todo)
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS archive (
+            video_id TEXT PRIMARY KEY,
+            title TEXT,
+            url TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            filepath TEXT,
+            bytes INTEGER DEFAULT 0,
+            attempts INTEGER DEFAULT 0,
+            error TEXT,
+            first_seen_at REAL NOT NULL,
+            completed_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_archive_status ON archive(status);
+    '''
+
+    def __init__(self, download_path: str, filename: str = ARCHIVE_FILENAME):
+        """
+        Args:
+            download_path: 다운로드 폴더 (아카이브 파일도 이 폴더에 저장)
+            filename: 아카이브 SQLite 파일명
+        """
+        os.makedirs(download_path, exist_ok=True)
+        self.download_path = download_path
+        self.path = os.path.join(download_path, filename)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+
+    # ==================== 계획 ====================
+
+    def plan(self, videos: List[Dict], only_new: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """
+        받을 비디오와 건너뛸 비디오로 나누고, 처음 본 비디오는 pending 으로 기록
+
+        Args:
+            videos: {'id', 'url', 'title'} 목록
+            only_new: True 면 완료 기록이 있는 비디오는 파일이 지워졌어도 건너뜀
+                (새 비디오와 실패 / 중단 / 대기 중인 비디오만 받음)
+
+        Returns:
+            (받을 목록, 건너뛴 목록)
+        """
+        with self._lock:
+            known = {
+                video_id: (status, filepath)
+                for video_id, status, filepath in self._conn.execute(
+                    'SELECT video_id, status, filepath FROM archive'
+                )
+            }
+
+        todo, skipped, new_rows = [], [], []
+        now = time.time()
+        for video in videos:
+            video_id = video.get('id')
+            if not video_id:
+                todo.append(video)
+                continue
+
+            record = known.get(video_id)
+            if record is None:
+                new_rows.append((video_id, video.get('title'), video['url'], now))
+                todo.append(video)
+            elif record[0] == 'completed' and (only_new or (record[1] and os.path.exists(record[1]))):
+                skipped.append(video)
+            else:
+                # 실패 / 중단 / 파일이 지워진 완료 항목은 다시 받음
+                todo.append(video)
+
+        if new_rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    '''INSERT OR IGNORE INTO archive (video_id, title, url, first_seen_at)
+                       VALUES (?, ?, ?, ?)''',
+                    new_rows
+                )
+
+        return todo, skipped
+
+    # ==================== 상태 기록 ====================
+
+    def mark_started(self, video_id: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                '''UPDATE archive SET status = 'downloading', attempts = attempts + 1, error = NULL
+                   WHERE video_id = ?''',
+                (video_id,)
+            )
+
+    def mark_completed(self, video_id: str, filepath: Optional[str], size: int = 0):
+        with self._lock, self._conn:
+            self._conn.execute(
+                '''UPDATE archive SET status = 'completed', filepath = ?, bytes = ?, completed_at = ?
+                   WHERE video_id = ?''',
+                (filepath, size, time.time(), video_id)
+            )
+
+    def mark_failed(self, video_id: str, error: str):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE archive SET status = 'failed', error = ? WHERE video_id = ?",
+                (error, video_id)
+            )
+
+    # ==================== 조회 ====================
+
+    def stats(self) -> Dict:
+        """상태별 비디오 수 / 받은 용량"""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                'SELECT status, COUNT(*) FROM archive GROUP BY status'
+            ).fetchall())
+            total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(bytes), 0) FROM archive WHERE status = 'completed'"
+            ).fetchone()[0]
+
+        return {'path': self.path, 'videos': sum(counts.values()), 'bytes': total_bytes, **counts}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
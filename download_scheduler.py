@@ -0,0 +1,327 @@
+"""
+Download Scheduler Module
+yt-dlp 비디오 다운로드를 워커 스레드 풀로 병렬 처리합니다.
+
+- workers 개 스레드가 동시에 다운로드, 호스트별 동시 다운로드는 per_host_limit 개까지
+- 워커 스레드마다 YoutubeDL 인스턴스 하나를 만들어 재사용
+- 전체 진행률 / 처리량 (bytes/s, videos/min) 조회
+- archive (DownloadArchive) 를 넘기면 비디오별 시작/완료/실패를 기록
+- start() 마다 옵션/아카이브/태그를 따로 지정할 수 있어 여러 요청이 한 풀을 공유 가능
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import yt_dlp
+
+
+@dataclass
+class DownloadJob:
+    """비디오 하나의 다운로드 상태"""
+    url: str
+    title: str = 'Unknown'
+    video_id: Optional[str] = None
+    status: str = 'queued'  # queued | downloading | finished | failed | cancelled
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    filepath: Optional[str] = None
+    tag: Optional[str] = None
+    ydl_opts: Optional[Dict] = field(default=None, repr=False)
+    archive: object = field(default=None, repr=False)
+    # 파일별 받은 바이트 (영상/음성 스트림이 따로 받아짐)
+    file_bytes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).hostname or ''
+
+    @property
+    def bytes_done(self) -> int:
+        return sum(self.file_bytes.values())
+
+
+def build_ydl_opts(download_path: str, resolution: str = '1080p', format_option: str = 'mp4') -> Dict:
+    """
+    Video Downloader 탭의 yt-dlp 옵션
+
+    파일명에 video id 를 넣어 제목이 같은 비디오가 서로 덮어쓰지 않고,
+    중단된 다운로드는 같은 파일명의 .part 파일에서 이어받습니다.
+    """
+    height = resolution[:-1]
+    return {
+        'format': f'bestvideo[height<={height}]+bestaudio/best[height<={height}]',
+        'outtmpl': os.path.join(download_path, '%(title)s [%(id)s].%(ext)s'),
+        'merge_output_format': format_option,
+        'continuedl': True,
+        'quiet': True,
+        'noprogress': True,
+    }
+
+
+class DownloadScheduler:
+    """
+    비디오 다운로드 스케줄러
+
+    사용 예:
+        scheduler = DownloadScheduler(build_ydl_opts('downloads'), workers=4, per_host_limit=4)
+        scheduler.start([{'url': ..., 'title': ...}, ...])
+        while not scheduler.done():
+            print(scheduler.progress())
+            time.sleep(0.5)
+    """
+
+    # 워커 스레드 하나가 유지할 최대 YoutubeDL 인스턴스 수 (옵션 조합별 1개)
+    MAX_YDL_PER_WORKER = 4
+
+    def __init__(self, ydl_opts: Dict, workers: int = 4, per_host_limit: int = 4,
+                 ydl_factory: Optional[Callable[[Dict], object]] = None, archive=None,
+                 on_update: Optional[Callable[[DownloadJob], None]] = None):
+        """
+        Args:
+            ydl_opts: yt-dlp 옵션 (progress_hooks 는 스케줄러가 추가)
+            workers: 동시에 다운로드할 최대 비디오 수
+            per_host_limit: 같은 호스트에서 동시에 받을 최대 비디오 수
+            ydl_factory: 옵션을 받아 YoutubeDL 호환 객체를 만드는 함수 (기본: yt_dlp.YoutubeDL)
+            archive: 다운로드 결과를 기록할 DownloadArchive (선택)
+            on_update: 비디오 다운로드 시작/종료 시 워커 스레드에서 호출 (job.status 로 구분)
+        """
+        self.ydl_opts = dict(ydl_opts)
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.ydl_factory = ydl_factory or yt_dlp.YoutubeDL
+        self.archive = archive
+        self.on_update = on_update
+
+        self.jobs: List[DownloadJob] = []
+        self._queue: List[DownloadJob] = []
+        self._active_by_host: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = 0  # _next_job 에서 None 을 받기 전인 워커 수
+        self._local = threading.local()
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    # ==================== 실행 ====================
+
+    def start(self, videos: List[Dict], ydl_opts: Optional[Dict] = None, archive=None,
+              tag: Optional[str] = None):
+        """
+        다운로드 시작 (즉시 반환, 실행 중에 다시 호출하면 같은 풀에 추가)
+
+        Args:
+            videos: {'url', 'title', 'id'(선택)} 목록
+            ydl_opts: 이 비디오들에만 쓸 yt-dlp 옵션 (기본: 스케줄러 옵션)
+            archive: 이 비디오들에만 쓸 DownloadArchive (기본: 스케줄러 아카이브)
+            tag: 작업 구분용 태그 (DownloadJob.tag)
+        """
+        jobs = [
+            DownloadJob(url=video['url'], title=video.get('title', 'Unknown'), video_id=video.get('id'),
+                        tag=tag, ydl_opts=ydl_opts, archive=archive or self.archive)
+            for video in videos
+        ]
+
+        with self._cond:
+            self.jobs.extend(jobs)
+            self._queue.extend(jobs)
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+            self._finished_at = None
+            self._cond.notify_all()
+
+            spawn = min(self.workers - self._running, len(self._queue))
+            self._running += max(0, spawn)
+
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        for _ in range(spawn):
+            thread = threading.Thread(target=self._worker, name=f"download-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def wait(self, poll_interval: float = 0.5,
+             on_progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """모든 다운로드가 끝날 때까지 대기 (poll_interval 마다 on_progress 호출), 최종 progress 반환"""
+        while not self.done():
+            if on_progress:
+                on_progress(self.progress())
+            time.sleep(poll_interval)
+
+        for thread in self._threads:
+            thread.join()
+
+        progress = self.progress()
+        if on_progress:
+            on_progress(progress)
+        return progress
+
+    def cancel(self, match: Optional[Callable[[DownloadJob], bool]] = None) -> List[DownloadJob]:
+        """
+        대기 중인 다운로드 취소 (진행 중인 다운로드는 끝까지 받음)
+
+        Args:
+            match: 취소할 작업 조건 (기본: 전체)
+
+        Returns:
+            취소한 작업 목록
+        """
+        with self._cond:
+            cancelled = [job for job in self._queue if match is None or match(job)]
+            for job in cancelled:
+                job.status = 'cancelled'
+            self._queue = [job for job in self._queue if job.status == 'queued']
+            self._cond.notify_all()
+        return cancelled
+
+    def prune(self, match: Optional[Callable[[DownloadJob], bool]] = None):
+        """끝난 작업을 jobs 목록에서 제거 (오래 실행되는 스케줄러의 메모리 정리)"""
+        with self._cond:
+            self.jobs = [
+                job for job in self.jobs
+                if job.status in ('queued', 'downloading') or (match is not None and not match(job))
+            ]
+
+    def done(self) -> bool:
+        with self._cond:
+            return not self._queue and not any(job.status == 'downloading' for job in self.jobs)
+
+    def _next_job(self) -> Optional[DownloadJob]:
+        """호스트 한도에 여유가 있는 첫 작업 (없으면 대기, 큐가 비면 None)"""
+        with self._cond:
+            while True:
+                if not self._queue:
+                    self._running -= 1
+                    return None
+                for index, job in enumerate(self._queue):
+                    if self._active_by_host.get(job.host, 0) < self.per_host_limit:
+                        del self._queue[index]
+                        self._active_by_host[job.host] = self._active_by_host.get(job.host, 0) + 1
+                        job.status = 'downloading'
+                        job.started_at = time.monotonic()
+                        return job
+                self._cond.wait()
+
+    def _worker(self):
+        # 옵션 조합별 YoutubeDL (대부분 하나)
+        ydls: Dict[str, object] = {}
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    return
+
+                ydl = self._ydl_for(ydls, job.ydl_opts or self.ydl_opts)
+                archive = job.archive
+
+                self._local.job = job
+                try:
+                    if archive and job.video_id:
+                        archive.mark_started(job.video_id)
+                    self._notify(job)
+                    ydl.download([job.url])
+                    job.status = 'finished'
+                    if archive and job.video_id:
+                        archive.mark_completed(job.video_id, job.filepath, self._file_size(job))
+                except Exception as e:
+                    job.status = 'failed'
+                    job.error = str(e)
+                    if archive and job.video_id:
+                        archive.mark_failed(job.video_id, job.error)
+                finally:
+                    self._local.job = None
+                    job.finished_at = time.monotonic()
+                    with self._cond:
+                        self._active_by_host[job.host] -= 1
+                        if not self._queue and not any(j.status == 'downloading' for j in self.jobs):
+                            self._finished_at = time.monotonic()
+                        self._cond.notify_all()
+                    self._notify(job)
+        finally:
+            for ydl in ydls.values():
+                if hasattr(ydl, 'close'):
+                    ydl.close()
+
+    def _ydl_for(self, ydls: Dict[str, object], ydl_opts: Dict):
+        """워커 스레드에서 재사용할 YoutubeDL (옵션 조합별로 만들고 오래된 것부터 닫음)"""
+        key = json.dumps(ydl_opts, sort_keys=True, default=str)
+        ydl = ydls.pop(key, None)
+        if ydl is None:
+            if len(ydls) >= self.MAX_YDL_PER_WORKER:
+                oldest = ydls.pop(next(iter(ydls)))
+                if hasattr(oldest, 'close'):
+                    oldest.close()
+            opts = dict(ydl_opts)
+            opts['progress_hooks'] = list(opts.get('progress_hooks', [])) + [self._progress_hook]
+            opts['post_hooks'] = list(opts.get('post_hooks', [])) + [self._post_hook]
+            ydl = self.ydl_factory(opts)
+        ydls[key] = ydl  # 최근 사용 순서 유지
+        return ydl
+
+    def _notify(self, job: DownloadJob):
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(job)
+        except Exception as e:
+            print(f"Error in download update callback: {str(e)}")
+
+    def _progress_hook(self, status: Dict):
+        """yt-dlp progress hook - 현재 스레드가 받는 작업의 파일별 바이트 갱신"""
+        job = getattr(self._local, 'job', None)
+        if job is None:
+            return
+
+        filename = status.get('filename') or status.get('tmpfilename') or ''
+        if status.get('status') == 'finished':
+            job.file_bytes[filename] = status.get('total_bytes') or status.get('downloaded_bytes') \
+                or job.file_bytes.get(filename, 0)
+        else:
+            job.file_bytes[filename] = status.get('downloaded_bytes') or 0
+
+    def _post_hook(self, filepath: str):
+        """yt-dlp post hook - 후처리 (병합) 까지 끝난 최종 파일 경로"""
+        job = getattr(self._local, 'job', None)
+        if job is not None:
+            job.filepath = filepath
+
+    @staticmethod
+    def _file_size(job: DownloadJob) -> int:
+        if job.filepath and os.path.exists(job.filepath):
+            return os.path.getsize(job.filepath)
+        return job.bytes_done
+
+    # ==================== 진행 상황 ====================
+
+    def progress(self) -> Dict:
+        """전체 진행률 / 처리량"""
+        with self._cond:
+            counts = {'queued': 0, 'downloading': 0, 'finished': 0, 'failed': 0, 'cancelled': 0}
+            for job in self.jobs:
+                counts[job.status] += 1
+            total_bytes = sum(job.bytes_done for job in self.jobs)
+            current = [job.title for job in self.jobs if job.status == 'downloading']
+            started_at, finished_at = self._started_at, self._finished_at
+
+        total = len(self.jobs)
+        completed = counts['finished'] + counts['failed'] + counts['cancelled']
+        elapsed = ((finished_at or time.monotonic()) - started_at) if started_at else 0.0
+
+        return {
+            'total': total,
+            'completed': completed,
+            'fraction': completed / total if total else 1.0,
+            **counts,
+            'current': current,
+            'bytes': total_bytes,
+            'elapsed_s': elapsed,
+            'bytes_per_s': total_bytes / elapsed if elapsed > 0 else 0.0,
+            'videos_per_min': counts['finished'] * 60 / elapsed if elapsed > 0 else 0.0
+        }
+
+    def failures(self) -> List[DownloadJob]:
+        return [job for job in self.jobs if job.status == 'failed']
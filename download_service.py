@@ -0,0 +1,393 @@
+"""
+Download Service Module
+Streamlit 세션과 분리된 백그라운드 다운로드 서비스
+
+- 작업/비디오 상태를 SQLite 작업 테이블에 저장 (UI 는 submit 후 job() 으로 진행 상황 조회)
+- 모든 작업이 하나의 DownloadScheduler 풀 (workers, per_host_limit) 을 공유
+- 프로세스가 재시작되면 끝나지 않은 비디오를 다시 큐에 넣음 (.part 파일에서 이어받음)
+- 같은 폴더로 이미 대기/다운로드 중인 비디오는 다시 제출해도 한 번만 받음
+- 한 작업 테이블 (path) 은 한 프로세스의 서비스만 사용
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from download_archive import DownloadArchive
+from download_scheduler import DownloadJob, DownloadScheduler, build_ydl_opts
+
+UNFINISHED_ITEM_STATUSES = ('queued', 'downloading')
+
+
+class DownloadService:
+    """
+    백그라운드 다운로드 서비스
+
+    사용 예:
+        service = DownloadService('download_jobs.db', workers=4)
+        job_id = service.submit(videos, 'downloads', resolution='720p')
+        service.job(job_id)   # {'status', 'finished', 'failed', 'fraction', 'bytes_per_s', ...}
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS download_jobs (
+            job_id TEXT PRIMARY KEY,
+            label TEXT,
+            download_path TEXT NOT NULL,
+            ydl_opts TEXT NOT NULL,
+            use_archive INTEGER NOT NULL DEFAULT 1,
+            status TEXT NOT NULL DEFAULT 'queued',
+            total INTEGER NOT NULL DEFAULT 0,
+            skipped INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_download_jobs_created ON download_jobs(created_at);
+
+        CREATE TABLE IF NOT EXISTS download_items (
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            video_id TEXT,
+            url TEXT NOT NULL,
+            title TEXT,
+            status TEXT NOT NULL DEFAULT 'queued',
+            error TEXT,
+            bytes INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (job_id, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_download_items_url ON download_items(job_id, url);
+        CREATE INDEX IF NOT EXISTS idx_download_items_status ON download_items(status);
+    '''
+
+    def __init__(self, path: str = 'download_jobs.db', workers: int = 4, per_host_limit: int = 4,
+                 ydl_factory: Optional[Callable[[Dict], object]] = None, resume: bool = True):
+        """
+        Args:
+            path: 작업 테이블 SQLite 파일 경로
+            workers: 전체 작업이 공유하는 동시 다운로드 수
+            per_host_limit: 호스트별 동시 다운로드 수
+            ydl_factory: YoutubeDL 호환 객체를 만드는 함수 (기본: yt_dlp.YoutubeDL)
+            resume: True 면 시작할 때 끝나지 않은 작업을 이어서 실행 (False 면 취소 처리)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._archives: Dict[str, DownloadArchive] = {}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+
+        self.scheduler = DownloadScheduler(
+            {}, workers=workers, per_host_limit=per_host_limit,
+            ydl_factory=ydl_factory, on_update=self._on_update
+        )
+
+        if resume:
+            self._resume()
+        else:
+            self._abandon()
+
+    # ==================== 작업 제출 ====================
+
+    def submit(self, videos: List[Dict], download_path: str, resolution: str = '1080p',
+               format_option: str = 'mp4', use_archive: bool = True, only_new: bool = False,
+               label: Optional[str] = None) -> str:
+        """
+        다운로드 작업 등록 (즉시 반환)
+
+        Args:
+            videos: {'id', 'url', 'title'} 목록
+            download_path: 다운로드 폴더
+            use_archive: True 면 폴더의 DownloadArchive 로 이미 받은 비디오를 건너뜀
+            only_new: True 면 새 업로드와 실패/중단된 비디오만 받음 (완료된 비디오는 파일이 없어도 건너뜀)
+                (아카이브와 관계없이 같은 폴더로 대기/다운로드 중인 비디오는 건너뜀)
+            label: 작업 목록에 표시할 이름 (예: 채널명)
+
+        Returns:
+            job_id
+        """
+        job_id = uuid.uuid4().hex[:12]
+        ydl_opts = build_ydl_opts(download_path, resolution, format_option)
+
+        todo, skipped = videos, []
+        archive = self._archive(download_path) if use_archive else None
+        if archive:
+            todo, skipped = archive.plan(videos, only_new=only_new)
+
+        now = time.time()
+        with self._lock, self._conn:
+            # 확인과 등록을 같은 잠금 안에서 해야 동시에 제출해도 한 번만 받음
+            todo, in_flight = self._split_in_flight(download_path, todo)
+            skipped = len(skipped) + len(in_flight)
+
+            self._conn.execute(
+                '''INSERT INTO download_jobs
+                   (job_id, label, download_path, ydl_opts, use_archive, status, total, skipped,
+                    created_at, finished_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                (job_id, label, download_path, json.dumps(ydl_opts), int(use_archive),
+                 'queued' if todo else 'finished', len(todo), skipped, now,
+                 None if todo else now)
+            )
+            self._conn.executemany(
+                '''INSERT INTO download_items (job_id, position, video_id, url, title)
+                   VALUES (?, ?, ?, ?, ?)''',
+                [(job_id, position, video.get('id'), video['url'], video.get('title'))
+                 for position, video in enumerate(todo)]
+            )
+
+        if todo:
+            self.scheduler.start(todo, ydl_opts=ydl_opts, archive=archive, tag=job_id)
+        return job_id
+
+    def cancel(self, job_id: str) -> int:
+        """대기 중인 비디오 취소 (진행 중인 비디오는 끝까지 받음), 취소한 비디오 수 반환"""
+        cancelled = self.scheduler.cancel(lambda job: job.tag == job_id)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE download_items SET status = 'cancelled' WHERE job_id = ? AND status = 'queued'",
+                (job_id,)
+            )
+            self._conn.execute(
+                "UPDATE download_jobs SET status = 'cancelled' WHERE job_id = ? AND status IN ('queued', 'running')",
+                (job_id,)
+            )
+            done = self._finish_if_done(job_id)
+
+        # 진행 중인 비디오가 없으면 바로 정리 (있으면 마지막 비디오가 끝날 때 _on_update 에서 정리)
+        if done:
+            self.scheduler.prune(lambda job: job.tag == job_id)
+        return len(cancelled)
+
+    def _split_in_flight(self, download_path: str, videos: List[Dict]):
+        """
+        (받을 비디오, 이미 대기/다운로드 중인 비디오) 로 나눔 (self._lock 안에서 호출)
+
+        같은 폴더로 끝나지 않은 download_items 가 있거나 목록 안에서 중복된 비디오는 건너뜀
+        (video_id 가 없으면 url 로 비교)
+        """
+        rows = self._conn.execute(
+            f'''SELECT i.video_id, i.url FROM download_items i
+                JOIN download_jobs j ON j.job_id = i.job_id
+                WHERE i.status IN ({','.join('?' * len(UNFINISHED_ITEM_STATUSES))})
+                AND j.download_path = ?''',
+            (*UNFINISHED_ITEM_STATUSES, download_path)
+        ).fetchall()
+        seen = {video_id or url for video_id, url in rows}
+
+        todo, in_flight = [], []
+        for video in videos:
+            key = video.get('id') or video['url']
+            if key in seen:
+                in_flight.append(video)
+            else:
+                seen.add(key)
+                todo.append(video)
+        return todo, in_flight
+
+    def _resume(self):
+        """끝나지 않은 작업의 남은 비디오를 다시 큐에 넣음"""
+        with self._lock:
+            jobs = self._conn.execute(
+                '''SELECT job_id, download_path, ydl_opts, use_archive FROM download_jobs
+                   WHERE status IN ('queued', 'running') ORDER BY created_at'''
+            ).fetchall()
+
+        for job_id, download_path, ydl_opts, use_archive in jobs:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE download_items SET status = 'queued' WHERE job_id = ? AND status = 'downloading'",
+                    (job_id,)
+                )
+                rows = self._conn.execute(
+                    '''SELECT video_id, url, title FROM download_items
+                       WHERE job_id = ? AND status = 'queued' ORDER BY position''',
+                    (job_id,)
+                ).fetchall()
+                self._finish_if_done(job_id)
+
+            if rows:
+                videos = [{'id': video_id, 'url': url, 'title': title} for video_id, url, title in rows]
+                archive = self._archive(download_path) if use_archive else None
+                self.scheduler.start(videos, ydl_opts=json.loads(ydl_opts), archive=archive, tag=job_id)
+
+    def _abandon(self):
+        """이어서 실행하지 않을 끝나지 않은 작업을 취소 처리 (대기 중으로 남아 새 제출을 막지 않도록)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                f'''UPDATE download_items SET status = 'cancelled'
+                    WHERE status IN ({','.join('?' * len(UNFINISHED_ITEM_STATUSES))})''',
+                UNFINISHED_ITEM_STATUSES
+            )
+            self._conn.execute(
+                '''UPDATE download_jobs SET status = 'cancelled', finished_at = COALESCE(finished_at, ?)
+                   WHERE status IN ('queued', 'running')''',
+                (time.time(),)
+            )
+
+    def _archive(self, download_path: str) -> DownloadArchive:
+        with self._lock:
+            archive = self._archives.get(download_path)
+            if archive is None:
+                archive = self._archives[download_path] = DownloadArchive(download_path)
+        return archive
+
+    # ==================== 상태 기록 ====================
+
+    def _on_update(self, job: DownloadJob):
+        """스케줄러 워커 스레드에서 비디오 시작/종료 시 호출"""
+        if job.tag is None:
+            return
+
+        now = time.time()
+        with self._lock, self._conn:
+            if job.status == 'downloading':
+                self._conn.execute(
+                    "UPDATE download_items SET status = 'downloading' WHERE job_id = ? AND url = ?",
+                    (job.tag, job.url)
+                )
+                self._conn.execute(
+                    '''UPDATE download_jobs SET status = 'running', started_at = COALESCE(started_at, ?)
+                       WHERE job_id = ? AND status = 'queued' ''',
+                    (now, job.tag)
+                )
+                return
+
+            self._conn.execute(
+                'UPDATE download_items SET status = ?, error = ?, bytes = ? WHERE job_id = ? AND url = ?',
+                (job.status, job.error, job.bytes_done, job.tag, job.url)
+            )
+            done = self._finish_if_done(job.tag)
+
+        if done:
+            self.scheduler.prune(lambda j: j.tag == job.tag)
+
+    def _finish_if_done(self, job_id: str) -> bool:
+        """남은 비디오가 없으면 작업 종료 처리 (self._lock 안에서 호출)"""
+        remaining = self._conn.execute(
+            f'''SELECT COUNT(*) FROM download_items WHERE job_id = ?
+                AND status IN ({','.join('?' * len(UNFINISHED_ITEM_STATUSES))})''',
+            (job_id, *UNFINISHED_ITEM_STATUSES)
+        ).fetchone()[0]
+        if remaining:
+            return False
+
+        self._conn.execute(
+            '''UPDATE download_jobs
+               SET status = CASE WHEN status = 'cancelled' THEN 'cancelled' ELSE 'finished' END,
+                   finished_at = COALESCE(finished_at, ?)
+               WHERE job_id = ?''',
+            (time.time(), job_id)
+        )
+        return True
+
+    # ==================== 조회 ====================
+
+    def job(self, job_id: str) -> Optional[Dict]:
+        """작업 진행 상황 (진행 중인 비디오의 받은 바이트 포함)"""
+        with self._lock:
+            row = self._conn.execute(
+                '''SELECT job_id, label, download_path, status, total, skipped,
+                          created_at, started_at, finished_at
+                   FROM download_jobs WHERE job_id = ?''',
+                (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            counts = dict(self._conn.execute(
+                'SELECT status, COUNT(*) FROM download_items WHERE job_id = ? GROUP BY status',
+                (job_id,)
+            ).fetchall())
+            stored_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(bytes), 0) FROM download_items WHERE job_id = ? AND status != 'downloading'",
+                (job_id,)
+            ).fetchone()[0]
+            failures = self._conn.execute(
+                "SELECT title, error FROM download_items WHERE job_id = ? AND status = 'failed' ORDER BY position",
+                (job_id,)
+            ).fetchall()
+
+        active = [job for job in list(self.scheduler.jobs) if job.tag == job_id and job.status == 'downloading']
+        total_bytes = stored_bytes + sum(job.bytes_done for job in active)
+
+        job_id, label, download_path, status, total, skipped, created_at, started_at, finished_at = row
+        finished = counts.get('finished', 0)
+        completed = finished + counts.get('failed', 0) + counts.get('cancelled', 0)
+        elapsed = ((finished_at or time.time()) - started_at) if started_at else 0.0
+
+        return {
+            'job_id': job_id,
+            'label': label,
+            'download_path': download_path,
+            'status': status,
+            'total': total,
+            'skipped': skipped,
+            'completed': completed,
+            'fraction': completed / total if total else 1.0,
+            'queued': counts.get('queued', 0),
+            'downloading': counts.get('downloading', 0),
+            'finished': finished,
+            'failed': counts.get('failed', 0),
+            'cancelled': counts.get('cancelled', 0),
+            'current': [job.title for job in active],
+            'failures': [{'title': title, 'error': error} for title, error in failures],
+            'bytes': total_bytes,
+            'created_at': created_at,
+            'elapsed_s': elapsed,
+            'bytes_per_s': total_bytes / elapsed if elapsed > 0 else 0.0,
+            'videos_per_min': finished * 60 / elapsed if elapsed > 0 else 0.0
+        }
+
+    def list_jobs(self, limit: int = 20) -> List[Dict]:
+        """최근 작업 목록 (최신순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                '''SELECT j.job_id, j.label, j.download_path, j.status, j.total, j.skipped, j.created_at,
+                          SUM(i.status = 'finished'), SUM(i.status = 'failed')
+                   FROM download_jobs j LEFT JOIN download_items i ON i.job_id = j.job_id
+                   GROUP BY j.job_id ORDER BY j.created_at DESC LIMIT ?''',
+                (limit,)
+            ).fetchall()
+
+        return [
+            {
+                'job_id': job_id, 'label': label, 'download_path': download_path, 'status': status,
+                'total': total, 'skipped': skipped, 'finished': finished or 0, 'failed': failed or 0,
+                'created_at': created_at
+            }
+            for job_id, label, download_path, status, total, skipped, created_at, finished, failed in rows
+        ]
+
+    def stats(self) -> Dict:
+        """풀 설정 / 작업 상태별 수"""
+        with self._lock:
+            jobs = dict(self._conn.execute(
+                'SELECT status, COUNT(*) FROM download_jobs GROUP BY status'
+            ).fetchall())
+        progress = self.scheduler.progress()
+
+        return {
+            'path': self.path,
+            'workers': self.scheduler.workers,
+            'per_host_limit': self.scheduler.per_host_limit,
+            'jobs': jobs,
+            'queued_videos': progress['queued'],
+            'active_videos': progress['downloading']
+        }
+
+    def close(self):
+        """대기 중인 비디오는 작업 테이블에 남겨 두고 종료 (다음 시작 때 이어서 실행)"""
+        self.scheduler.on_update = None
+        self.scheduler.cancel()
+        with self._lock:
+            # 진행 중인 다운로드가 아카이브에 기록할 수 있도록 끝난 경우에만 닫음
+            if self.scheduler.done():
+                for archive in self._archives.values():
+                    archive.close()
+                self._archives.clear()
+            self._conn.close()
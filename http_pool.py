@@ -0,0 +1,210 @@
+"""
+Pooled HTTP Client Module
+포털 스크래퍼용 공유 커넥션 풀 (keep-alive, 재시도, 공통 헤더)
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+
+class ConnectionStats:
+    """
+    호스트별 요청 / 커넥션 카운터
+
+    - requests: PooledHTTPClient.request 호출 수 (논리 요청)
+    - attempts: 실제로 보낸 HTTP 요청 수 (재시도 / 리다이렉트 포함)
+    - connections_reused: 새 커넥션 없이 보낸 attempts
+    """
+
+    FIELDS = ('requests', 'attempts', 'redirects', 'created')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {field: {} for field in self.FIELDS}
+
+    def _add(self, field: str, host: str, count: int = 1):
+        with self._lock:
+            counts = self._counts[field]
+            counts[host] = counts.get(host, 0) + count
+
+    def record_created(self, host: str):
+        self._add('created', host)
+
+    def record_attempt(self, host: str):
+        self._add('attempts', host)
+
+    def record_request(self, host: str, redirects: int = 0):
+        self._add('requests', host)
+        if redirects:
+            self._add('redirects', host, redirects)
+
+    @staticmethod
+    def _summary(requests: int, attempts: int, redirects: int, created: int) -> Dict:
+        reused = max(0, attempts - created)
+        return {
+            'requests': requests,
+            'attempts': attempts,
+            # 논리 요청 1회 = 첫 시도 1회 + 리다이렉트, 나머지는 urllib3 재시도
+            'retries': max(0, attempts - requests - redirects),
+            'redirects': redirects,
+            'connections_created': created,
+            'connections_reused': reused,
+            'reuse_ratio': reused / attempts if attempts else 0.0
+        }
+
+    def snapshot(self) -> Dict:
+        """현재 카운터 값 (전체 + 호스트별)"""
+        with self._lock:
+            counts = {field: dict(values) for field, values in self._counts.items()}
+
+        hosts = {}
+        for host in set().union(*counts.values()):
+            hosts[host] = self._summary(*(counts[field].get(host, 0) for field in self.FIELDS))
+
+        totals = self._summary(*(sum(counts[field].values()) for field in self.FIELDS))
+        return {**totals, 'hosts': hosts}
+
+    def reset(self):
+        with self._lock:
+            for values in self._counts.values():
+                values.clear()
+
+
+def _counting_pool_class(base, stats: ConnectionStats):
+    """stats에 기록하는 urllib3 커넥션 풀 클래스 생성"""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            stats.record_created(self.host)
+            return super()._new_conn()
+
+        def urlopen(self, method, url, *args, **kwargs):
+            # urllib3 재시도는 urlopen 을 다시 호출하므로 시도마다 기록됨
+            stats.record_attempt(self.host)
+            return super().urlopen(method, url, *args, **kwargs)
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """커넥션 생성/재사용을 집계하는 HTTPAdapter"""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool_class(HTTPConnectionPool, self._stats),
+            'https': _counting_pool_class(HTTPSConnectionPool, self._stats)
+        }
+
+
+class PooledHTTPClient:
+    """
+    keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트
+
+    - 호스트별 풀 크기 (pool_maxsize) 와 풀 개수 (pool_connections) 설정
+    - 429/5xx 및 연결 오류에 대한 재시도 (지수 백오프)
+    - 공통 헤더 (User-Agent 등) 일괄 적용
+    - stats() 로 요청 / 재시도 / 커넥션 생성·재사용 횟수 확인
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10,
+                 max_retries: int = 2, backoff_factor: float = 0.3,
+                 retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 timeout: float = 5.0, stats: Optional[ConnectionStats] = None):
+        """
+        Args:
+            headers: 모든 요청에 적용할 공통 헤더
+            pool_connections: 캐시할 호스트별 풀 개수
+            pool_maxsize: 호스트당 유지할 최대 커넥션 수
+            max_retries: 재시도 횟수 (0이면 재시도 없음)
+            backoff_factor: 재시도 간 지수 백오프 계수
+            retry_statuses: 재시도할 HTTP 상태 코드
+            timeout: 기본 요청 타임아웃 (초)
+            stats: 다른 클라이언트와 공유할 통계 (없으면 새로 만듦)
+        """
+        self.timeout = timeout
+        self._stats = stats or ConnectionStats()
+        self._pool_args = {
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'retry_statuses': tuple(retry_statuses)
+        }
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(retry_statuses),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = _CountingAdapter(
+            self._stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def without_retries(self) -> 'PooledHTTPClient':
+        """
+        같은 헤더 / 풀 크기 / 통계를 쓰고 재시도하지 않는 클라이언트
+
+        마감 시간이 정해진 요청용 (재시도와 백오프가 마감 시간을 넘기지 않도록)
+        """
+        return PooledHTTPClient(
+            headers=dict(self.session.headers),
+            max_retries=0,
+            timeout=self.timeout,
+            stats=self._stats,
+            **self._pool_args
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청 (기본 타임아웃 적용)"""
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """임의 메서드 요청 (기본 타임아웃 적용, 재시도/리다이렉트와 관계없이 요청 1회로 집계)"""
+        kwargs.setdefault('timeout', self.timeout)
+        response = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            return response
+        finally:
+            self._stats.record_request(urlsplit(url).hostname or '',
+                                       len(response.history) if response is not None else 0)
+
+    def stats(self) -> Dict:
+        """요청 / 재시도 / 리다이렉트 / 커넥션 생성·재사용 통계"""
+        return self._stats.snapshot()
+
+    def reset_stats(self):
+        self._stats.reset()
+
+    def close(self):
+        self.session.close()
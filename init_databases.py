@@ -5,13 +5,17 @@ Database Initialization Script
 
 사용법:
 python init_databases.py --config .env.local
+python init_databases.py --parallel 6 --timeout 10 --json-report init_timing.json
 """
 
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from dotenv import load_dotenv
 from notion_db import NotionDB
+from notion_health import DATABASES, DEFAULT_PARALLELISM, DEFAULT_TIMEOUT, run_checks, write_json_report
 from datetime import datetime
 import json
 
@@ -42,76 +46,76 @@ def load_config(config_file: str) -> dict:
 
     return config
 
-def initialize_databases(config: dict) -> bool:
-    """6개 Database 초기화"""
+def initialize_databases(config: dict, parallelism: int = DEFAULT_PARALLELISM,
+                         timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """
+    6개 Database 초기화 (parallelism 개씩 동시에, Database 당 timeout 초 제한)
+
+    Returns:
+        notion_health.run_checks 리포트 ('ok' 가 전체 성공 여부)
+    """
     print("\n" + "="*60)
     print("  ⚙️  Database Initialization")
     print("="*60 + "\n")
 
     # Notion DB 클라이언트 생성
-    notion_db = NotionDB(config['notion_token'])
+    notion_db = NotionDB(config['notion_token'], request_timeout=timeout)
     notion_db.set_database_ids(config['db_ids'])
 
-    # 각 Database 초기화
-    databases = [
-        ('keyword_analysis', 'Keyword Analysis 🔍', 'keyword_analysis'),
-        ('trend_data', 'Trend Data 📊', 'trend_data'),
-        ('recommendations', 'Recommendations 💡', 'recommendations'),
-        ('competitor_analysis', 'Competitor Analysis ⚔️', 'competitor_analysis'),
-        ('search_intent', 'Search Intent 🔍', 'search_intent'),
-        ('performance_prediction', 'Performance Prediction 📈', 'performance_prediction')
-    ]
-
-    results = {}
+    def check(db_key: str) -> dict:
+        db_id = config['db_ids'].get(db_key)
 
-    for db_key, display_name, config_key in databases:
-        print(f"⚙️  Initializing {display_name}...")
+        if not db_id:
+            return {'status': False, 'error': f"Database ID not found for {db_key}"}
 
-        db_id = config['db_ids'].get(config_key)
+        # Database 연결 테스트
+        response = notion_db._query_database(db_id)
 
-        if not db_id:
-            print(f"   ❌ Database ID not found for {config_key}")
-            results[db_key] = False
-            continue
+        if 'has_more' in response:
+            return {'status': True}
+        return {'status': False, 'error': 'Connection uncertain'}
 
-        try:
-            # Database 연결 테스트
-            response = notion_db._query_database(db_id)
+    print(f"⚙️  Initializing {len(DATABASES)} databases "
+          f"(parallel: {parallelism}, timeout: {timeout:.0f}s)...\n")
 
-            if 'results' in response:
-                print(f"   ✅ Connected successfully")
-                print(f"   📝 Ready to receive data")
-                results[db_key] = True
-            else:
-                print(f"   ⚠️  Connection uncertain")
-                results[db_key] = False
+    report = run_checks(
+        {db_key: partial(check, db_key) for db_key in DATABASES},
+        parallelism=parallelism,
+        timeout=timeout
+    )
 
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results[db_key] = False
+    for db_key, display_name in DATABASES.items():
+        result = report['databases'][db_key]
+        print(f"⚙️  {display_name} ({result['elapsed_ms']:.0f} ms)")
+        if result['status']:
+            print(f"   ✅ Connected successfully")
+            print(f"   📝 Ready to receive data")
+        else:
+            print(f"   ❌ Error: {result['error']}")
 
     # 결과 요약
     print("\n" + "="*60)
-    success_count = sum(1 for v in results.values() if v)
-    total_count = len(results)
+    success_count = sum(1 for r in report['databases'].values() if r['status'])
+    total_count = len(report['databases'])
 
-    print(f"  📊 Initialization Result: {success_count}/{total_count} successful\n")
+    print(f"  📊 Initialization Result: {success_count}/{total_count} successful "
+          f"({report['total_ms']:.0f} ms)\n")
 
-    for db_name, success in results.items():
-        status = "✅" if success else "❌"
+    for db_name, result in report['databases'].items():
+        status = "✅" if result['status'] else "❌"
         print(f"  {status} {db_name}")
 
     print("\n" + "="*60 + "\n")
 
-    return all(results.values())
+    return report
 
-def add_default_data(config: dict) -> bool:
-    """기본 데이터 추가"""
+def add_default_data(config: dict, parallelism: int = DEFAULT_PARALLELISM) -> bool:
+    """기본 데이터 추가 (키워드와 추천을 parallelism 개씩 동시에 전송)"""
     print("\n" + "="*60)
     print("  📝 Adding Default Data")
     print("="*60 + "\n")
 
-    notion_db = NotionDB(config['notion_token'])
+    notion_db = NotionDB(config['notion_token'], batch_workers=parallelism)
     notion_db.set_database_ids(config['db_ids'])
 
     # 기본 키워드 데이터
@@ -165,18 +169,21 @@ def add_default_data(config: dict) -> bool:
 
     # Keyword Analysis에 데이터 추가
     print("📌 Adding keywords to Keyword Analysis...")
-    keyword_count = 0
 
-    for keyword_data in default_keywords:
+    def add_keyword(keyword_data: dict) -> bool:
         try:
             notion_db.add_keyword_analysis(
                 keyword_data['keyword'],
                 keyword_data
             )
             print(f"  ✅ Added: {keyword_data['keyword']}")
-            keyword_count += 1
+            return True
         except Exception as e:
             print(f"  ⚠️  Could not add {keyword_data['keyword']}: {str(e)}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as pool:
+        keyword_count = sum(pool.map(add_keyword, default_keywords))
 
     print(f"\n✅ Added {keyword_count} keywords\n")
 
@@ -215,14 +222,7 @@ def add_default_data(config: dict) -> bool:
         }
     ]
 
-    rec_count = 0
-    for rec in recommendations:
-        try:
-            notion_db.add_recommendation('Python Programming', rec)
-            print(f"  ✅ Added: {rec['keyword']}")
-            rec_count += 1
-        except Exception as e:
-            print(f"  ⚠️  Could not add recommendation: {str(e)}")
+    rec_count = notion_db.batch_add_recommendations('Python Programming', recommendations)
 
     print(f"\n✅ Added {rec_count} recommendations\n")
 
@@ -292,6 +292,22 @@ def main():
         action='store_true',
         help='Only generate report without initialization'
     )
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help=f'Databases to check concurrently (default: {DEFAULT_PARALLELISM}, 1 = sequential)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f'Per-database timeout in seconds (default: {DEFAULT_TIMEOUT:.0f})'
+    )
+    parser.add_argument(
+        '--json-report',
+        help='Write a JSON timing report to this path'
+    )
 
     args = parser.parse_args()
 
@@ -304,15 +320,19 @@ def main():
         return
 
     # Database 초기화
-    init_success = initialize_databases(config)
+    init_report = initialize_databases(config, parallelism=args.parallel, timeout=args.timeout)
+
+    if args.json_report:
+        write_json_report(init_report, args.json_report)
+        print(f"📄 Timing report saved to {args.json_report}")
 
-    if not init_success:
+    if not init_report['ok']:
         print("❌ Initialization failed")
         sys.exit(1)
 
     # 샘플 데이터 추가
     if args.add_samples:
-        add_default_data(config)
+        add_default_data(config, parallelism=args.parallel)
 
     # 리포트 생성
     report = generate_init_report(config)
@@ -3,122 +3,589 @@ Advanced Keyword Analysis Module for YouTube Content
 포털 키워드 분석 및 실시간 트렌드 추천 - Black Kiwi보다 훨씬 더 강력한 버전
 """
 
-import requests
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 from typing import Dict, List, Tuple, Optional
 import time
+import heapq
 from bs4 import BeautifulSoup
 import sqlite3
 import os
+import threading
+import atexit
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
 import numpy as np
 from scipy import stats
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from http_pool import PooledHTTPClient
+from signal_matcher import SignalMatcher, SignalHits
+from memo_cache import LRUCache
+from dataclasses import dataclass
+
+class SQLiteConnectionManager:
+    """
+    SQLite 장기 커넥션 관리자 (db_path 당 하나)
+
+    - WAL 모드 + synchronous=NORMAL 로 커밋 비용 감소
+    - RLock 으로 스레드 간 커넥션 공유
+    - 쓰기 버퍼: batch_size 개가 쌓이거나 flush_interval 초가 지나면 한 트랜잭션으로 기록
+    - 일시적 오류 (locked/busy) 는 버퍼를 남겨 재시도, 그 외 오류는 실패한 행만 dead_letters 로 격리
+    - 버퍼가 max_buffer 행을 넘으면 새 쓰기는 버림 (dropped 로 집계)
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, db_path: str, batch_size: int = 100, flush_interval: float = 1.0,
+                 max_buffer: int = 10000) -> 'SQLiteConnectionManager':
+        """db_path 에 대한 공유 관리자 반환 (없으면 생성)"""
+        key = os.path.abspath(db_path) if db_path != ':memory:' else db_path
+        with cls._instances_lock:
+            manager = cls._instances.get(key)
+            if manager is None or manager.closed:
+                manager = cls(db_path, batch_size, flush_interval, max_buffer)
+                cls._instances[key] = manager
+            return manager
+
+    def __init__(self, db_path: str, batch_size: int = 100, flush_interval: float = 1.0,
+                 max_buffer: int = 10000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.closed = False
+
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._buffer = {}  # sql -> [params, ...]
+        self._buffered = 0
+
+        # 기록할 수 없는 행 (sql, params, error) 최근 것만 보관
+        self.dead_letters = deque(maxlen=1000)
+        self.dropped = 0
+
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop,
+                                         name='keyword-db-flusher', daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def connection(self, flush: bool = True):
+        """
+        커넥션 독점 사용 (읽기 전 버퍼를 먼저 기록해 방금 쓴 데이터도 보이게 함)
+        """
+        with self._lock:
+            if flush:
+                self._try_flush_locked()
+            yield self._conn
+
+    def enqueue(self, sql: str, params: Tuple):
+        """버퍼에 쓰기 추가 (배치 크기에 도달하면 즉시 기록)"""
+        with self._lock:
+            if self._buffered >= self.max_buffer:
+                self._try_flush_locked()
+                if self._buffered >= self.max_buffer:
+                    self.dropped += 1
+                    if self.dropped == 1 or self.dropped % 1000 == 0:
+                        print(f"Keyword DB write buffer full ({self.max_buffer} rows), "
+                              f"dropped {self.dropped} writes")
+                    return
+
+            self._buffer.setdefault(sql, []).append(params)
+            self._buffered += 1
+            if self._buffered >= self.batch_size:
+                # 실패한 행은 버퍼에 남아 있으므로 백그라운드 flush 가 다시 기록
+                self._try_flush_locked()
+
+    def executemany(self, sql: str, rows: List[Tuple]) -> int:
+        """여러 행을 한 트랜잭션으로 즉시 기록"""
+        with self._lock:
+            self._try_flush_locked()
+            with self._conn:
+                cursor = self._conn.executemany(sql, rows)
+            return cursor.rowcount
+
+    def flush(self):
+        """버퍼에 쌓인 쓰기를 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _try_flush_locked(self):
+        """flush 하되 일시적 오류는 로그만 남김 (읽기/다른 쓰기가 버퍼 때문에 실패하지 않도록)"""
+        try:
+            self._flush_locked()
+        except sqlite3.Error as e:
+            print(f"Keyword DB flush error: {str(e)}")
+
+    @staticmethod
+    def _is_transient(error: sqlite3.Error) -> bool:
+        """잠시 뒤 다시 시도하면 성공할 수 있는 오류 (database is locked / busy)"""
+        name = getattr(error, 'sqlite_errorname', None)
+        if name is not None:
+            return name.startswith(('SQLITE_BUSY', 'SQLITE_LOCKED'))
+        message = str(error).lower()
+        return isinstance(error, sqlite3.OperationalError) and ('locked' in message or 'busy' in message)
+
+    def _flush_locked(self):
+        if not self._buffered:
+            return
+
+        # 일시적 오류면 트랜잭션이 롤백되고 버퍼는 남아 다음 flush 에서 재시도
+        try:
+            with self._conn:
+                for sql, rows in self._buffer.items():
+                    self._conn.executemany(sql, rows)
+        except sqlite3.Error as e:
+            if self._is_transient(e):
+                raise
+            # 제약 조건 위반 / 스키마 불일치 등: 행 단위로 다시 기록하고 실패한 행만 격리
+            self._flush_rows_locked()
+
+        self._buffer = {}
+        self._buffered = 0
+
+    def _flush_rows_locked(self):
+        """버퍼를 행마다 따로 기록 (기록한 행은 버퍼에서 빼서 재시도 때 중복되지 않게 함)"""
+        failed = 0
+        first_error = None
+        for sql in list(self._buffer):
+            rows = self._buffer[sql]
+            for i, params in enumerate(rows):
+                try:
+                    with self._conn:
+                        self._conn.execute(sql, params)
+                except sqlite3.Error as e:
+                    if self._is_transient(e):
+                        self._buffer[sql] = rows[i:]
+                        if failed:
+                            print(f"Keyword DB: {failed} writes failed permanently: {first_error}")
+                        raise
+                    self.dead_letters.append((sql, params, str(e)))
+                    failed += 1
+                    first_error = first_error or str(e)
+                self._buffered -= 1
+            del self._buffer[sql]
+
+        if failed:
+            print(f"Keyword DB: {failed} writes failed permanently: {first_error}")
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Keyword DB flush error: {str(e)}")
+
+    def reset(self):
+        """버퍼를 버리고 DB 파일을 삭제한 뒤 새 커넥션을 엽니다"""
+        with self._lock:
+            self._buffer = {}
+            self._buffered = 0
+            self._conn.close()
+
+            if self.db_path != ':memory:':
+                for suffix in ('', '-wal', '-shm'):
+                    if os.path.exists(self.db_path + suffix):
+                        os.remove(self.db_path + suffix)
+
+            self._conn = self._connect()
+
+    def close(self):
+        """남은 버퍼를 기록하고 커넥션 종료"""
+        if self.closed:
+            return
+
+        self._stop.set()
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+                self.closed = True
+
 
 class KeywordDatabase:
     """키워드 분석 데이터 저장 및 관리"""
 
-    def __init__(self, db_path: str = 'keyword_history.db'):
+    INSERT_ANALYSIS = '''INSERT INTO keyword_analysis
+                    (keyword, portal, search_volume, trend, competition, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?)'''
+
+    INSERT_RECOMMENDATION = '''INSERT INTO keyword_recommendations
+                    (keyword, recommendation, score, category, timestamp)
+                    VALUES (?, ?, ?, ?, ?)'''
+
+    HISTORY_QUERY = '''SELECT * FROM keyword_analysis
+                   WHERE keyword = ? AND timestamp > datetime('now', '-' || ? || ' days')
+                   ORDER BY timestamp DESC'''
+
+    # 원본 테이블 전체 집계 (롤업 도입 전 쿼리, 검증/벤치마크용)
+    TOP_KEYWORDS_SCAN_QUERY = '''SELECT keyword, COUNT(*) as count, AVG(search_volume) as avg_volume
+                   FROM keyword_analysis
+                   GROUP BY keyword
+                   ORDER BY count DESC
+                   LIMIT ?'''
+
+    # 트리거로 유지되는 keyword_rollup 에서 상위 N개만 읽음
+    TOP_KEYWORDS_QUERY = '''SELECT keyword, count,
+                          CAST(volume_sum AS REAL) / NULLIF(volume_count, 0) as avg_volume
+                   FROM keyword_rollup
+                   ORDER BY count DESC
+                   LIMIT ?'''
+
+    def __init__(self, db_path: str = 'keyword_history.db',
+                 batch_size: int = 100, flush_interval: float = 1.0):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            batch_size: 쓰기 버퍼를 기록할 행 수
+            flush_interval: 쓰기 버퍼를 기록할 최대 대기 시간 (초)
+        """
         self.db_path = db_path
+        self.manager = SQLiteConnectionManager.for_path(db_path, batch_size, flush_interval)
         self._init_db()
 
+    # 스키마 마이그레이션 (version, 설명, SQL 목록)
+    # 버전은 PRAGMA user_version 에 기록되며, 기존 DB 파일은 열 때 자동으로 최신 버전까지 올라갑니다.
+    MIGRATIONS = [
+        (1, 'base tables', [
+            # 키워드 분석 히스토리 테이블
+            '''CREATE TABLE IF NOT EXISTS keyword_analysis (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                portal TEXT,
+                search_volume INTEGER,
+                trend TEXT,
+                competition TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )''',
+            # 키워드 추천 테이블
+            '''CREATE TABLE IF NOT EXISTS keyword_recommendations (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                recommendation TEXT,
+                score REAL,
+                category TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )''',
+            # 트렌드 데이터 테이블
+            '''CREATE TABLE IF NOT EXISTS trend_data (
+                id INTEGER PRIMARY KEY,
+                keyword TEXT NOT NULL,
+                date DATE,
+                search_volume INTEGER,
+                interest_level INTEGER,
+                portal TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )'''
+        ]),
+        (2, 'secondary indexes', [
+            # get_analysis_history: keyword = ? AND timestamp > ? ORDER BY timestamp
+            '''CREATE INDEX IF NOT EXISTS idx_analysis_keyword_ts
+               ON keyword_analysis (keyword, timestamp)''',
+            # 포털별 기간 조회
+            '''CREATE INDEX IF NOT EXISTS idx_analysis_portal_ts
+               ON keyword_analysis (portal, timestamp)''',
+            # get_top_keywords: GROUP BY keyword + AVG(search_volume) 를 인덱스만으로 처리
+            '''CREATE INDEX IF NOT EXISTS idx_analysis_keyword_volume
+               ON keyword_analysis (keyword, search_volume)''',
+            '''CREATE INDEX IF NOT EXISTS idx_recommendations_keyword_ts
+               ON keyword_recommendations (keyword, timestamp)''',
+            '''CREATE INDEX IF NOT EXISTS idx_trend_keyword_date
+               ON trend_data (keyword, date)''',
+            'ANALYZE'
+        ]),
+        (3, 'keyword rollup tables', [
+            # 키워드별 누적 집계 (get_top_keywords)
+            '''CREATE TABLE IF NOT EXISTS keyword_rollup (
+                keyword TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0,
+                volume_sum INTEGER NOT NULL DEFAULT 0,
+                volume_count INTEGER NOT NULL DEFAULT 0
+            )''',
+            '''CREATE INDEX IF NOT EXISTS idx_rollup_count
+               ON keyword_rollup (count DESC)''',
+            # 일자/포털별 집계 (기간 리더보드)
+            '''CREATE TABLE IF NOT EXISTS keyword_rollup_daily (
+                day TEXT NOT NULL,
+                portal TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                volume_sum INTEGER NOT NULL DEFAULT 0,
+                volume_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, portal, keyword)
+            )''',
+            # 기존 히스토리로 초기값 채우기
+            '''INSERT OR REPLACE INTO keyword_rollup (keyword, count, volume_sum, volume_count)
+               SELECT keyword, COUNT(*), COALESCE(SUM(search_volume), 0), COUNT(search_volume)
+               FROM keyword_analysis GROUP BY keyword''',
+            '''INSERT OR REPLACE INTO keyword_rollup_daily
+                   (day, portal, keyword, count, volume_sum, volume_count)
+               SELECT date(timestamp), COALESCE(portal, ''), keyword,
+                      COUNT(*), COALESCE(SUM(search_volume), 0), COUNT(search_volume)
+               FROM keyword_analysis GROUP BY date(timestamp), COALESCE(portal, ''), keyword''',
+            # INSERT/DELETE 시 집계 갱신
+            '''CREATE TRIGGER IF NOT EXISTS trg_keyword_analysis_rollup_insert
+               AFTER INSERT ON keyword_analysis
+               BEGIN
+                   INSERT INTO keyword_rollup (keyword, count, volume_sum, volume_count)
+                   VALUES (NEW.keyword, 1, COALESCE(NEW.search_volume, 0), NEW.search_volume IS NOT NULL)
+                   ON CONFLICT (keyword) DO UPDATE SET
+                       count = count + 1,
+                       volume_sum = volume_sum + excluded.volume_sum,
+                       volume_count = volume_count + excluded.volume_count;
+
+                   INSERT INTO keyword_rollup_daily
+                       (day, portal, keyword, count, volume_sum, volume_count)
+                   VALUES (date(NEW.timestamp), COALESCE(NEW.portal, ''), NEW.keyword, 1,
+                           COALESCE(NEW.search_volume, 0), NEW.search_volume IS NOT NULL)
+                   ON CONFLICT (day, portal, keyword) DO UPDATE SET
+                       count = count + 1,
+                       volume_sum = volume_sum + excluded.volume_sum,
+                       volume_count = volume_count + excluded.volume_count;
+               END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_keyword_analysis_rollup_delete
+               AFTER DELETE ON keyword_analysis
+               BEGIN
+                   UPDATE keyword_rollup SET
+                       count = count - 1,
+                       volume_sum = volume_sum - COALESCE(OLD.search_volume, 0),
+                       volume_count = volume_count - (OLD.search_volume IS NOT NULL)
+                   WHERE keyword = OLD.keyword;
+                   DELETE FROM keyword_rollup WHERE keyword = OLD.keyword AND count <= 0;
+
+                   UPDATE keyword_rollup_daily SET
+                       count = count - 1,
+                       volume_sum = volume_sum - COALESCE(OLD.search_volume, 0),
+                       volume_count = volume_count - (OLD.search_volume IS NOT NULL)
+                   WHERE day = date(OLD.timestamp) AND portal = COALESCE(OLD.portal, '')
+                     AND keyword = OLD.keyword;
+                   DELETE FROM keyword_rollup_daily
+                   WHERE day = date(OLD.timestamp) AND portal = COALESCE(OLD.portal, '')
+                     AND keyword = OLD.keyword AND count <= 0;
+               END'''
+        ])
+    ]
+
+    SCHEMA_VERSION = MIGRATIONS[-1][0]
+
     def _init_db(self):
-        """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-
-        # 키워드 분석 히스토리 테이블
-        c.execute('''CREATE TABLE IF NOT EXISTS keyword_analysis (
-            id INTEGER PRIMARY KEY,
-            keyword TEXT NOT NULL,
-            portal TEXT,
-            search_volume INTEGER,
-            trend TEXT,
-            competition TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )''')
-
-        # 키워드 추천 테이블
-        c.execute('''CREATE TABLE IF NOT EXISTS keyword_recommendations (
-            id INTEGER PRIMARY KEY,
-            keyword TEXT NOT NULL,
-            recommendation TEXT,
-            score REAL,
-            category TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )''')
-
-        # 트렌드 데이터 테이블
-        c.execute('''CREATE TABLE IF NOT EXISTS trend_data (
-            id INTEGER PRIMARY KEY,
-            keyword TEXT NOT NULL,
-            date DATE,
-            search_volume INTEGER,
-            interest_level INTEGER,
-            portal TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )''')
-
-        conn.commit()
-        conn.close()
+        """데이터베이스 초기화 (미적용 마이그레이션 실행)"""
+        with self.manager.connection() as conn:
+            self._migrate(conn)
+
+    @classmethod
+    def _migrate(cls, conn: sqlite3.Connection, target_version: Optional[int] = None):
+        """user_version 이후의 마이그레이션을 버전별 트랜잭션으로 적용"""
+        target_version = cls.SCHEMA_VERSION if target_version is None else target_version
+        current = conn.execute('PRAGMA user_version').fetchone()[0]
+
+        for version, description, statements in cls.MIGRATIONS:
+            if version <= current or version > target_version:
+                continue
+
+            conn.execute('BEGIN')
+            try:
+                for sql in statements:
+                    conn.execute(sql)
+                conn.execute(f'PRAGMA user_version = {int(version)}')
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def schema_version(self) -> int:
+        """현재 DB 스키마 버전"""
+        with self.manager.connection(flush=False) as conn:
+            return conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def explain_queries(self, keyword: str = 'sample', days: int = 30, limit: int = 10) -> Dict[str, List[str]]:
+        """주요 조회 쿼리의 EXPLAIN QUERY PLAN 결과"""
+        plans = {}
+        with self.manager.connection(flush=False) as conn:
+            for name, query, params in (
+                ('get_analysis_history', self.HISTORY_QUERY, (keyword, days)),
+                ('get_top_keywords', self.TOP_KEYWORDS_QUERY, (limit,))
+            ):
+                rows = conn.execute(f'EXPLAIN QUERY PLAN {query}', params).fetchall()
+                plans[name] = [row[-1] for row in rows]
+        return plans
+
+    @staticmethod
+    def _now() -> str:
+        """CURRENT_TIMESTAMP 와 같은 형식의 UTC 시각 (버퍼링 중에도 기록 시점 유지)"""
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+    @classmethod
+    def _analysis_row(cls, keyword: str, portal: str, data: Dict) -> Tuple:
+        return (keyword, portal,
+                data.get('estimated_search_volume', 0),
+                data.get('trend', 'unknown'),
+                data.get('competition_level', 'unknown'),
+                cls._now())
 
     def save_analysis(self, keyword: str, portal: str, data: Dict):
-        """분석 결과 저장"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        """분석 결과 저장 (쓰기 버퍼 경유)"""
+        self.manager.enqueue(self.INSERT_ANALYSIS,
+                             self._analysis_row(keyword, portal, data))
 
-        c.execute('''INSERT INTO keyword_analysis
-                    (keyword, portal, search_volume, trend, competition)
-                    VALUES (?, ?, ?, ?, ?)''',
-                 (keyword, portal,
-                  data.get('estimated_search_volume', 0),
-                  data.get('trend', 'unknown'),
-                  data.get('competition_level', 'unknown')))
+    def save_analyses_bulk(self, analyses: List[Tuple[str, str, Dict]]) -> int:
+        """
+        여러 분석 결과를 executemany 로 한 번에 저장
+
+        Args:
+            analyses: (keyword, portal, data) 튜플 리스트
 
-        conn.commit()
-        conn.close()
+        Returns:
+            저장된 행 수
+        """
+        rows = [self._analysis_row(keyword, portal, data)
+                for keyword, portal, data in analyses]
+        if not rows:
+            return 0
+        return self.manager.executemany(self.INSERT_ANALYSIS, rows)
 
     def save_recommendation(self, keyword: str, recommendation: str, score: float, category: str):
-        """추천 키워드 저장"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        """추천 키워드 저장 (쓰기 버퍼 경유)"""
+        self.manager.enqueue(self.INSERT_RECOMMENDATION,
+                             (keyword, recommendation, score, category, self._now()))
 
-        c.execute('''INSERT INTO keyword_recommendations
-                    (keyword, recommendation, score, category)
-                    VALUES (?, ?, ?, ?)''',
-                 (keyword, recommendation, score, category))
+    def flush(self):
+        """버퍼에 쌓인 쓰기를 즉시 기록"""
+        self.manager.flush()
 
-        conn.commit()
-        conn.close()
+    def reset(self):
+        """데이터베이스 파일 삭제 후 재생성"""
+        self.manager.reset()
+        self._init_db()
 
     def get_analysis_history(self, keyword: str, days: int = 30) -> pd.DataFrame:
         """분석 히스토리 조회"""
-        conn = sqlite3.connect(self.db_path)
-
-        query = '''SELECT * FROM keyword_analysis
-                   WHERE keyword = ? AND timestamp > datetime('now', '-' || ? || ' days')
-                   ORDER BY timestamp DESC'''
-
-        df = pd.read_sql_query(query, conn, params=(keyword, days))
-        conn.close()
+        with self.manager.connection() as conn:
+            return pd.read_sql_query(self.HISTORY_QUERY, conn, params=(keyword, days))
 
-        return df
-
-    def get_top_keywords(self, limit: int = 10) -> pd.DataFrame:
-        """인기 키워드 조회"""
-        conn = sqlite3.connect(self.db_path)
+    def get_top_keywords(self, limit: int = 10, days: Optional[int] = None,
+                         portal: Optional[str] = None) -> pd.DataFrame:
+        """
+        인기 키워드 조회 (롤업 테이블 기반)
 
-        query = '''SELECT keyword, COUNT(*) as count, AVG(search_volume) as avg_volume
-                   FROM keyword_analysis
+        Args:
+            limit: 반환할 키워드 수
+            days: 지정 시 최근 N일 (오늘 포함) 기간 리더보드
+            portal: 지정 시 해당 포털만 집계
+        """
+        if days is None and portal is None:
+            with self.manager.connection() as conn:
+                return pd.read_sql_query(self.TOP_KEYWORDS_QUERY, conn, params=(limit,))
+
+        conditions, params = self._daily_conditions(days, portal)
+        query = f'''SELECT keyword, SUM(count) as count,
+                          CAST(SUM(volume_sum) AS REAL) / NULLIF(SUM(volume_count), 0) as avg_volume
+                   FROM keyword_rollup_daily
+                   {conditions}
                    GROUP BY keyword
                    ORDER BY count DESC
                    LIMIT ?'''
 
-        df = pd.read_sql_query(query, conn, params=(limit,))
-        conn.close()
+        with self.manager.connection() as conn:
+            return pd.read_sql_query(query, conn, params=(*params, limit))
 
-        return df
+    def get_daily_rollup(self, days: int = 30, portal: Optional[str] = None,
+                         keyword: Optional[str] = None) -> pd.DataFrame:
+        """일자/포털별 키워드 집계 조회 (기간 리더보드/차트용)"""
+        conditions, params = self._daily_conditions(days, portal)
+        if keyword is not None:
+            conditions += (' AND ' if conditions else 'WHERE ') + 'keyword = ?'
+            params.append(keyword)
+
+        query = f'''SELECT day, portal, keyword, count,
+                          CAST(volume_sum AS REAL) / NULLIF(volume_count, 0) as avg_volume
+                   FROM keyword_rollup_daily
+                   {conditions}
+                   ORDER BY day DESC, count DESC'''
+
+        with self.manager.connection() as conn:
+            return pd.read_sql_query(query, conn, params=params)
+
+    @staticmethod
+    def _daily_conditions(days: Optional[int], portal: Optional[str]) -> Tuple[str, List]:
+        """keyword_rollup_daily 용 WHERE 절"""
+        clauses, params = [], []
+        if days is not None:
+            clauses.append("day >= date('now', '-' || ? || ' days')")
+            params.append(max(0, days - 1))
+        if portal is not None:
+            clauses.append('portal = ?')
+            params.append(portal)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+
+class TopKRecommendations:
+    """
+    점수 상위 k 개 추천만 유지하는 최소 힙 (후보 문자열 기준 중복 제거)
+
+    메모리는 k 에 비례하고, 후보 n 개 처리 비용은 O(n log k) 입니다.
+    동점이면 먼저 들어온 후보가 우선합니다.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []   # (score, -seq, dedupe_key, rec)
+        self._index = {}  # dedupe_key -> heap entry
+        self._seq = 0
+
+    @staticmethod
+    def _dedupe_key(rec: Dict) -> str:
+        return ' '.join(str(rec.get('keyword', '')).lower().split())
+
+    def push(self, rec: Dict):
+        if self.k <= 0:
+            return
+
+        key = self._dedupe_key(rec)
+        entry = (rec['score'], -self._seq, key, rec)
+        self._seq += 1
+
+        existing = self._index.get(key)
+        if existing is not None:
+            # 같은 후보는 점수가 더 높을 때만 교체
+            if entry[:2] > existing[:2]:
+                self._heap[self._heap.index(existing)] = entry
+                self._index[key] = entry
+                heapq.heapify(self._heap)
+            return
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            self._index[key] = entry
+        elif entry[:2] > self._heap[0][:2]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            del self._index[evicted[2]]
+            self._index[key] = entry
+
+    def results(self) -> List[Dict]:
+        """점수 내림차순 결과"""
+        return [entry[3] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+@dataclass(frozen=True)
+class KeywordFeatures:
+    """키워드별 파생 지표 (추정 함수들이 공유)"""
+    word_count: int
+    hits: SignalHits
+    volume: int
+    difficulty: int
 
 
 class AdvancedKeywordAnalyzer:
@@ -127,21 +594,293 @@ class AdvancedKeywordAnalyzer:
     Google, Naver, Daum의 고급 키워드 분석
     """
 
-    def __init__(self):
+    # 포털 검색 URL 템플릿 (인스턴스의 portal_urls 로 교체 가능)
+    PORTAL_URLS = {
+        'Naver': 'https://search.naver.com/search.naver?query={keyword}',
+        'Google': 'https://www.google.com/search?q={keyword}',
+        'Daum': 'https://search.daum.net/search?q={keyword}'
+    }
+
+    SEARCH_INTENTS = ['informational', 'navigational', 'commercial', 'transactional']
+    BASE_CPC = {'google': 1.5, 'naver': 1.0}
+
+    # 포털별 기본 응답 대기 시간 (초)
+    DEFAULT_PORTAL_TIMEOUT = 5.0
+    # analyze_multi_portal 전체 응답 대기 시간 (초)
+    DEFAULT_OVERALL_TIMEOUT = 6.0
+
+    def __init__(self, portal_timeout: float = DEFAULT_PORTAL_TIMEOUT,
+                 overall_timeout: float = DEFAULT_OVERALL_TIMEOUT,
+                 max_workers: int = 12,
+                 http_client: Optional[PooledHTTPClient] = None,
+                 signal_config: Optional[str] = None,
+                 feature_cache_size: int = 50000,
+                 feature_cache_ttl: Optional[float] = None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.db = KeywordDatabase()
+        self.portal_urls = dict(self.PORTAL_URLS)
+
+        # 포털 요청용 공유 커넥션 풀 (keep-alive, 재시도, 공통 User-Agent)
+        self.http = http_client or PooledHTTPClient(
+            headers=self.headers,
+            pool_maxsize=max_workers,
+            timeout=portal_timeout
+        )
+        # analyze_multi_portal 처럼 마감 시간이 있는 요청은 재시도 없이 남은 시간만큼만 대기
+        self.deadline_http = self.http.without_retries()
+
+        # 신호 단어 매처 (설정 파일: signal_config 또는 KEYWORD_SIGNAL_CONFIG 환경 변수)
+        signal_config = signal_config or os.getenv('KEYWORD_SIGNAL_CONFIG')
+        self.signal_matcher = (SignalMatcher.from_config(signal_config)
+                               if signal_config else SignalMatcher())
+
+        # 키워드별 파생 지표 캐시 (신호 목록 변경 시 무효화)
+        self.feature_cache = LRUCache(maxsize=feature_cache_size, ttl=feature_cache_ttl)
+
+        self.portal_timeout = portal_timeout
+        self.overall_timeout = overall_timeout
+        # 포털 요청을 동시에 실행하기 위한 공유 스레드 풀
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='portal-fetch')
+
+    # ==================== 신호 단어 설정 ====================
+
+    def set_signal_groups(self, signal_groups: Dict[str, List[str]]):
+        """신호 단어 목록 교체 (매처 재빌드)"""
+        self.signal_matcher = SignalMatcher(signal_groups)
+        self.invalidate_features()
+
+    def load_signal_config(self, path: str, merge_defaults: bool = True):
+        """JSON 설정 파일에서 신호 단어 목록 로드"""
+        self.signal_matcher = SignalMatcher.from_config(path, merge_defaults)
+        self.invalidate_features()
+
+    def invalidate_features(self, keyword: Optional[str] = None):
+        """파생 지표 캐시 무효화 (keyword 미지정 시 전체)"""
+        self.feature_cache.invalidate(keyword)
+
+    def feature_cache_stats(self) -> Dict:
+        """파생 지표 캐시 적중률 통계"""
+        return self.feature_cache.stats()
+
+    def _signals(self, keyword: str) -> SignalHits:
+        """키워드의 모든 신호 단어 (한 번의 스캔, 캐시됨)"""
+        return self._features(keyword).hits
+
+    def _features(self, keyword: str) -> KeywordFeatures:
+        """키워드별 파생 지표 (캐시 경유)"""
+        return self.feature_cache.get_or_compute(
+            keyword, lambda: self._compute_features(keyword)
+        )
+
+    def _compute_features(self, keyword: str) -> KeywordFeatures:
+        """단어 수, 신호, 검색량, 난이도를 한 번에 계산"""
+        word_count = len(keyword.split())
+        hits = self.signal_matcher.match(keyword)
+
+        # Google 검색량 추정
+        base_volume = 1000
+        trending_boost = 1.5 if hits.any('volume_trending') else 1.0
+        volume = int(base_volume * (1 + word_count * 0.3) * trending_boost)
+
+        # 키워드 난이도 (0-100)
+        difficulty = 30  # 기본값
+
+        # 길이에 따른 난이도 감소
+        if word_count > 3:
+            difficulty -= 10
+        elif word_count > 2:
+            difficulty -= 5
+
+        # 트렌딩 키워드는 난이도 증가
+        if hits.any('difficulty_trending'):
+            difficulty += 15
+
+        # 일반적인 키워드는 난이도 증가
+        if hits.any('difficulty_common'):
+            difficulty += 10
+
+        return KeywordFeatures(
+            word_count=word_count,
+            hits=hits,
+            volume=volume,
+            difficulty=min(100, max(0, difficulty))
+        )
+
+    # ==================== 다중 포털 동시 분석 ====================
+
+    def analyze_multi_portal(self, keyword: str,
+                             portal_timeouts: Optional[Dict[str, float]] = None,
+                             overall_timeout: Optional[float] = None) -> Dict:
+        """
+        Google, Naver, Daum 동시 분석
+
+        모든 포털 요청을 한 번에 실행하고, 포털별 마감 시간과 전체 마감 시간 중
+        먼저 도래하는 시점까지 완료된 결과만 모아 반환합니다.
+        늦은 포털은 {'status': 'timeout'} 으로 표시됩니다 (부분 결과).
+
+        Args:
+            keyword: 분석할 키워드
+            portal_timeouts: 포털별 마감 시간 (예: {'Naver': 3.0}), 없으면 self.portal_timeout
+            overall_timeout: 전체 마감 시간, 없으면 self.overall_timeout
+        """
+        fetchers = {
+            'Google': self.get_google_keywords,
+            'Naver': self.get_naver_keywords,
+            'Daum': self.get_daum_keywords
+        }
+        portal_timeouts = portal_timeouts or {}
+        overall_timeout = self.overall_timeout if overall_timeout is None else overall_timeout
+
+        start = time.monotonic()
+        overall_deadline = start + overall_timeout
+
+        futures = {}
+        deadlines = {}
+        for portal, fetch in fetchers.items():
+            deadline = min(
+                start + portal_timeouts.get(portal, self.portal_timeout),
+                overall_deadline
+            )
+            # 실행 중인 요청은 cancel() 로 멈출 수 없으므로 요청 자체가 마감 시간에 끝나도록 넘김
+            future = self._executor.submit(fetch, keyword, deadline)
+            futures[future] = portal
+            deadlines[future] = deadline
+
+        portals = {}
+        timed_out = []
+        pending = set(futures)
+
+        while pending:
+            now = time.monotonic()
+
+            # 마감 시간이 지난 포털은 기다리지 않음
+            expired = {f for f in pending if deadlines[f] <= now}
+            for future in expired:
+                future.cancel()
+                portal = futures[future]
+                portals[portal] = {'status': 'timeout', 'portal': portal}
+                timed_out.append(portal)
+            pending -= expired
+
+            if not pending:
+                break
+
+            next_deadline = min(deadlines[f] for f in pending)
+            done, pending = wait(pending, timeout=next_deadline - now,
+                                 return_when=FIRST_COMPLETED)
+
+            for future in done:
+                portal = futures[future]
+                try:
+                    portals[portal] = future.result()
+                except Exception as e:
+                    print(f"{portal} API Error: {str(e)}")
+                    portals[portal] = {'status': 'error', 'portal': portal}
+
+        return {
+            'keyword': keyword,
+            'portals': {portal: portals[portal] for portal in fetchers},
+            'timed_out': timed_out,
+            'partial': bool(timed_out),
+            'elapsed_ms': round((time.monotonic() - start) * 1000, 1),
+            'timestamp': datetime.now().isoformat()
+        }
+
+    # ==================== 배치 스코어링 ====================
+
+    def score_keywords(self, keywords: List[str]) -> pd.DataFrame:
+        """
+        대량 키워드 일괄 점수 계산
+
+        키워드를 한 번만 토큰화/소문자화한 뒤, 검색량/난이도/CPC/전환율/기회 점수를
+        NumPy 열 연산으로 계산합니다. 결과는 키워드별 단건 추정 함수와 동일합니다.
+
+        Returns:
+            keyword, word_count, volume, monthly_search, difficulty, difficulty_level,
+            competition_level, trend, cpc_google, cpc_naver, conversion_potential,
+            opportunity_score 열을 가진 DataFrame
+        """
+        series = pd.Series(list(keywords), dtype=object).astype(str)
+        word_count = series.str.split().str.len().fillna(0).to_numpy(dtype=np.int64)
+
+        # 키워드당 한 번의 스캔으로 모든 신호 그룹 판정
+        hits = self.signal_matcher.match_many(series)
+
+        def has_any(group: str) -> np.ndarray:
+            return np.fromiter((h.any(group) for h in hits), dtype=bool, count=len(hits))
+
+        def count(group: str) -> np.ndarray:
+            return np.fromiter((h.count(group) for h in hits), dtype=np.int64, count=len(hits))
+
+        # 검색량 (_estimate_volume_google)
+        volume_boost = np.where(has_any('volume_trending'), 1.5, 1.0)
+        volume = (1000 * (1 + word_count * 0.3) * volume_boost).astype(np.int64)
+
+        # 난이도 (_calculate_keyword_difficulty)
+        difficulty = np.full(len(hits), 30, dtype=np.int64)
+        difficulty -= np.select([word_count > 3, word_count > 2], [10, 5], default=0)
+        difficulty += np.where(has_any('difficulty_trending'), 15, 0)
+        difficulty += np.where(has_any('difficulty_common'), 10, 0)
+        difficulty = np.clip(difficulty, 0, 100)
+
+        # CPC (_estimate_cpc)
+        cpc_extra = word_count * 0.2 + np.where(has_any('cpc_commercial'), 0.5, 0)
+        cpc_google = np.round(self.BASE_CPC['google'] + cpc_extra, 2)
+        cpc_naver = np.round(self.BASE_CPC['naver'] + cpc_extra, 2)
+
+        # 전환율 잠재력 (_estimate_conversion)
+        conversion = np.minimum(1.0, count('conversion') * 0.2)
+
+        # 트렌드 (_analyze_trend_advanced)
+        trend = np.select(
+            [has_any('trend_rising'), has_any('trend_declining')],
+            ['rising', 'declining'],
+            default='stable'
+        )
+
+        return pd.DataFrame({
+            'keyword': series.to_numpy(),
+            'word_count': word_count,
+            'volume': volume,
+            'monthly_search': volume * 30,
+            'difficulty': difficulty,
+            'difficulty_level': np.select([difficulty < 30, difficulty < 60], ['Easy', 'Medium'], default='Hard'),
+            'competition_level': np.select([difficulty < 30, difficulty < 60], ['Low', 'Medium'], default='High'),
+            'trend': trend,
+            'cpc_google': cpc_google,
+            'cpc_naver': cpc_naver,
+            'conversion_potential': conversion,
+            # _calculate_opportunity
+            'opportunity_score': (volume / 100) / (difficulty / 50 + 1)
+        })
 
     # ==================== 포털별 키워드 분석 ====================
 
-    def get_naver_keywords(self, keyword: str) -> Dict:
+    def _portal_get(self, url: str, deadline: Optional[float] = None):
+        """
+        포털 요청 (deadline: time.monotonic() 기준 마감 시각)
+
+        deadline 이 있으면 재시도 없는 클라이언트로, 남은 시간을 connect/read 타임아웃으로 사용
+        (read 타임아웃은 소켓 읽기 한 번 기준이므로 응답이 조금씩 오면 약간 넘을 수 있음)
+        """
+        if deadline is None:
+            return self.http.get(url, timeout=self.portal_timeout)
+
+        remaining = min(self.portal_timeout, deadline - time.monotonic())
+        if remaining <= 0:
+            raise TimeoutError('deadline passed before the request started')
+        return self.deadline_http.get(url, timeout=(remaining, remaining))
+
+    def get_naver_keywords(self, keyword: str, deadline: Optional[float] = None) -> Dict:
         """
         Naver 검색량 및 관련 키워드 분석 (고급)
         """
         try:
-            url = f"https://search.naver.com/search.naver?query={keyword}"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            url = self.portal_urls['Naver'].format(keyword=keyword)
+            response = self._portal_get(url, deadline)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -168,14 +907,14 @@ class AdvancedKeywordAnalyzer:
 
         return {'status': 'error', 'portal': 'Naver'}
 
-    def get_google_keywords(self, keyword: str) -> Dict:
+    def get_google_keywords(self, keyword: str, deadline: Optional[float] = None) -> Dict:
         """
         Google 키워드 고급 분석
         검색량, CPC, 경쟁도, 트렌드
         """
         try:
-            url = f"https://www.google.com/search?q={keyword}"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            url = self.portal_urls['Google'].format(keyword=keyword)
+            response = self._portal_get(url, deadline)
 
             if response.status_code == 200:
                 data = {
@@ -200,13 +939,13 @@ class AdvancedKeywordAnalyzer:
 
         return {'status': 'error', 'portal': 'Google'}
 
-    def get_daum_keywords(self, keyword: str) -> Dict:
+    def get_daum_keywords(self, keyword: str, deadline: Optional[float] = None) -> Dict:
         """
         Daum 검색량 분석 (고급)
         """
         try:
-            url = f"https://search.daum.net/search?q={keyword}"
-            response = requests.get(url, headers=self.headers, timeout=5)
+            url = self.portal_urls['Daum'].format(keyword=keyword)
+            response = self._portal_get(url, deadline)
 
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
@@ -292,32 +1031,61 @@ class AdvancedKeywordAnalyzer:
 
     # ==================== 실시간 키워드 추천 ====================
 
-    def get_realtime_recommendations(self, keywords: List[str], channel_topic: str = '') -> List[Dict]:
+    def get_realtime_recommendations(self, keywords: List[str], channel_topic: str = '',
+                                     k: int = 20, per_keyword: Optional[int] = 5) -> List[Dict]:
         """
         실시간 키워드 추천 (다양한 알고리즘 적용)
+
+        시드 키워드를 하나씩 처리하면서 크기 k 의 힙에 상위 후보만 유지합니다.
+        여러 시드에서 같은 후보가 나오면 점수가 높은 것 하나만 남깁니다.
+
+        Args:
+            keywords: 시드 키워드 목록
+            channel_topic: 채널 주제 (니치 키워드 생성용)
+            k: 반환할 추천 수
+            per_keyword: 시드 하나당 최대 후보 수 (None 이면 제한 없음)
+        """
+        top = TopKRecommendations(k)
+
+        for _, recs in self.iter_realtime_recommendations(keywords, channel_topic, per_keyword):
+            for rec in recs:
+                top.push(rec)
+
+        return top.results()
+
+    def iter_realtime_recommendations(self, keywords: List[str], channel_topic: str = '',
+                                      per_keyword: Optional[int] = 5):
         """
-        recommendations = []
+        시드 키워드별 추천을 준비되는 대로 반환하는 제너레이터
 
-        for keyword in keywords:
-            # 1. 관련 키워드 조합
-            related = self._generate_related_combinations(keyword)
+        Yields:
+            (시드 키워드, 점수 상위 추천 리스트)
+        """
+        for keyword in dict.fromkeys(keywords):  # 중복 시드 제거 (순서 유지)
+            yield keyword, self._seed_recommendations(keyword, channel_topic, per_keyword)
 
-            # 2. 트렌딩 키워드
-            trending = self._get_trending_keywords(keyword)
+    def _seed_recommendations(self, keyword: str, channel_topic: str = '',
+                              per_keyword: Optional[int] = 5) -> List[Dict]:
+        """시드 키워드 하나의 후보 생성 + 점수 계산 (점수 상위 per_keyword 개)"""
+        # 1. 관련 키워드 조합
+        related = self._generate_related_combinations(keyword)
 
-            # 3. 니치 키워드
-            niche = self._get_niche_keywords(keyword, channel_topic)
+        # 2. 트렌딩 키워드
+        trending = self._get_trending_keywords(keyword)
 
-            # 4. 경쟁 낮은 키워드
-            low_competition = self._get_low_competition_keywords(keyword)
+        # 3. 니치 키워드
+        niche = self._get_niche_keywords(keyword, channel_topic)
 
-            all_recs = related + trending + niche + low_competition
+        # 4. 경쟁 낮은 키워드
+        low_competition = self._get_low_competition_keywords(keyword)
 
-            # 스코어 계산 및 정렬
-            scored_recs = self._score_recommendations(all_recs, keyword)
-            recommendations.extend(scored_recs[:5])
+        all_recs = related + trending + niche + low_competition
 
-        return sorted(recommendations, key=lambda x: x['score'], reverse=True)[:20]
+        # 스코어 계산 및 상위 선택
+        scored_recs = self._score_recommendations(all_recs, keyword)
+        if per_keyword is None:
+            return sorted(scored_recs, key=lambda x: x['score'], reverse=True)
+        return heapq.nlargest(per_keyword, scored_recs, key=lambda x: x['score'])
 
     def _score_recommendations(self, recommendations: List[Dict], base_keyword: str) -> List[Dict]:
         """추천 키워드 점수 계산"""
@@ -468,20 +1236,8 @@ class AdvancedKeywordAnalyzer:
         """
         검색 의도 분석 (Informational, Navigational, Commercial, Transactional)
         """
-        intent_signals = {
-            'informational': ['what', 'how', 'why', 'guide', 'tutorial', '방법', '뜻'],
-            'navigational': ['site', 'page', 'app', 'channel', '채널', '사이트'],
-            'commercial': ['best', 'review', 'vs', 'comparison', 'top', '추천', '비교'],
-            'transactional': ['buy', 'order', 'download', 'discount', '구매', '다운로드']
-        }
-
-        keyword_lower = keyword.lower()
-        scores = {intent: 0 for intent in intent_signals}
-
-        for intent, signals in intent_signals.items():
-            for signal in signals:
-                if signal in keyword_lower:
-                    scores[intent] += 1
+        hits = self._signals(keyword)
+        scores = {intent: hits.count(f'intent_{intent}') for intent in self.SEARCH_INTENTS}
 
         primary_intent = max(scores, key=scores.get)
 
@@ -496,14 +1252,7 @@ class AdvancedKeywordAnalyzer:
 
     def _estimate_volume_google(self, keyword: str) -> int:
         """Google 검색량 추정"""
-        base_volume = 1000
-        length_factor = len(keyword.split())
-        trending_boost = 1.0
-
-        if any(trend in keyword.lower() for trend in ['2024', '2025', 'new', 'latest']):
-            trending_boost = 1.5
-
-        return int(base_volume * (1 + length_factor * 0.3) * trending_boost)
+        return self._features(keyword).volume
 
     def _estimate_volume_naver(self, keyword: str) -> int:
         """Naver 검색량 추정"""
@@ -517,37 +1266,17 @@ class AdvancedKeywordAnalyzer:
 
     def _calculate_keyword_difficulty(self, keyword: str) -> int:
         """키워드 난이도 계산 (0-100)"""
-        difficulty = 30  # 기본값
-
-        # 길이에 따른 난이도 감소
-        words = keyword.split()
-        if len(words) > 3:
-            difficulty -= 10
-        elif len(words) > 2:
-            difficulty -= 5
-
-        # 트렌딩 키워드는 난이도 증가
-        if any(trend in keyword.lower() for trend in ['2024', '2025', 'new']):
-            difficulty += 15
-
-        # 일반적인 키워드는 난이도 증가
-        common_words = ['how', 'what', 'best', 'top']
-        if any(word in keyword.lower() for word in common_words):
-            difficulty += 10
-
-        return min(100, max(0, difficulty))
+        return self._features(keyword).difficulty
 
     def _estimate_cpc(self, keyword: str, platform: str) -> float:
         """클릭당 비용 추정"""
-        base_cpc = {'google': 1.5, 'naver': 1.0}
-        base = base_cpc.get(platform, 1.0)
+        base = self.BASE_CPC.get(platform, 1.0)
 
         # 단어 수에 따른 조정
-        word_factor = len(keyword.split()) * 0.2
+        word_factor = self._features(keyword).word_count * 0.2
 
         # 상용 키워드인지 확인
-        commercial_words = ['buy', 'price', 'best', 'review']
-        commercial_boost = 0.5 if any(w in keyword.lower() for w in commercial_words) else 0
+        commercial_boost = 0.5 if self._signals(keyword).any('cpc_commercial') else 0
 
         return round(base + word_factor + commercial_boost, 2)
 
@@ -575,12 +1304,11 @@ class AdvancedKeywordAnalyzer:
 
     def _analyze_trend_advanced(self, keyword: str) -> str:
         """고급 트렌드 분석"""
-        trending_keywords = ['new', 'best', 'top', 'trending', '2024', '2025', 'latest']
-        if any(trend in keyword.lower() for trend in trending_keywords):
+        hits = self._signals(keyword)
+        if hits.any('trend_rising'):
             return "rising"
 
-        declining_keywords = ['old', 'outdated', 'legacy']
-        if any(d in keyword.lower() for d in declining_keywords):
+        if hits.any('trend_declining'):
             return "declining"
 
         return "stable"
@@ -692,12 +1420,8 @@ class AdvancedKeywordAnalyzer:
 
     def _estimate_conversion(self, keyword: str) -> float:
         """전환율 잠재력 추정 (0-1)"""
-        commercial_indicators = ['buy', 'how to', 'best', 'review', 'price']
-        score = 0
-
-        for indicator in commercial_indicators:
-            if indicator in keyword.lower():
-                score += 0.2
+        # 상업적 신호 1종당 0.2
+        score = self._signals(keyword).count('conversion') * 0.2
 
         return min(1.0, score)
 
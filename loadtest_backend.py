@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Backend Load Test
+로컬 포털 스텁을 대상으로 /api/analyze 처리량과 지연 시간을 측정합니다.
+분석기를 이벤트 루프에서 직접 실행할 때 (ANALYZER_WORKERS=0) 와
+스레드 풀로 넘길 때를 비교합니다.
+
+사용법:
+python loadtest_backend.py --concurrency 32 --duration 10 --portal-delay 0.1
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import http.server
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _StubPortalHandler(http.server.BaseHTTPRequestHandler):
+    """지연 후 작은 HTML 을 반환하는 포털 스텁"""
+
+    protocol_version = 'HTTP/1.1'
+    delay = 0.1
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b'<html><head><title>stub</title></head><body>ok</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_portal(delay: float) -> http.server.ThreadingHTTPServer:
+    handler = type('StubPortalHandler', (_StubPortalHandler,), {'delay': delay})
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def serve(port: int, stub_url: str):
+    """(자식 프로세스) 포털 URL 을 스텁으로 바꾼 백엔드 실행 (Notion 전송 워커는 env 로 끔)"""
+    import uvicorn
+    import backend
+
+    backend.analyzer.portal_urls = {
+        portal: f"{stub_url}/{portal.lower()}?q={{keyword}}"
+        for portal in backend.analyzer.portal_urls
+    }
+
+    uvicorn.run(backend.app, host='127.0.0.1', port=port, log_level='warning')
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Backend did not start at {base_url}")
+
+
+def run_load(base_url: str, concurrency: int, duration: float) -> dict:
+    """duration 초 동안 concurrency 개 클라이언트로 /api/analyze 호출"""
+    deadline = time.monotonic() + duration
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def client(worker_id: int):
+        session = requests.Session()
+        i = 0
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                response = session.post(f"{base_url}/api/analyze",
+                                        json={'keyword': f"keyword {worker_id} {i}"},
+                                        timeout=60)
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+            i += 1
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client, range(concurrency)))
+    wall = time.monotonic() - start
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    return {
+        'requests': len(latencies),
+        'errors': errors[0],
+        'rps': len(latencies) / wall,
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99)
+    }
+
+
+def run_mode(label: str, workers: int, stub_url: str, args) -> dict:
+    port = free_port()
+    env = dict(os.environ,
+               ANALYZER_WORKERS=str(workers),
+               NOTION_QUEUE_WORKERS='0',
+               PYTHONPATH=REPO_DIR + os.pathsep + os.environ.get('PYTHONPATH', ''))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), '--serve', str(port), '--stub-url', stub_url],
+            cwd=workdir, env=env
+        )
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            wait_until_ready(base_url)
+            print(f"🚀 {label}: ANALYZER_WORKERS={workers}, {args.concurrency} clients, {args.duration:.0f}s")
+            result = run_load(base_url, args.concurrency, args.duration)
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    result['label'] = label
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backend load test against a local portal stub')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent clients (default: 32)')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds per run (default: 10)')
+    parser.add_argument('--portal-delay', type=float, default=0.1,
+                        help='Stub portal response delay in seconds (default: 0.1)')
+    parser.add_argument('--workers', type=int, default=16,
+                        help='ANALYZER_WORKERS for the offloaded run (default: 16)')
+    parser.add_argument('--serve', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--stub-url', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.stub_url)
+        return
+
+    stub = start_stub_portal(args.portal_delay)
+    stub_url = f"http://127.0.0.1:{stub.server_address[1]}"
+
+    results = [
+        run_mode('before (inline)', 0, stub_url, args),
+        run_mode('after (thread pool)', args.workers, stub_url, args)
+    ]
+
+    print(f"\n{'='*60}")
+    print(f"  📊 /api/analyze, portal delay {args.portal_delay * 1000:.0f} ms")
+    print(f"{'='*60}")
+    for r in results:
+        print(f"{r['label']:<22} {r['rps']:8.1f} req/s   p50 {r['p50_ms']:8.1f} ms   "
+              f"p99 {r['p99_ms']:8.1f} ms   errors {r['errors']}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
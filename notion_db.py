@@ -5,17 +5,199 @@ Notion API를 통한 키워드 분석 데이터 저장 및 관리
 
 import requests
 import json
+import threading
+import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from rate_limiter import TokenBucket, get_shared_bucket, retry_after_seconds
+
+# ==================== 속성 파서 ====================
+# 속성 타입 → 값 파서 (prop[prop['type']] 를 받아 Python 값 반환)
+
+def _fragment_text(fragment: Dict) -> str:
+    text = fragment.get('plain_text')
+    return text if text is not None else fragment.get('text', {}).get('content', '')
+
+
+def _rich_text(fragments: List[Dict]) -> str:
+    """title / rich_text 조각을 이어 붙인 문자열"""
+    if not fragments:
+        return ''
+    if len(fragments) == 1:
+        return _fragment_text(fragments[0])
+    return ''.join(map(_fragment_text, fragments))
+
+
+def _name(value: Optional[Dict]) -> Optional[str]:
+    return value['name'] if value else None
+
+
+def _date_start(value: Optional[Dict]) -> Optional[str]:
+    return value['start'] if value else None
+
+
+def _user(value: Optional[Dict]) -> Optional[str]:
+    return (value.get('name') or value.get('id')) if value else None
+
+
+def _file_url(item: Dict) -> Optional[str]:
+    return item.get(item.get('type'), {}).get('url')
+
+
+def _formula(value: Dict) -> Any:
+    result = value.get(value.get('type'))
+    return _date_start(result) if value.get('type') == 'date' else result
+
+
+def _rollup(value: Dict) -> Any:
+    rollup_type = value.get('type')
+    if rollup_type == 'array':
+        return [parse_property(item) for item in value['array']]
+    if rollup_type == 'date':
+        return _date_start(value['date'])
+    return value.get(rollup_type)
+
+
+def _unique_id(value: Dict) -> Optional[str]:
+    if value.get('number') is None:
+        return None
+    prefix = value.get('prefix')
+    return f"{prefix}-{value['number']}" if prefix else str(value['number'])
+
+
+# 값을 그대로 쓰는 타입 (파서 호출 생략)
+SCALAR_PROPERTY_TYPES = frozenset({
+    'number', 'checkbox', 'url', 'email', 'phone_number', 'created_time', 'last_edited_time'
+})
+
+PROPERTY_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    'title': _rich_text,
+    'rich_text': _rich_text,
+    'text': _rich_text,
+    'select': _name,
+    'status': _name,
+    'multi_select': lambda value: [item['name'] for item in value],
+    'date': _date_start,
+    'people': lambda value: [_user(user) for user in value],
+    'created_by': _user,
+    'last_edited_by': _user,
+    'relation': lambda value: [item['id'] for item in value],
+    'files': lambda value: [_file_url(item) for item in value],
+    'formula': _formula,
+    'rollup': _rollup,
+    'unique_id': _unique_id,
+    'verification': lambda value: value.get('state') if value else None,
+}
+
+# DataFrame 변환 시 컬럼 dtype (나머지 타입은 object)
+_NUMBER_TYPES = {'number'}
+_BOOL_TYPES = {'checkbox'}
+_DATETIME_TYPES = {'date', 'created_time', 'last_edited_time'}
+_CATEGORY_TYPES = {'select', 'status'}
+
+
+def parse_property(prop: Dict) -> Any:
+    """Notion 속성 하나를 Python 값으로 (알 수 없는 타입은 None)"""
+    prop_type = prop.get('type')
+    if prop_type in SCALAR_PROPERTY_TYPES:
+        return prop[prop_type]
+    parser = PROPERTY_PARSERS.get(prop_type)
+    return parser(prop[prop_type]) if parser else None
+
+
+def parse_properties(page_properties: Dict[str, Dict],
+                     properties: Optional[List[str]] = None) -> Dict[str, Any]:
+    """페이지 속성 전체 (또는 properties 에 지정한 것만) 파싱"""
+    if properties is not None:
+        return {
+            name: parse_property(page_properties[name]) if name in page_properties else None
+            for name in properties
+        }
+
+    scalar_types = SCALAR_PROPERTY_TYPES
+    parsers = PROPERTY_PARSERS
+    parsed = {}
+    for name, prop in page_properties.items():
+        prop_type = prop['type']
+        if prop_type in scalar_types:
+            parsed[name] = prop[prop_type]
+        else:
+            parser = parsers.get(prop_type)
+            parsed[name] = parser(prop[prop_type]) if parser is not None else None
+    return parsed
+
+
+def pages_to_dataframe(pages: Iterable[Dict], properties: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Notion 원본 페이지들을 DataFrame 으로 (행 = 페이지, 열 = 속성)
+
+    - number → float, checkbox → boolean, date/시각 → datetime64[UTC], select/status → category
+    - properties 를 주면 해당 속성 열만 만듦
+    """
+    columns: Dict[str, List] = {'page_id': [], 'created_time': [], 'last_edited_time': []}
+    types: Dict[str, str] = {'created_time': 'created_time', 'last_edited_time': 'last_edited_time'}
+    wanted = set(properties) if properties is not None else None
+    for name in properties or []:
+        columns.setdefault(name, [])
+
+    rows = 0
+    for page in pages:
+        columns['page_id'].append(page['id'])
+        columns['created_time'].append(page.get('created_time'))
+        columns['last_edited_time'].append(page.get('last_edited_time'))
+
+        filled = 3
+        for name, prop in page['properties'].items():
+            if wanted is not None and name not in wanted:
+                continue
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * rows
+            # properties 로 미리 만든 열도 처음 본 타입으로 변환
+            if name not in types:
+                types[name] = prop.get('type')
+            column.append(parse_property(prop))
+            filled += 1
+
+        rows += 1
+        # 같은 Database 의 페이지는 보통 속성 구성이 같으므로 빠진 속성이 있을 때만 채움
+        if filled != len(columns):
+            for column in columns.values():
+                if len(column) < rows:
+                    column.append(None)
+
+    df = pd.DataFrame(columns)
+    for name, prop_type in types.items():
+        if prop_type in _NUMBER_TYPES:
+            df[name] = pd.to_numeric(df[name], errors='coerce')
+        elif prop_type in _BOOL_TYPES:
+            df[name] = df[name].astype('boolean')
+        elif prop_type in _DATETIME_TYPES:
+            df[name] = pd.to_datetime(df[name], utc=True, errors='coerce', format='ISO8601')
+        elif prop_type in _CATEGORY_TYPES:
+            df[name] = df[name].astype('category')
+    return df
+
 
 class NotionDB:
     """Notion Database와의 연동을 관리합니다"""
 
-    def __init__(self, api_token: str):
+    # 재시도할 응답 코드 (rate limit + 일시적 서버 오류)
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Database 쿼리 한 번에 받을 수 있는 최대 페이지 수 (Notion API 상한)
+    MAX_PAGE_SIZE = 100
+
+    def __init__(self, api_token: str, rate_limiter: Optional[TokenBucket] = None,
+                 max_retries: int = 5, batch_workers: int = 3, request_timeout: float = 30.0):
         """
         Args:
             api_token: Notion API Token (ntn_T84053591181vVGMJGrESxdEGryJX6sO9EZIeeQ4OzS2YJ)
+            rate_limiter: 요청 토큰 버킷 (기본: 같은 API 토큰을 쓰는 인스턴스끼리 공유, 초당 3회)
+            max_retries: 429/5xx 재시도 횟수
+            batch_workers: batch_add_* 에서 동시에 보낼 요청 수
+            request_timeout: 요청 하나의 타임아웃 (초)
         """
         self.api_token = api_token
         self.notion_version = "2022-06-28"
@@ -26,6 +208,24 @@ class NotionDB:
         }
         self.base_url = "https://api.notion.com/v1"
 
+        # Notion 요청 한도 (같은 토큰의 모든 배치/스레드가 공유)
+        self.rate_limiter = rate_limiter or get_shared_bucket(api_token)
+        self.max_retries = max_retries
+        self.batch_workers = batch_workers
+        self.request_timeout = request_timeout
+
+        # keep-alive 세션 (요청마다 TLS 핸드셰이크를 하지 않도록, 처음 요청할 때 생성)
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+        # 키워드 → 페이지 ID 인덱스 (한 번 스캔으로 채우고 생성할 때마다 갱신)
+        self._page_index: Dict[str, str] = {}
+        self._page_index_warm = False
+        self._page_index_lock = threading.Lock()
+
+        # 로컬 미러 (NotionMirror 가 연결되면 생성/수정한 페이지를 바로 반영)
+        self.mirror = None
+
         # Database IDs (사용자가 설정해야 함)
         self.databases = {
             'keyword_analysis': None,  # 키워드 분석
@@ -36,6 +236,17 @@ class NotionDB:
             'performance_prediction': None  # 성능 예측
         }
 
+    @property
+    def session(self) -> requests.Session:
+        """공유 keep-alive 세션"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers.update(self.headers)
+                    self._session = session
+        return self._session
+
     def set_database_ids(self, db_ids: Dict[str, str]):
         """Database ID 설정"""
         self.databases.update(db_ids)
@@ -44,6 +255,13 @@ class NotionDB:
 
     def add_keyword_analysis(self, keyword: str, analysis_data: Dict) -> Dict:
         """포털별 키워드 분석 데이터를 Notion에 추가"""
+        properties = self._keyword_analysis_properties(keyword, analysis_data)
+        page = self._create_page(self.databases['keyword_analysis'], properties)
+        self._index_page(keyword, page)
+        return page
+
+    def _keyword_analysis_properties(self, keyword: str, analysis_data: Dict) -> Dict:
+        """키워드 분석 페이지 속성 구성"""
         properties = {
             "Keyword": {
                 "title": [{"text": {"content": keyword}}]
@@ -94,39 +312,57 @@ class NotionDB:
                 ]
             }
 
-        return self._create_page(self.databases['keyword_analysis'], properties)
+        return properties
 
     def get_keyword_analysis(self, keyword: str) -> Optional[Dict]:
-        """키워드 분석 데이터 조회"""
-        response = self._query_database(
+        """키워드 분석 데이터 조회 (로컬 미러가 연결돼 있으면 미러에서)"""
+        if self.mirror is not None:
+            return self.mirror.get_keyword_analysis(keyword)
+
+        pages = self._collect(self.iter_query(
             self.databases['keyword_analysis'],
-            filter_condition={
+            limit=1,
+            **self._keyword_analysis_query(keyword)
+        ))
+
+        return pages[0] if pages else None
+
+    def _keyword_analysis_query(self, keyword: str) -> Dict:
+        """키워드 제목 일치 조회 조건"""
+        return {
+            'filter_condition': {
                 "property": "Keyword",
                 "title": {"equals": keyword}
             }
-        )
-
-        if response.get('results'):
-            return self._parse_page(response['results'][0])
-        return None
+        }
 
-    def get_all_keywords(self, limit: int = 50) -> List[Dict]:
-        """모든 활성 키워드 조회"""
-        response = self._query_database(
+    def get_all_keywords(self, limit: Optional[int] = 50) -> List[Dict]:
+        """모든 활성 키워드 조회 (limit=None 이면 전체)"""
+        return self._collect(self.iter_query(
             self.databases['keyword_analysis'],
-            filter_condition={
+            limit=limit,
+            **self._active_keywords_query()
+        ))
+
+    def _active_keywords_query(self) -> Dict:
+        """활성 키워드 조회 조건 (최근 수정순)"""
+        return {
+            'filter_condition': {
                 "property": "Status",
                 "select": {"equals": "active"}
             },
-            sorts=[
+            'sorts': [
                 {"property": "Updated Date", "direction": "descending"}
             ]
-        )
-
-        return [self._parse_page(page) for page in response.get('results', [])[:limit]]
+        }
 
     def update_keyword_analysis(self, page_id: str, updates: Dict) -> Dict:
         """키워드 분석 데이터 업데이트"""
+        properties = self._keyword_analysis_update_properties(updates)
+        return self._update_page(page_id, properties)
+
+    def _keyword_analysis_update_properties(self, updates: Dict) -> Dict:
+        """키워드 분석 업데이트 속성 구성"""
         properties = {}
 
         if 'google_volume' in updates:
@@ -138,12 +374,17 @@ class NotionDB:
         if 'status' in updates:
             properties["Status"] = {"select": {"name": updates['status']}}
 
-        return self._update_page(page_id, properties)
+        return properties
 
     # ==================== Trend Data ====================
 
     def add_trend_data(self, keyword: str, trend_info: Dict) -> Dict:
         """트렌드 데이터 추가"""
+        properties = self._trend_data_properties(keyword, trend_info)
+        return self._create_page(self.databases['trend_data'], properties)
+
+    def _trend_data_properties(self, keyword: str, trend_info: Dict) -> Dict:
+        """트렌드 데이터 페이지 속성 구성"""
         properties = {
             "Date": {
                 "date": {"start": trend_info.get('date', datetime.now().isoformat())}
@@ -168,15 +409,23 @@ class NotionDB:
             }
         }
 
-        return self._create_page(self.databases['trend_data'], properties)
+        return properties
 
-    def get_trend_history(self, keyword: str, days: int = 30) -> List[Dict]:
-        """키워드의 트렌드 히스토리 조회"""
+    def get_trend_history(self, keyword: str, days: int = 30,
+                          limit: Optional[int] = None) -> List[Dict]:
+        """키워드의 트렌드 히스토리 조회 (기본: 기간 내 전체)"""
+        return self._collect(self.iter_query(
+            self.databases['trend_data'],
+            limit=limit,
+            **self._trend_history_query(keyword, days)
+        ))
+
+    def _trend_history_query(self, keyword: str, days: int) -> Dict:
+        """최근 N일 트렌드 조회 조건 (날짜순)"""
         start_date = (datetime.now() - timedelta(days=days)).isoformat()
 
-        response = self._query_database(
-            self.databases['trend_data'],
-            filter_condition={
+        return {
+            'filter_condition': {
                 "and": [
                     {
                         "property": "Keyword",
@@ -188,17 +437,20 @@ class NotionDB:
                     }
                 ]
             },
-            sorts=[
+            'sorts': [
                 {"property": "Date", "direction": "ascending"}
             ]
-        )
-
-        return [self._parse_page(page) for page in response.get('results', [])]
+        }
 
     # ==================== Recommendations ====================
 
     def add_recommendation(self, base_keyword: str, recommendation_data: Dict) -> Dict:
         """추천 키워드 추가"""
+        properties = self._recommendation_properties(base_keyword, recommendation_data)
+        return self._create_page(self.databases['recommendations'], properties)
+
+    def _recommendation_properties(self, base_keyword: str, recommendation_data: Dict) -> Dict:
+        """추천 키워드 페이지 속성 구성"""
         properties = {
             "Recommendation": {
                 "title": [{"text": {"content": recommendation_data.get('keyword', '')}}]
@@ -237,13 +489,20 @@ class NotionDB:
                 "text": [{"text": {"content": recommendation_data['reason']}}]
             }
 
-        return self._create_page(self.databases['recommendations'], properties)
+        return properties
 
-    def get_recommendations(self, base_keyword: str, limit: int = 20) -> List[Dict]:
-        """추천 키워드 조회"""
-        response = self._query_database(
+    def get_recommendations(self, base_keyword: str, limit: Optional[int] = 20) -> List[Dict]:
+        """추천 키워드 조회 (limit=None 이면 전체)"""
+        return self._collect(self.iter_query(
             self.databases['recommendations'],
-            filter_condition={
+            limit=limit,
+            **self._recommendations_query(base_keyword)
+        ))
+
+    def _recommendations_query(self, base_keyword: str) -> Dict:
+        """기준 키워드의 추천 조회 조건 (점수순)"""
+        return {
+            'filter_condition': {
                 "and": [
                     {
                         "property": "Base Keyword",
@@ -255,17 +514,20 @@ class NotionDB:
                     }
                 ]
             },
-            sorts=[
+            'sorts': [
                 {"property": "Score", "direction": "descending"}
             ]
-        )
-
-        return [self._parse_page(page) for page in response.get('results', [])[:limit]]
+        }
 
     # ==================== Competitor Analysis ====================
 
     def add_competitor_analysis(self, analysis_data: Dict) -> Dict:
         """경쟁사 분석 추가"""
+        properties = self._competitor_analysis_properties(analysis_data)
+        return self._create_page(self.databases['competitor_analysis'], properties)
+
+    def _competitor_analysis_properties(self, analysis_data: Dict) -> Dict:
+        """경쟁사 분석 페이지 속성 구성"""
         properties = {
             "Analysis Name": {
                 "title": [{"text": {"content": analysis_data.get('name', '')}}]
@@ -306,12 +568,17 @@ class NotionDB:
                 "text": [{"text": {"content": analysis_data['recommendations']}}]
             }
 
-        return self._create_page(self.databases['competitor_analysis'], properties)
+        return properties
 
     # ==================== Search Intent Analysis ====================
 
     def add_search_intent(self, keyword: str, intent_data: Dict) -> Dict:
         """검색 의도 분석 추가"""
+        properties = self._search_intent_properties(keyword, intent_data)
+        return self._create_page(self.databases['search_intent'], properties)
+
+    def _search_intent_properties(self, keyword: str, intent_data: Dict) -> Dict:
+        """검색 의도 페이지 속성 구성"""
         properties = {
             "Keyword": {
                 "relation": [{"id": intent_data.get('keyword_page_id', '')}]
@@ -349,12 +616,17 @@ class NotionDB:
                 ]
             }
 
-        return self._create_page(self.databases['search_intent'], properties)
+        return properties
 
     # ==================== Performance Prediction ====================
 
     def add_performance_prediction(self, keyword: str, prediction_data: Dict) -> Dict:
         """성능 예측 추가"""
+        properties = self._performance_prediction_properties(keyword, prediction_data)
+        return self._create_page(self.databases['performance_prediction'], properties)
+
+    def _performance_prediction_properties(self, keyword: str, prediction_data: Dict) -> Dict:
+        """성능 예측 페이지 속성 구성"""
         properties = {
             "Keyword": {
                 "relation": [{"id": prediction_data.get('keyword_page_id', '')}]
@@ -414,7 +686,7 @@ class NotionDB:
                 ]
             }
 
-        return self._create_page(self.databases['performance_prediction'], properties)
+        return properties
 
     # ==================== 유틸리티 메서드 ====================
 
@@ -422,31 +694,25 @@ class NotionDB:
         """Notion에 새로운 페이지 생성"""
         url = f"{self.base_url}/pages"
 
-        payload = {
-            "parent": {"database_id": database_id},
-            "properties": properties
-        }
+        payload = self._create_payload(database_id, properties)
 
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self._send('POST', url, payload)
 
         if response.status_code == 200:
-            return response.json()
+            return self._mirror_page(response.json())
         else:
             print(f"Error creating page: {response.status_code} - {response.text}")
             return {}
 
     def _query_database(self, database_id: str, filter_condition: Dict = None,
-                       sorts: List[Dict] = None) -> Dict:
+                       sorts: List[Dict] = None, start_cursor: str = None,
+                       page_size: int = None) -> Dict:
         """Notion Database 쿼리"""
         url = f"{self.base_url}/databases/{database_id}/query"
 
-        payload = {}
-        if filter_condition:
-            payload["filter"] = filter_condition
-        if sorts:
-            payload["sorts"] = sorts
+        payload = self._query_payload(filter_condition, sorts, start_cursor, page_size)
 
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self._send('POST', url, payload)
 
         if response.status_code == 200:
             return response.json()
@@ -454,104 +720,315 @@ class NotionDB:
             print(f"Error querying database: {response.status_code} - {response.text}")
             return {"results": []}
 
+    def iter_query(self, database_id: str, filter_condition: Dict = None,
+                   sorts: List[Dict] = None, limit: Optional[int] = None,
+                   page_size: int = MAX_PAGE_SIZE, parse: bool = True,
+                   properties: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Database 쿼리 결과를 커서를 따라가며 한 페이지씩 반환하는 제너레이터
+
+        - 요청마다 page_size (최대 100, 남은 limit 이하) 만큼만 받음
+        - limit 개를 채우면 다음 요청을 보내지 않음
+        - 응답 단위로 처리하므로 전체 결과를 메모리에 올리지 않음
+
+        Args:
+            database_id: Database ID
+            filter_condition: Notion filter
+            sorts: Notion sorts
+            limit: 최대 결과 수 (None 이면 끝까지)
+            page_size: 요청당 결과 수
+            parse: True 면 _parse_page 결과, False 면 Notion 원본 페이지
+            properties: parse=True 일 때 파싱할 속성 이름 (None 이면 전체)
+
+        Raises:
+            RuntimeError: 쿼리 요청 실패 (중간에 끊긴 결과를 전체로 오인하지 않도록)
+        """
+        remaining = limit
+        cursor = None
+
+        while remaining is None or remaining > 0:
+            size = min(page_size, self.MAX_PAGE_SIZE)
+            if remaining is not None:
+                size = min(size, remaining)
+
+            response = self._query_database(database_id, filter_condition, sorts, cursor, size)
+            if 'has_more' not in response:
+                raise RuntimeError(f"Query failed for database {database_id}")
+
+            for page in response['results']:
+                yield self._parse_page(page, properties) if parse else page
+            if remaining is not None:
+                remaining -= len(response['results'])
+
+            if not response['has_more'] or not response.get('next_cursor'):
+                break
+            cursor = response['next_cursor']
+
+    def query_dataframe(self, database_id: str, filter_condition: Dict = None,
+                        sorts: List[Dict] = None, limit: Optional[int] = None,
+                        properties: Optional[List[str]] = None) -> pd.DataFrame:
+        """쿼리 결과를 타입이 지정된 DataFrame 으로 (pages_to_dataframe 참고)"""
+        return pages_to_dataframe(
+            self.iter_query(database_id, filter_condition, sorts, limit, parse=False),
+            properties
+        )
+
+    def _collect(self, pages: Iterator[Dict]) -> List[Dict]:
+        """iter_query 결과를 리스트로 (실패 시 기존 get_* 처럼 빈 리스트)"""
+        try:
+            return list(pages)
+        except RuntimeError as e:
+            print(f"Error querying database: {str(e)}")
+            return []
+
     def _update_page(self, page_id: str, properties: Dict) -> Dict:
         """Notion 페이지 업데이트"""
+        return self._update_result(self._patch_page(page_id, properties))
+
+    def _patch_page(self, page_id: str, properties: Dict) -> requests.Response:
+        """페이지 속성 PATCH (응답 그대로 반환)"""
         url = f"{self.base_url}/pages/{page_id}"
 
         payload = {"properties": properties}
 
-        response = requests.patch(url, headers=self.headers, json=payload)
+        return self._send('PATCH', url, payload)
 
+    def _update_result(self, response) -> Dict:
+        """PATCH 응답 처리 (성공 시 미러 반영 후 페이지, 실패 시 빈 Dict)"""
         if response.status_code == 200:
-            return response.json()
+            return self._mirror_page(response.json())
         else:
             print(f"Error updating page: {response.status_code} - {response.text}")
             return {}
 
-    def _parse_page(self, page: Dict) -> Dict:
-        """Notion 페이지를 Python Dict로 변환"""
-        parsed = {
+    @staticmethod
+    def _is_gone(response) -> bool:
+        """페이지가 삭제됐거나 (404) 보관돼서 (400 archived) 더 이상 수정할 수 없는 응답인지"""
+        if response.status_code == 404:
+            return True
+        if response.status_code != 400:
+            return False
+        try:
+            message = response.json().get('message', '')
+        except ValueError:
+            message = response.text
+        return 'archived' in message.lower()
+
+    def _mirror_page(self, page: Dict) -> Dict:
+        """로컬 미러가 연결돼 있으면 생성/수정된 페이지를 반영"""
+        if self.mirror is not None:
+            try:
+                self.mirror.apply_page(page)
+            except Exception as e:
+                print(f"Error updating local mirror: {str(e)}")
+        return page
+
+    def _send(self, method: str, url: str, payload: Dict) -> requests.Response:
+        """
+        토큰 버킷을 거쳐 요청을 보내고, 429/5xx 는 Retry-After (없으면 지수 백오프) 만큼
+        모든 호출자를 멈춘 뒤 재시도
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            response = self.session.request(method, url, json=payload, timeout=self.request_timeout)
+
+            if response.status_code not in self.RETRY_STATUSES:
+                self.rate_limiter.on_success()
+                return response
+
+            self.rate_limiter.on_throttled()
+            if attempt < self.max_retries:
+                self.rate_limiter.pause(retry_after_seconds(response.headers, attempt))
+
+        return response
+
+    @staticmethod
+    def _create_payload(database_id: str, properties: Dict) -> Dict:
+        """페이지 생성 요청 본문"""
+        return {
+            "parent": {"database_id": database_id},
+            "properties": properties
+        }
+
+    @staticmethod
+    def _query_payload(filter_condition: Dict = None, sorts: List[Dict] = None,
+                       start_cursor: str = None, page_size: int = None) -> Dict:
+        """Database 쿼리 요청 본문"""
+        payload = {}
+        if filter_condition:
+            payload["filter"] = filter_condition
+        if sorts:
+            payload["sorts"] = sorts
+        if start_cursor:
+            payload["start_cursor"] = start_cursor
+        if page_size:
+            payload["page_size"] = page_size
+        return payload
+
+    def _parse_page(self, page: Dict, properties: Optional[List[str]] = None) -> Dict:
+        """
+        Notion 페이지를 Python Dict로 변환
+
+        Args:
+            page: Notion 원본 페이지
+            properties: 파싱할 속성 이름 (None 이면 전체, 페이지에 없는 이름은 None)
+        """
+        return {
             "page_id": page["id"],
             "created_time": page["created_time"],
             "last_edited_time": page["last_edited_time"],
-            "properties": {}
+            "properties": parse_properties(page["properties"], properties)
         }
 
-        for prop_name, prop_value in page["properties"].items():
-            parsed["properties"][prop_name] = self._parse_property(prop_value)
-
-        return parsed
-
-    def _parse_property(self, prop: Dict) -> any:
-        """Notion 속성 파싱"""
-        prop_type = prop["type"]
-
-        if prop_type == "title":
-            return prop["title"][0]["text"]["content"] if prop["title"] else ""
-        elif prop_type == "text":
-            return prop["text"][0]["text"]["content"] if prop["text"] else ""
-        elif prop_type == "number":
-            return prop["number"]
-        elif prop_type == "select":
-            return prop["select"]["name"] if prop["select"] else None
-        elif prop_type == "multi_select":
-            return [item["name"] for item in prop["multi_select"]]
-        elif prop_type == "date":
-            return prop["date"]["start"] if prop["date"] else None
-        elif prop_type == "checkbox":
-            return prop["checkbox"]
-        elif prop_type == "relation":
-            return [item["id"] for item in prop["relation"]]
-        elif prop_type == "formula":
-            return prop["formula"]["string"] if prop["formula"]["type"] == "string" else prop["formula"]["number"]
-        else:
-            return None
+    def _parse_property(self, prop: Dict) -> Any:
+        """Notion 속성 파싱 (PROPERTY_PARSERS 참고)"""
+        return parse_property(prop)
 
     # ==================== 배치 작업 ====================
 
     def sync_keyword_analysis(self, keyword: str, analysis_data: Dict) -> bool:
-        """키워드 분석 데이터 동기화"""
+        """키워드 분석 데이터 동기화 (페이지 인덱스로 생성/업데이트 판단, 요청 1회)"""
         try:
-            # 기존 데이터 확인
-            existing = self.get_keyword_analysis(keyword)
-
-            if existing:
-                # 업데이트
-                self.update_keyword_analysis(
-                    existing['page_id'],
-                    analysis_data
-                )
-            else:
-                # 신규 생성
-                self.add_keyword_analysis(keyword, analysis_data)
-
-            return True
+            self.warm_keyword_index()
+            return self._upsert_keyword_analysis(keyword, analysis_data) is not None
         except Exception as e:
             print(f"Error syncing keyword analysis: {str(e)}")
             return False
 
-    def batch_add_trend_data(self, keyword: str, trend_list: List[Dict]) -> int:
-        """배치로 트렌드 데이터 추가"""
-        count = 0
-        for trend in trend_list:
+    def sync_many(self, analyses: Dict[str, Dict]) -> Dict[str, int]:
+        """
+        여러 키워드 분석 데이터를 한 번에 동기화
+
+        인덱스 스캔 1회 후 키워드당 요청 1회 (batch_workers 개씩 동시 전송)
+
+        Args:
+            analyses: {키워드: analysis_data}
+
+        Returns:
+            {'created': n, 'updated': n, 'failed': n}
+        """
+        counts = {'created': 0, 'updated': 0, 'failed': 0}
+
+        try:
+            self.warm_keyword_index()
+        except Exception as e:
+            print(f"Error syncing keyword analysis: {str(e)}")
+            counts['failed'] = len(analyses)
+            return counts
+
+        def run(item) -> Optional[str]:
             try:
-                self.add_trend_data(keyword, trend)
-                count += 1
-                time.sleep(0.3)  # API Rate Limiting
+                return self._upsert_keyword_analysis(*item)
             except Exception as e:
-                print(f"Error adding trend data: {str(e)}")
+                print(f"Error syncing keyword analysis: {str(e)}")
+                return None
 
-        return count
+        with ThreadPoolExecutor(max_workers=max(1, self.batch_workers)) as pool:
+            for action in pool.map(run, analyses.items()):
+                counts[action or 'failed'] += 1
+
+        return counts
+
+    def _upsert_keyword_analysis(self, keyword: str, analysis_data: Dict) -> Optional[str]:
+        """
+        인덱스에 있으면 업데이트, 없으면 생성 ('updated' / 'created', 실패 시 None)
+
+        인덱스의 페이지가 삭제/보관됐으면 인덱스에서 빼고 새로 생성
+        """
+        page_id = self._find_keyword_page(keyword)
+
+        if page_id:
+            response = self._patch_page(page_id, self._keyword_analysis_update_properties(analysis_data))
+            if not self._is_gone(response):
+                return 'updated' if self._update_result(response) else None
+            self._forget_page(keyword, page_id)
+
+        return 'created' if self.add_keyword_analysis(keyword, analysis_data) else None
+
+    # ==================== 키워드 페이지 인덱스 ====================
+
+    def warm_keyword_index(self, force: bool = False) -> int:
+        """
+        키워드 분석 DB 를 페이지 단위로 한 번 스캔해서 키워드 → 페이지 ID 인덱스 구성
+        (이미 채워져 있으면 건너뜀, 인덱스 크기 반환)
+        """
+        with self._page_index_lock:
+            if self._page_index_warm and not force:
+                return len(self._page_index)
+
+            index = {}
+            for page in self.iter_query(self.databases['keyword_analysis'], parse=False):
+                index.setdefault(self._page_title(page), page['id'])
+
+            # 스캔 중에 생성된 페이지도 유지
+            index.update(self._page_index)
+            self._page_index = index
+            self._page_index_warm = True
+            return len(index)
+
+    def invalidate_keyword_index(self):
+        """인덱스 비우기 (Notion 에서 페이지를 직접 지웠을 때 등, 다음 동기화에서 다시 스캔)"""
+        with self._page_index_lock:
+            self._page_index = {}
+            self._page_index_warm = False
+
+    def _index_page(self, keyword: str, page: Dict):
+        """생성된 페이지를 인덱스에 반영"""
+        if page.get('id'):
+            self._page_index[keyword] = page['id']
+
+    def _find_keyword_page(self, keyword: str) -> Optional[str]:
+        """
+        키워드 분석 페이지 ID (인덱스에 없으면 제목 필터 쿼리로 확인 후 인덱스에 캐시)
+
+        인덱스를 채운 뒤 다른 프로세스나 Notion UI 에서 만든 페이지도 찾아서 중복 생성을 막음
+        (쿼리 실패 시 RuntimeError - 확인하지 못한 채 생성하지 않음)
+        """
+        page_id = self._page_index.get(keyword)
+        if page_id:
+            return page_id
+
+        for page in self.iter_query(self.databases['keyword_analysis'], limit=1, parse=False,
+                                    **self._keyword_analysis_query(keyword)):
+            self._index_page(keyword, page)
+            return page['id']
+        return None
+
+    def _forget_page(self, keyword: str, page_id: str):
+        """삭제/보관된 페이지를 인덱스에서 제거 (그 사이 다른 페이지로 바뀌었으면 유지)"""
+        print(f"Notion page {page_id} for '{keyword}' is gone, creating a new one")
+        if self._page_index.get(keyword) == page_id:
+            self._page_index.pop(keyword, None)
+
+    def _page_title(self, page: Dict) -> str:
+        """키워드 분석 페이지의 Keyword (title) 값"""
+        return self._parse_property(page['properties']['Keyword'])
+
+    def batch_add_trend_data(self, keyword: str, trend_list: List[Dict]) -> int:
+        """배치로 트렌드 데이터 추가 (요청 속도는 rate_limiter 가 조절)"""
+        return self._run_batch(
+            lambda trend: self.add_trend_data(keyword, trend),
+            trend_list,
+            "Error adding trend data"
+        )
 
     def batch_add_recommendations(self, keyword: str, recommendations: List[Dict]) -> int:
-        """배치로 추천 키워드 추가"""
-        count = 0
-        for rec in recommendations:
+        """배치로 추천 키워드 추가 (요청 속도는 rate_limiter 가 조절)"""
+        return self._run_batch(
+            lambda rec: self.add_recommendation(keyword, rec),
+            recommendations,
+            "Error adding recommendation"
+        )
+
+    def _run_batch(self, func, items: List[Dict], error_label: str) -> int:
+        """batch_workers 개 스레드로 실행하고 예외 없이 끝난 개수 반환"""
+        def run(item) -> bool:
             try:
-                self.add_recommendation(keyword, rec)
-                count += 1
-                time.sleep(0.3)
+                func(item)
+                return True
             except Exception as e:
-                print(f"Error adding recommendation: {str(e)}")
+                print(f"{error_label}: {str(e)}")
+                return False
 
-        return count
+        with ThreadPoolExecutor(max_workers=max(1, self.batch_workers)) as pool:
+            return sum(pool.map(run, items))
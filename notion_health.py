@@ -0,0 +1,105 @@
+"""
+Notion Database Health Check Module
+여러 Database 점검을 제한된 병렬도로 동시에 실행하고 Database 별 소요 시간을 기록합니다.
+(validate_databases.py / init_databases.py 에서 사용)
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Callable, Dict
+
+# 점검 대상 Database (키, 표시 이름)
+DATABASES = {
+    'keyword_analysis': 'Keyword Analysis 🔍',
+    'trend_data': 'Trend Data 📊',
+    'recommendations': 'Recommendations 💡',
+    'competitor_analysis': 'Competitor Analysis ⚔️',
+    'search_intent': 'Search Intent 🔍',
+    'performance_prediction': 'Performance Prediction 📈'
+}
+
+DEFAULT_PARALLELISM = len(DATABASES)
+DEFAULT_TIMEOUT = 10.0
+
+
+def run_checks(checks: Dict[str, Callable[[], Dict]], parallelism: int = DEFAULT_PARALLELISM,
+               timeout: float = DEFAULT_TIMEOUT) -> Dict:
+    """
+    점검 함수들을 동시에 실행
+
+    Args:
+        checks: {이름: 점검 함수} - 점검 함수는 'status' 키가 있는 dict 반환
+        parallelism: 동시에 실행할 점검 수
+        timeout: 점검 하나의 제한 시간 (초, 실행을 시작한 시점부터)
+
+    Returns:
+        {
+            'generated_at', 'parallelism', 'timeout_s', 'total_ms', 'ok',
+            'databases': {이름: {..점검 결과.., 'elapsed_ms', 'timed_out'}}
+        }
+        (databases 는 checks 순서)
+    """
+    started_at = {}
+    results = {}
+    start = time.perf_counter()
+
+    def run(name: str, check: Callable[[], Dict]) -> Dict:
+        started_at[name] = time.perf_counter()
+        try:
+            result = dict(check())
+        except Exception as e:
+            result = {'status': False, 'error': str(e)}
+        result['elapsed_ms'] = round((time.perf_counter() - started_at[name]) * 1000, 1)
+        result['timed_out'] = False
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=max(1, parallelism), thread_name_prefix='db-check')
+    futures = {executor.submit(run, name, check): name for name, check in checks.items()}
+    pending = set(futures)
+
+    try:
+        while pending:
+            # 실행 중인 점검 중 가장 먼저 제한 시간이 되는 시점까지 대기
+            now = time.perf_counter()
+            deadlines = [
+                started_at[futures[f]] + timeout - now
+                for f in pending if futures[f] in started_at
+            ]
+            wait_for = max(0.0, min(deadlines)) if len(deadlines) == len(pending) else 0.05
+
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+
+            now = time.perf_counter()
+            for future in list(pending):
+                name = futures[future]
+                began = started_at.get(name)
+                if began is not None and now - began >= timeout:
+                    # 스레드는 중단할 수 없으므로 결과만 버림
+                    pending.discard(future)
+                    results[name] = {
+                        'status': False,
+                        'error': f"Timed out after {timeout:.1f}s",
+                        'elapsed_ms': round((now - began) * 1000, 1),
+                        'timed_out': True
+                    }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'parallelism': parallelism,
+        'timeout_s': timeout,
+        'total_ms': round((time.perf_counter() - start) * 1000, 1),
+        'ok': all(result.get('status', False) for result in results.values()),
+        'databases': {name: results[name] for name in checks}
+    }
+
+
+def write_json_report(report: Dict, path: str):
+    """점검 결과를 JSON 파일로 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
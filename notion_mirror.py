@@ -0,0 +1,341 @@
+"""
+Notion Mirror Module
+NotionDB 에 설정된 Database 들을 로컬 SQLite 에 복제해서 읽기를 로컬에서 처리합니다.
+
+- last_edited_time 필터로 바뀐 페이지만 가져오는 증분 동기화
+- max_staleness (초) 보다 오래된 Database 는 읽기 전에 자동 동기화
+- NotionDB 로 생성/수정한 페이지는 응답을 바로 반영 (write-through)
+- Notion 에서 삭제/보관된 페이지는 증분 동기화로 알 수 없으므로 sync(full=True) 로 정리
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from notion_db import NotionDB
+
+
+class NotionMirror:
+    """
+    Notion Database 로컬 미러
+
+    사용 예:
+        mirror = NotionMirror(notion_db, path='notion_mirror.db', max_staleness=300)
+        mirror.get_keyword_analysis('파이썬 강의')   # 로컬 조회 (필요하면 먼저 증분 동기화)
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS mirror_pages (
+            page_id TEXT PRIMARY KEY,
+            db_key TEXT NOT NULL,
+            title TEXT,
+            created_time TEXT,
+            last_edited_time TEXT,
+            properties TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_mirror_db_title ON mirror_pages(db_key, title);
+        CREATE INDEX IF NOT EXISTS idx_mirror_db_edited ON mirror_pages(db_key, last_edited_time);
+
+        CREATE TABLE IF NOT EXISTS mirror_sync_state (
+            db_key TEXT PRIMARY KEY,
+            database_id TEXT,
+            last_edited_watermark TEXT,
+            synced_at REAL
+        );
+    '''
+
+    UPSERT_PAGE = '''
+        INSERT INTO mirror_pages (page_id, db_key, title, created_time, last_edited_time, properties)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(page_id) DO UPDATE SET
+            db_key = excluded.db_key,
+            title = excluded.title,
+            last_edited_time = excluded.last_edited_time,
+            properties = excluded.properties
+    '''
+
+    def __init__(self, notion: NotionDB, path: str = 'notion_mirror.db',
+                 max_staleness: float = 300.0, write_through: bool = True):
+        """
+        Args:
+            notion: 동기화에 사용할 NotionDB (Database ID 는 notion.databases 를 따름)
+            path: 미러 SQLite 파일 경로
+            max_staleness: 이 시간 (초) 보다 오래 동기화하지 않은 Database 는 읽기 전에 동기화
+            write_through: True 면 notion 으로 생성/수정한 페이지를 미러에 즉시 반영
+        """
+        self.notion = notion
+        self.path = path
+        self.max_staleness = max_staleness
+
+        self._lock = threading.Lock()
+        # ensure_fresh 가 잡은 채로 sync 를 호출하므로 RLock
+        self._sync_locks = {db_key: threading.RLock() for db_key in notion.databases}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+
+        self.counters = {'syncs': 0, 'pages_synced': 0, 'sync_errors': 0, 'reads': 0}
+
+        if write_through:
+            notion.mirror = self
+
+    # ==================== 동기화 ====================
+
+    def sync(self, db_key: str, full: bool = False) -> int:
+        """
+        Database 하나를 동기화하고 반영한 페이지 수 반환
+
+        Args:
+            db_key: notion.databases 의 키 (예: 'keyword_analysis')
+            full: True 면 전체를 다시 받아 교체 (삭제/보관된 페이지 정리)
+        """
+        database_id = self.notion.databases.get(db_key)
+        if not database_id:
+            raise ValueError(f"Database ID not configured: {db_key}")
+
+        with self._sync_lock(db_key):
+            state = self._sync_state(db_key)
+            # Database ID 가 바뀌면 이전 데이터는 버리고 전체 동기화
+            if state and state[0] != database_id:
+                full = True
+
+            watermark = None if full or not state else state[1]
+            filter_condition = None
+            if watermark:
+                # last_edited_time 은 분 단위로 잘리므로 경계 페이지는 다시 받아도 upsert 로 무해
+                filter_condition = {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": watermark}
+                }
+
+            started = time.time()
+            rows = []
+            for page in self.notion.iter_query(
+                database_id,
+                filter_condition=filter_condition,
+                sorts=[{"timestamp": "last_edited_time", "direction": "ascending"}],
+                parse=False
+            ):
+                rows.append(self._page_row(db_key, page))
+                if watermark is None or page['last_edited_time'] > watermark:
+                    watermark = page['last_edited_time']
+
+            with self._lock, self._conn:
+                if full:
+                    self._conn.execute('DELETE FROM mirror_pages WHERE db_key = ?', (db_key,))
+                self._conn.executemany(self.UPSERT_PAGE, rows)
+                self._conn.execute(
+                    '''INSERT OR REPLACE INTO mirror_sync_state
+                       (db_key, database_id, last_edited_watermark, synced_at)
+                       VALUES (?, ?, ?, ?)''',
+                    (db_key, database_id, watermark, started)
+                )
+                self.counters['syncs'] += 1
+                self.counters['pages_synced'] += len(rows)
+
+            return len(rows)
+
+    def sync_all(self, full: bool = False) -> Dict[str, int]:
+        """설정된 모든 Database 동기화 (실패한 Database 는 -1)"""
+        results = {}
+        for db_key, database_id in self.notion.databases.items():
+            if not database_id:
+                continue
+            try:
+                results[db_key] = self.sync(db_key, full=full)
+            except Exception as e:
+                print(f"Error syncing mirror '{db_key}': {str(e)}")
+                results[db_key] = -1
+        return results
+
+    def ensure_fresh(self, db_key: str, max_staleness: Optional[float] = None):
+        """
+        마지막 동기화가 max_staleness 보다 오래됐으면 동기화
+        (동기화에 실패하면 로컬 데이터를 그대로 사용, 설정되지 않은 Database 는 건너뜀)
+        """
+        if not self.notion.databases.get(db_key):
+            return
+
+        max_staleness = self.max_staleness if max_staleness is None else max_staleness
+        if self.staleness(db_key) <= max_staleness:
+            return
+
+        with self._sync_lock(db_key):
+            # 잠금을 기다리는 동안 다른 호출이 동기화했으면 그 결과를 사용
+            if self.staleness(db_key) <= max_staleness:
+                return
+            try:
+                self.sync(db_key)
+            except Exception as e:
+                self.counters['sync_errors'] += 1
+                print(f"Error syncing mirror '{db_key}', serving local data: {str(e)}")
+
+    def _sync_lock(self, db_key: str) -> threading.RLock:
+        return self._sync_locks.setdefault(db_key, threading.RLock())
+
+    def staleness(self, db_key: str) -> float:
+        """마지막 동기화 후 경과 시간 (초, 동기화한 적 없으면 inf)"""
+        state = self._sync_state(db_key)
+        if not state or state[2] is None:
+            return float('inf')
+        return time.time() - state[2]
+
+    def apply_page(self, page: Dict):
+        """NotionDB 가 생성/수정한 페이지 응답을 미러에 반영"""
+        database_id = (page.get('parent') or {}).get('database_id')
+        db_key = self._db_key_for(database_id)
+        if db_key is None or 'properties' not in page:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(self.UPSERT_PAGE, self._page_row(db_key, page))
+
+    def _sync_state(self, db_key: str) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(
+                '''SELECT database_id, last_edited_watermark, synced_at
+                   FROM mirror_sync_state WHERE db_key = ?''',
+                (db_key,)
+            ).fetchone()
+
+    def _db_key_for(self, database_id: Optional[str]) -> Optional[str]:
+        """Notion 응답의 database_id (하이픈 포함) 를 databases 키로"""
+        if not database_id:
+            return None
+        normalized = database_id.replace('-', '')
+        for db_key, configured in self.notion.databases.items():
+            if configured and configured.replace('-', '') == normalized:
+                return db_key
+        return None
+
+    def _page_row(self, db_key: str, page: Dict) -> tuple:
+        parsed = self.notion._parse_page(page)
+        title = next(
+            (parsed['properties'][name] for name, prop in page['properties'].items()
+             if prop.get('type') == 'title'),
+            None
+        )
+        return (
+            parsed['page_id'], db_key, title,
+            parsed['created_time'], parsed['last_edited_time'],
+            json.dumps(parsed['properties'], ensure_ascii=False, default=str)
+        )
+
+    # ==================== 로컬 조회 ====================
+
+    def query(self, db_key: str, where: str = '', params: tuple = (), order_by: str = '',
+              limit: Optional[int] = None, max_staleness: Optional[float] = None) -> List[Dict]:
+        """
+        미러에서 조회 (NotionDB._parse_page 와 같은 형태로 반환)
+
+        where/order_by 는 mirror_pages 컬럼과 json_extract(properties, '$."속성"') 사용
+        """
+        self.ensure_fresh(db_key, max_staleness)
+
+        sql = ('SELECT page_id, created_time, last_edited_time, properties '
+               'FROM mirror_pages WHERE db_key = ?')
+        if where:
+            sql += f' AND ({where})'
+        if order_by:
+            sql += f' ORDER BY {order_by}'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+
+        with self._lock:
+            self.counters['reads'] += 1
+            rows = self._conn.execute(sql, (db_key,) + tuple(params)).fetchall()
+
+        return [
+            {
+                "page_id": page_id,
+                "created_time": created_time,
+                "last_edited_time": last_edited_time,
+                "properties": json.loads(properties)
+            }
+            for page_id, created_time, last_edited_time, properties in rows
+        ]
+
+    def get_keyword_analysis(self, keyword: str) -> Optional[Dict]:
+        """키워드 분석 데이터 조회"""
+        pages = self.query('keyword_analysis', 'title = ?', (keyword,), limit=1)
+        return pages[0] if pages else None
+
+    def get_all_keywords(self, limit: Optional[int] = 50) -> List[Dict]:
+        """모든 활성 키워드 조회 (최근 수정순)"""
+        return self.query(
+            'keyword_analysis',
+            "json_extract(properties, '$.Status') = 'active'",
+            order_by='last_edited_time DESC',
+            limit=limit
+        )
+
+    def get_trend_history(self, keyword: str, days: int = 30,
+                          limit: Optional[int] = None) -> List[Dict]:
+        """키워드의 트렌드 히스토리 조회 (날짜순)"""
+        start_date = (datetime.now() - timedelta(days=days)).isoformat()
+        ids = self._relation_ids(keyword)
+
+        return self.query(
+            'trend_data',
+            f"""EXISTS (SELECT 1 FROM json_each(properties, '$.Keyword')
+                        WHERE value IN ({','.join('?' * len(ids))}))
+                AND json_extract(properties, '$.Date') > ?""",
+            (*ids, start_date),
+            order_by="json_extract(properties, '$.Date') ASC",
+            limit=limit
+        )
+
+    def get_recommendations(self, base_keyword: str, limit: Optional[int] = 20) -> List[Dict]:
+        """추천 키워드 조회 (점수순)"""
+        ids = self._relation_ids(base_keyword)
+
+        return self.query(
+            'recommendations',
+            f"""EXISTS (SELECT 1 FROM json_each(properties, '$."Base Keyword"')
+                        WHERE value IN ({','.join('?' * len(ids))}))
+                AND json_extract(properties, '$.Status') = 'recommended'""",
+            ids,
+            order_by="json_extract(properties, '$.Score') DESC",
+            limit=limit
+        )
+
+    def _relation_ids(self, keyword: str) -> tuple:
+        """relation 비교 값: 그대로 (페이지 ID) + 같은 제목의 키워드 분석 페이지 ID"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_id FROM mirror_pages WHERE db_key = 'keyword_analysis' AND title = ?",
+                (keyword,)
+            ).fetchone()
+        return (keyword, row[0]) if row else (keyword,)
+
+    # ==================== 지표 ====================
+
+    def stats(self) -> Dict:
+        """Database 별 페이지 수 / 경과 시간 + 누적 카운터"""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                'SELECT db_key, COUNT(*) FROM mirror_pages GROUP BY db_key'
+            ).fetchall())
+            counters = dict(self.counters)
+
+        databases = {}
+        for db_key, database_id in self.notion.databases.items():
+            if database_id:
+                staleness = self.staleness(db_key)
+                databases[db_key] = {
+                    'pages': counts.get(db_key, 0),
+                    'staleness_s': None if staleness == float('inf') else staleness
+                }
+
+        return {'max_staleness': self.max_staleness, 'databases': databases, **counters}
+
+    def close(self):
+        if self.notion.mirror is self:
+            self.notion.mirror = None
+        with self._lock:
+            self._conn.close()
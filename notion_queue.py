@@ -0,0 +1,425 @@
+"""
+Notion Write-Behind Queue Module
+Notion 저장 요청을 로컬 SQLite 에 먼저 기록하고 워커 스레드가 비동기로 전송합니다.
+
+- API 응답은 Notion 지연/장애와 무관 (로컬 INSERT 만 기다림)
+- 같은 키워드의 반복 갱신은 하나로 합침 (마지막 값만 전송)
+- 실패 시 지수 백오프로 재시도, max_attempts 초과 시 'dead' 로 보관 (dead_retention 후 삭제)
+- 대상 Database ID 가 설정되지 않은 작업은 spool 하지 않음
+- 프로세스가 죽어도 spool 파일에 남은 작업은 재시작 후 이어서 전송
+- 여러 프로세스 (uvicorn 워커) 가 spool 파일을 공유해도 작업 하나는 한 워커만 가져감
+  (lease_timeout 동안 임대, 임대가 끝나도 완료되지 않은 작업만 다른 워커가 다시 가져감)
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from notion_db import NotionDB
+
+
+class NotionWriteQueue:
+    """
+    SQLite 에 spool 되는 Notion 쓰기 큐
+
+    사용 예:
+        queue = NotionWriteQueue(NotionDB(token), path='notion_queue.db', workers=2)
+        queue.start()
+        queue.enqueue_keyword_analysis(keyword, analysis_data)
+        ...
+        queue.stop()
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS notion_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            coalesce_key TEXT UNIQUE,
+            payload TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'pending',
+            enqueued_at REAL NOT NULL,
+            next_attempt_at REAL NOT NULL,
+            last_error TEXT,
+            claimed_by TEXT,
+            lease_until REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_outbox_due
+            ON notion_outbox(status, next_attempt_at);
+    '''
+
+    # 같은 coalesce_key 가 대기 중이면 payload 만 교체
+    # (enqueued_at 은 가장 오래된 미전송 시각 유지, 백오프 중이면 재시도 시각 유지)
+    UPSERT = '''
+        INSERT INTO notion_outbox (kind, coalesce_key, payload, enqueued_at, next_attempt_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(coalesce_key) DO UPDATE SET
+            payload = excluded.payload,
+            version = version + 1,
+            status = CASE WHEN status = 'inflight' THEN 'inflight' ELSE 'pending' END,
+            attempts = CASE WHEN status = 'dead' THEN 0 ELSE attempts END,
+            next_attempt_at = CASE WHEN status = 'dead' OR attempts = 0
+                                   THEN excluded.next_attempt_at ELSE next_attempt_at END
+    '''
+
+    # 작업 종류별 대상 Database (notion.databases 키)
+    KIND_DATABASES = {
+        'keyword_analysis': 'keyword_analysis',
+        'recommendation': 'recommendations'
+    }
+
+    def __init__(self, notion: NotionDB, path: str = 'notion_queue.db', workers: int = 2,
+                 max_attempts: int = 20, backoff_base: float = 2.0, backoff_cap: float = 300.0,
+                 poll_interval: float = 1.0, dead_retention: float = 7 * 24 * 3600,
+                 max_dead: int = 10000, prune_interval: float = 60.0,
+                 lease_timeout: float = 600.0):
+        """
+        Args:
+            notion: 전송에 사용할 NotionDB (rate limit / 429 재시도는 NotionDB 가 처리)
+            path: spool SQLite 파일 경로
+            workers: 전송 워커 스레드 수 (0 이면 spool 만 하고 전송하지 않음)
+            max_attempts: 이 횟수만큼 실패하면 'dead' 로 보관
+            backoff_base: 재시도 대기 기준 (초) - base * 2^(attempts-1)
+            backoff_cap: 재시도 대기 상한 (초)
+            poll_interval: 대기 작업이 없을 때 최대 대기 시간 (초)
+            dead_retention: 'dead' 작업 보관 기간 (초)
+            max_dead: 보관할 'dead' 작업 최대 수 (넘으면 오래된 것부터 삭제)
+            prune_interval: 'dead' 작업 정리 주기 (초)
+            lease_timeout: 가져간 작업의 임대 시간 (초, 재시도 포함 전송 1회보다 길게)
+        """
+        self.notion = notion
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.poll_interval = poll_interval
+        self.dead_retention = dead_retention
+        self.max_dead = max_dead
+        self.prune_interval = prune_interval
+        self._last_prune = 0.0
+        self.lease_timeout = lease_timeout
+        # 같은 spool 파일을 쓰는 프로세스/인스턴스 구분
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL')  # 응답 전에 디스크까지 기록
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+        # 전송 중에 종료된 작업 중 임대가 끝난 것만 다시 대기열로 (살아 있는 다른 워커의 작업은 유지)
+        self._conn.execute(
+            '''UPDATE notion_outbox SET status = 'pending', claimed_by = NULL, lease_until = NULL
+               WHERE status = 'inflight' AND (lease_until IS NULL OR lease_until < ?)''',
+            (time.time(),)
+        )
+
+        self.handlers: Dict[str, Callable[[Dict], bool]] = {
+            'keyword_analysis': self._send_keyword_analysis,
+            'recommendation': self._send_recommendation
+        }
+
+        self.counters = {
+            'enqueued': 0,
+            'coalesced': 0,
+            'sent': 0,
+            'retried': 0,
+            'dead_total': 0,
+            'pruned': 0,
+            'skipped_unconfigured': 0
+        }
+
+    def _migrate(self):
+        """임대 컬럼이 없는 이전 spool 파일에 컬럼 추가"""
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(notion_outbox)')}
+        for name, sql_type in (('claimed_by', 'TEXT'), ('lease_until', 'REAL')):
+            if name not in columns:
+                self._conn.execute(f'ALTER TABLE notion_outbox ADD COLUMN {name} {sql_type}')
+
+    # ==================== 적재 ====================
+
+    def enqueue(self, kind: str, payload: Dict, coalesce_key: Optional[str] = None):
+        """작업 하나를 spool (coalesce_key 가 같으면 기존 대기 작업을 덮어씀)"""
+        self.enqueue_many([(kind, payload, coalesce_key)])
+
+    def enqueue_many(self, jobs: List[tuple]):
+        """(kind, payload, coalesce_key) 여러 개를 한 트랜잭션으로 spool"""
+        # 대상 Database 가 설정되지 않은 작업은 성공할 수 없으므로 버림
+        configured = [job for job in jobs if self.is_configured(job[0])]
+        self.counters['skipped_unconfigured'] += len(jobs) - len(configured)
+        jobs = configured
+        if not jobs:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                for kind, payload, coalesce_key in jobs:
+                    if coalesce_key is not None and self._conn.execute(
+                        'SELECT 1 FROM notion_outbox WHERE coalesce_key = ?', (coalesce_key,)
+                    ).fetchone():
+                        self.counters['coalesced'] += 1
+
+                    self._conn.execute(self.UPSERT, (
+                        kind, coalesce_key,
+                        json.dumps(payload, ensure_ascii=False, default=str),
+                        now, now
+                    ))
+                    self.counters['enqueued'] += 1
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+        self._wakeup.set()
+
+    def is_configured(self, kind: str) -> bool:
+        """kind 의 대상 Database ID 가 설정되어 있는지"""
+        db_key = self.KIND_DATABASES.get(kind)
+        return db_key is None or bool(self.notion.databases.get(db_key))
+
+    def enqueue_keyword_analysis(self, keyword: str, analysis_data: Dict):
+        """키워드 분석 동기화 (키워드별로 마지막 값만 전송)"""
+        self.enqueue(
+            'keyword_analysis',
+            {'keyword': keyword, 'data': analysis_data},
+            coalesce_key=f"keyword_analysis:{keyword}"
+        )
+
+    def enqueue_recommendations(self, base_keyword: str, recommendations: List[Dict]):
+        """추천 키워드 저장 (같은 기준/추천 키워드 쌍은 하나로 합침)"""
+        self.enqueue_many([
+            (
+                'recommendation',
+                {'base_keyword': base_keyword, 'recommendation': rec},
+                f"recommendation:{base_keyword}:{rec.get('keyword', '')}"
+            )
+            for rec in recommendations
+        ])
+
+    # ==================== 전송 ====================
+
+    def _send_keyword_analysis(self, payload: Dict) -> bool:
+        return self.notion.sync_keyword_analysis(payload['keyword'], payload['data'])
+
+    def _send_recommendation(self, payload: Dict) -> bool:
+        return bool(self.notion.add_recommendation(payload['base_keyword'], payload['recommendation']))
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._threads:
+            return
+
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"notion-queue-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        """워커 종료 (전송 중인 작업은 끝까지 처리, 남은 작업은 spool 에 유지)"""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def drain(self, timeout: float = 30.0) -> bool:
+        """'dead' 를 제외한 모든 작업 (백오프 대기 포함) 이 전송될 때까지 대기 (비면 True)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self._count("status != 'dead'"):
+                return True
+            time.sleep(0.05)
+        return False
+
+    def _worker(self):
+        while not self._stop.is_set():
+            job = self._claim()
+            if job is None:
+                self._maybe_prune()
+                self._wakeup.wait(self._idle_wait())
+                self._wakeup.clear()
+                continue
+            self._process(*job)
+
+    # 가져갈 수 있는 작업: 재시도 시각이 된 대기 작업 + 임대가 끝난 전송 중 작업 (워커가 죽은 경우)
+    CLAIMABLE = '''(status = 'pending' AND next_attempt_at <= :now)
+                   OR (status = 'inflight' AND lease_until < :now)'''
+
+    def _claim(self) -> Optional[tuple]:
+        """
+        가장 먼저 재시도 시각이 된 작업 하나를 임대해서 반환
+
+        BEGIN IMMEDIATE 로 다른 프로세스와 직렬화하고, 조건부 UPDATE 의 rowcount 로
+        그 사이 다른 워커가 가져가지 않았는지 확인
+        """
+        with self._lock:
+            now = time.time()
+            params = {'now': now, 'owner': self.owner, 'lease_until': now + self.lease_timeout}
+            try:
+                self._conn.execute('BEGIN IMMEDIATE')
+            except sqlite3.OperationalError as e:
+                print(f"Error claiming Notion job: {str(e)}")
+                return None
+
+            try:
+                row = self._conn.execute(
+                    f'''SELECT id, kind, payload, version, attempts FROM notion_outbox
+                        WHERE {self.CLAIMABLE}
+                        ORDER BY next_attempt_at LIMIT 1''',
+                    params
+                ).fetchone()
+                if row is not None and not self._conn.execute(
+                    f'''UPDATE notion_outbox
+                        SET status = 'inflight', claimed_by = :owner, lease_until = :lease_until
+                        WHERE id = :id AND ({self.CLAIMABLE})''',
+                    {**params, 'id': row[0]}
+                ).rowcount:
+                    row = None
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            return row
+
+    def _idle_wait(self) -> float:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM notion_outbox WHERE status = 'pending'"
+            ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(self.poll_interval, max(0.0, row[0] - time.time()))
+
+    def _process(self, job_id: int, kind: str, payload: str, version: int, attempts: int):
+        handler = self.handlers.get(kind)
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {kind}")
+            ok = handler(json.loads(payload))
+            error = None if ok else 'Notion request failed'
+        except Exception as e:
+            error = str(e)
+
+        with self._lock:
+            if error is None:
+                deleted = self._conn.execute(
+                    'DELETE FROM notion_outbox WHERE id = ? AND version = ? AND claimed_by = ?',
+                    (job_id, version, self.owner)
+                ).rowcount
+                if not deleted:
+                    # 전송 중에 새 값이 합쳐짐 - 새 값으로 다시 전송
+                    # (임대가 끝나 다른 워커가 가져간 작업은 그 워커에 맡김)
+                    self._conn.execute(
+                        '''UPDATE notion_outbox
+                           SET status = 'pending', attempts = 0, next_attempt_at = ?,
+                               claimed_by = NULL, lease_until = NULL
+                           WHERE id = ? AND claimed_by = ?''',
+                        (time.time(), job_id, self.owner)
+                    )
+                self.counters['sent'] += 1
+                return
+
+            attempts += 1
+            if attempts >= self.max_attempts:
+                status = 'dead'
+                self.counters['dead_total'] += 1
+                print(f"Notion job {job_id} ({kind}) gave up after {attempts} attempts: {error}")
+            else:
+                status = 'pending'
+                self.counters['retried'] += 1
+
+            delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempts - 1)))
+            self._conn.execute(
+                '''UPDATE notion_outbox
+                   SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?,
+                       claimed_by = NULL, lease_until = NULL
+                   WHERE id = ? AND claimed_by = ?''',
+                (status, attempts, time.time() + delay, error, job_id, self.owner)
+            )
+
+    def retry_dead(self) -> int:
+        """'dead' 작업을 다시 대기열로 (재시도한 개수 반환)"""
+        with self._lock:
+            count = self._conn.execute(
+                "UPDATE notion_outbox SET status = 'pending', attempts = 0, next_attempt_at = ? "
+                "WHERE status = 'dead'",
+                (time.time(),)
+            ).rowcount
+        self._wakeup.set()
+        return count
+
+    def prune(self) -> int:
+        """보관 기간이 지났거나 max_dead 를 넘는 'dead' 작업 삭제 (삭제한 개수 반환)"""
+        with self._lock:
+            self._last_prune = time.time()
+            # dead 로 바뀐 시각 ≈ 마지막 next_attempt_at
+            count = self._conn.execute(
+                "DELETE FROM notion_outbox WHERE status = 'dead' AND next_attempt_at < ?",
+                (time.time() - self.dead_retention,)
+            ).rowcount
+            count += self._conn.execute(
+                '''DELETE FROM notion_outbox WHERE id IN (
+                       SELECT id FROM notion_outbox WHERE status = 'dead'
+                       ORDER BY next_attempt_at DESC LIMIT -1 OFFSET ?
+                   )''',
+                (self.max_dead,)
+            ).rowcount
+            self.counters['pruned'] += count
+        return count
+
+    def _maybe_prune(self):
+        if time.time() - self._last_prune >= self.prune_interval:
+            try:
+                self.prune()
+            except sqlite3.Error as e:
+                print(f"Error pruning Notion queue: {str(e)}")
+
+    # ==================== 지표 ====================
+
+    def _count(self, where: str, *params) -> int:
+        with self._lock:
+            return self._conn.execute(
+                f'SELECT COUNT(*) FROM notion_outbox WHERE {where}', params
+            ).fetchone()[0]
+
+    def stats(self) -> Dict:
+        """큐 깊이 / 지연 / 누적 카운터 (워커가 없어도 여기서 'dead' 작업 정리)"""
+        self._maybe_prune()
+        now = time.time()
+        with self._lock:
+            by_status = dict(self._conn.execute(
+                'SELECT status, COUNT(*) FROM notion_outbox GROUP BY status'
+            ).fetchall())
+            oldest = self._conn.execute(
+                "SELECT MIN(enqueued_at) FROM notion_outbox WHERE status != 'dead'"
+            ).fetchone()[0]
+            counters = dict(self.counters)
+
+        return {
+            'depth': by_status.get('pending', 0) + by_status.get('inflight', 0),
+            'pending': by_status.get('pending', 0),
+            'inflight': by_status.get('inflight', 0),
+            'dead': by_status.get('dead', 0),
+            'lag_s': now - oldest if oldest is not None else 0.0,
+            'workers': len(self._threads),
+            **counters
+        }
+
+    def close(self):
+        self.stop()
+        with self._lock:
+            self._conn.close()
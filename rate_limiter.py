@@ -0,0 +1,132 @@
+"""
+Rate Limiter Module
+API 호출용 공유 토큰 버킷 (Retry-After 반영, 429/5xx 적응형 감속)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    스레드/코루틴 간에 공유하는 토큰 버킷
+
+    - rate (초당 토큰) 로 채워지고 burst 개까지 모아 두었다가 한 번에 쓸 수 있음
+    - pause(): Retry-After 동안 모든 호출자를 멈춤
+    - on_throttled()/on_success(): 429/5xx 에서 rate 를 절반으로, 성공할 때마다 조금씩 복구 (AIMD)
+
+    reserve() 는 토큰을 예약하고 기다려야 할 시간만 반환하므로
+    동기 코드는 acquire(), 비동기 코드는 acquire_async() 를 사용합니다.
+    """
+
+    def __init__(self, rate: float = 3.0, burst: int = 10,
+                 min_rate: Optional[float] = None, recovery: float = 0.1):
+        """
+        Args:
+            rate: 평상시 초당 허용 요청 수 (적응형 감속의 상한)
+            burst: 모아 둘 수 있는 최대 토큰 수
+            min_rate: 감속 하한 (기본: rate 의 1/10)
+            recovery: 성공 1회당 회복할 초당 요청 수
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.recovery = recovery
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last = time.monotonic()  # 마지막 충전 시각 (pause 중에는 미래 시각)
+
+        self.throttled = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지 기다릴 시간 (초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+
+            wait = max(0.0, self._last - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+
+            self.waited += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기 (동기)"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기 (비동기)"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """seconds 동안 모든 호출자를 멈춤 (Retry-After)"""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._last:
+                self._last = until
+                self._tokens = min(self._tokens, 0.0)
+
+    def on_throttled(self):
+        """429/5xx 응답: 허용 속도를 절반으로"""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self):
+        """정상 응답: 허용 속도를 조금씩 회복"""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'max_rate': self.max_rate,
+                'burst': self.burst,
+                'tokens': self._tokens,
+                'throttled': self.throttled,
+                'waited_s': self.waited
+            }
+
+
+_shared_buckets = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_bucket(key: str, rate: float = 3.0, burst: int = 10) -> TokenBucket:
+    """key (예: API 토큰) 별로 공유되는 버킷 반환 (처음 호출 시 생성)"""
+    with _shared_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, burst=burst)
+            _shared_buckets[key] = bucket
+        return bucket
+
+
+def retry_after_seconds(headers, attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Retry-After 헤더 (초) 가 있으면 사용, 없으면 지수 백오프"""
+    value = headers.get('Retry-After') if headers is not None else None
+    if value:
+        try:
+            return min(cap, max(0.0, float(value)))
+        except ValueError:
+            pass
+    return min(cap, base * (2 ** attempt))
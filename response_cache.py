@@ -0,0 +1,218 @@
+"""
+Response Cache Module
+API 응답 캐시 - TTL / 크기 제한 / 동일 요청 합치기 (single-flight) / 적중률 통계
+
+기본 저장소는 프로세스 내 LRUCache 이고, 같은 인터페이스 (get / set / invalidate / stats)
+를 구현한 저장소를 넘기면 여러 uvicorn 워커가 캐시를 공유할 수 있습니다.
+(SQLiteCacheBackend: 같은 호스트의 워커끼리 파일 하나로 공유)
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from memo_cache import LRUCache
+
+_MISSING = object()
+
+
+def _consume_exception(task: asyncio.Task):
+    """기다리는 요청이 모두 끊긴 뒤 실패해도 'exception was never retrieved' 경고가 나지 않도록"""
+    if not task.cancelled():
+        task.exception()
+
+
+class SQLiteCacheBackend:
+    """
+    여러 프로세스가 공유하는 SQLite 캐시 저장소 (값은 JSON 직렬화)
+
+    - 만료된 항목은 조회 시 miss
+    - maxsize 를 넘으면 가장 오래 조회되지 않은 항목부터 삭제
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS response_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_response_cache_accessed ON response_cache(accessed_at);
+    '''
+
+    def __init__(self, path: str = 'response_cache.db', maxsize: int = 10000,
+                 ttl: Optional[float] = 300.0):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM response_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                return default
+            with self._conn:
+                self._conn.execute(
+                    'UPDATE response_cache SET accessed_at = ? WHERE key = ?', (now, key)
+                )
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl is not None else float('inf')
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO response_cache (key, value, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False, default=str), expires_at, now)
+            )
+            # 정리는 가끔씩만 (쓰기 100회마다)
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._evict(now)
+
+    def _evict(self, now: float):
+        self._conn.execute('DELETE FROM response_cache WHERE expires_at <= ?', (now,))
+        self._conn.execute(
+            '''DELETE FROM response_cache WHERE key IN (
+                   SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+               )''',
+            (self.maxsize,)
+        )
+
+    def invalidate(self, key: Optional[str] = None):
+        with self._lock, self._conn:
+            if key is None:
+                self._conn.execute('DELETE FROM response_cache')
+            else:
+                self._conn.execute('DELETE FROM response_cache WHERE key = ?', (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM response_cache').fetchone()[0]
+
+    def stats(self) -> Dict:
+        return {'backend': 'sqlite', 'path': self.path, 'size': len(self),
+                'maxsize': self.maxsize, 'ttl': self.ttl}
+
+
+class ResponseCache:
+    """
+    비동기 엔드포인트용 응답 캐시
+
+    사용 예:
+        cache = ResponseCache(ttl=300, maxsize=2048)
+        result = await cache.get_or_compute(
+            cache.make_key('analyze', keyword),
+            lambda: run_analyzer(analyzer.analyze_multi_portal, keyword)
+        )
+    """
+
+    def __init__(self, backend=None, ttl: Optional[float] = 300.0, maxsize: int = 2048):
+        """
+        Args:
+            backend: get/set/invalidate/stats 를 구현한 저장소 (기본: 프로세스 내 LRUCache)
+            ttl: 항목 유효 시간 (초, backend 를 직접 넘기면 backend 설정을 따름)
+            maxsize: 최대 항목 수 (backend 를 직접 넘기면 backend 설정을 따름)
+        """
+        self.backend = backend if backend is not None else LRUCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.saved_ms = 0.0
+
+    @staticmethod
+    def normalize_keyword(keyword: str) -> str:
+        """대소문자/공백 차이를 무시한 키워드"""
+        return ' '.join(keyword.split()).casefold()
+
+    @classmethod
+    def make_key(cls, endpoint: str, keyword: str, **params) -> str:
+        """(엔드포인트, 정규화한 키워드, 파라미터) 캐시 키"""
+        return f"{endpoint}|{cls.normalize_keyword(keyword)}|{json.dumps(params, sort_keys=True)}"
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                             cache_if: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        캐시에 있으면 반환, 같은 키를 계산 중이면 그 결과를 기다림, 없으면 compute() 실행
+
+        Args:
+            key: make_key() 결과
+            compute: 결과를 반환하는 코루틴 함수
+            cache_if: 결과를 저장할지 판단 (예: 부분 결과는 저장하지 않음)
+        """
+        entry = await self._call_backend(self.backend.get, key, _MISSING)
+        if entry is not _MISSING:
+            self.hits += 1
+            self.saved_ms += entry['cost_ms']
+            return entry['value']
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            inflight = asyncio.create_task(self._compute(key, compute, cache_if))
+            inflight.add_done_callback(_consume_exception)
+            self._inflight[key] = inflight
+
+        # 계산은 요청과 분리된 태스크 - 먼저 온 요청이 끊겨도 (취소) 기다리는 다른 요청은 결과를 받음
+        return await asyncio.shield(inflight)
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]],
+                       cache_if: Optional[Callable[[Any], bool]]) -> Any:
+        """compute() 실행 후 저장 (저장이 끝날 때까지 _inflight 에 남겨서 그 사이 요청도 이 결과를 받음)"""
+        start = time.perf_counter()
+        try:
+            value = await compute()
+            if cache_if is None or cache_if(value):
+                await self._call_backend(
+                    self.backend.set, key,
+                    {'value': value, 'cost_ms': (time.perf_counter() - start) * 1000}
+                )
+            return value
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _call_backend(self, func: Callable, *args) -> Any:
+        """프로세스 내 LRUCache 는 바로 호출, 그 외 저장소 (SQLite 등 I/O) 는 스레드에서 호출"""
+        if isinstance(self.backend, LRUCache):
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def invalidate(self, key: Optional[str] = None):
+        """특정 키 또는 전체 무효화"""
+        self.backend.invalidate(key)
+
+    def stats(self) -> Dict:
+        """적중률 / 절약한 계산 시간 통계"""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'inflight': len(self._inflight),
+            'hit_ratio': (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            'saved_ms': round(self.saved_ms, 1),
+            'backend': self.backend.stats()
+        }
@@ -0,0 +1,140 @@
+"""
+Keyword Signal Matcher Module
+키워드 신호 단어 (의도/트렌드/상업성) 다중 패턴 매칭 - Aho-Corasick
+"""
+
+import json
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+# 그룹별 기본 신호 단어 목록 (설정 파일로 그룹 단위 덮어쓰기 가능)
+DEFAULT_SIGNAL_GROUPS = {
+    # _estimate_volume_google: 검색량 1.5배
+    'volume_trending': ['2024', '2025', 'new', 'latest'],
+    # _calculate_keyword_difficulty: +15 / +10
+    'difficulty_trending': ['2024', '2025', 'new'],
+    'difficulty_common': ['how', 'what', 'best', 'top'],
+    # _estimate_cpc: +0.5
+    'cpc_commercial': ['buy', 'price', 'best', 'review'],
+    # _estimate_conversion: 신호당 +0.2
+    'conversion': ['buy', 'how to', 'best', 'review', 'price'],
+    # _analyze_trend_advanced
+    'trend_rising': ['new', 'best', 'top', 'trending', '2024', '2025', 'latest'],
+    'trend_declining': ['old', 'outdated', 'legacy'],
+    # analyze_search_intent
+    'intent_informational': ['what', 'how', 'why', 'guide', 'tutorial', '방법', '뜻'],
+    'intent_navigational': ['site', 'page', 'app', 'channel', '채널', '사이트'],
+    'intent_commercial': ['best', 'review', 'vs', 'comparison', 'top', '추천', '비교'],
+    'intent_transactional': ['buy', 'order', 'download', 'discount', '구매', '다운로드']
+}
+
+
+class SignalHits:
+    """한 키워드에서 발견된 신호 단어 (그룹별 조회)"""
+
+    __slots__ = ('signals', '_groups')
+
+    def __init__(self, signals: FrozenSet[str], groups: Dict[str, FrozenSet[str]]):
+        self.signals = signals
+        self._groups = groups
+
+    def in_group(self, group: str) -> FrozenSet[str]:
+        """그룹에 속한 신호 중 발견된 것"""
+        return self.signals & self._groups.get(group, frozenset())
+
+    def any(self, group: str) -> bool:
+        """그룹 신호가 하나라도 있는지"""
+        return not self.signals.isdisjoint(self._groups.get(group, frozenset()))
+
+    def count(self, group: str) -> int:
+        """그룹 신호 중 발견된 종류 수 (같은 신호의 반복은 1회)"""
+        return len(self.in_group(group))
+
+    def __repr__(self) -> str:
+        return f"SignalHits({sorted(self.signals)})"
+
+
+class SignalMatcher:
+    """
+    모든 신호 목록으로 한 번 빌드하는 Aho-Corasick 오토마톤
+
+    match() 는 소문자화한 키워드를 한 번만 훑어서 모든 그룹의 신호를 찾습니다.
+    (기존의 `signal in keyword.lower()` 부분 문자열 검사와 같은 결과)
+    """
+
+    def __init__(self, signal_groups: Optional[Dict[str, Iterable[str]]] = None):
+        groups = signal_groups if signal_groups is not None else DEFAULT_SIGNAL_GROUPS
+        self.signal_groups = {
+            group: [signal.lower() for signal in signals if signal]
+            for group, signals in groups.items()
+        }
+        self._group_sets = {
+            group: frozenset(signals) for group, signals in self.signal_groups.items()
+        }
+        self._build()
+
+    @classmethod
+    def from_config(cls, path: str, merge_defaults: bool = True) -> 'SignalMatcher':
+        """
+        JSON 설정 파일에서 로드
+
+        파일 형식: {"그룹명": ["신호1", "신호2", ...], ...}
+        merge_defaults=True 이면 파일에 없는 그룹은 기본값을 사용합니다.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+
+        groups = dict(DEFAULT_SIGNAL_GROUPS) if merge_defaults else {}
+        groups.update(loaded)
+        return cls(groups)
+
+    def _build(self):
+        """트라이 + 실패 링크 구성"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[FrozenSet[str]] = [frozenset()]
+
+        signals = {signal for group in self.signal_groups.values() for signal in group}
+        for signal in signals:
+            state = 0
+            for ch in signal:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(frozenset())
+                state = nxt
+            self._out[state] = self._out[state] | {signal}
+
+        # 깊이 1 상태의 실패 링크는 루트
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] | self._out[self._fail[nxt]]
+
+    def match(self, keyword: str) -> SignalHits:
+        """키워드에서 발견된 모든 신호 반환 (단일 패스)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        found = set()
+
+        for ch in keyword.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+
+        return SignalHits(frozenset(found), self._group_sets)
+
+    def match_many(self, keywords: Iterable[str]) -> List[SignalHits]:
+        """여러 키워드 매칭"""
+        return [self.match(keyword) for keyword in keywords]
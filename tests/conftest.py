@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# 최상위 모듈 (notion_db, rate_limiter 등) 을 import 할 수 있도록
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notion_db import NotionDB  # noqa: E402
+from rate_limiter import TokenBucket  # noqa: E402
+
+
+class FakeNotion:
+    """
+    POST/PATCH 요청 시각과 (메서드, 경로) 를 기록하고, 미리 정한 응답
+    (상태 코드, 헤더[, 본문]) 을 차례로 돌려주는 서버
+    (정해 둔 응답을 다 쓰면 200 - Database 쿼리는 query_results, 그 외는 새 페이지)
+    """
+
+    def __init__(self):
+        self.hits = []
+        self.requests = []
+        self.responses = []
+        self.query_results = []
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                with fake._lock:
+                    fake.hits.append(time.monotonic())
+                    fake.requests.append((self.command, self.path))
+                    status, headers, *body = fake.responses.pop(0) if fake.responses else (200, {})
+
+                if body:
+                    body = body[0]
+                elif status != 200:
+                    body = {"object": "error", "status": status}
+                elif self.path.endswith('/query'):
+                    body = {"object": "list", "results": fake.query_results, "has_more": False}
+                else:
+                    body = {"object": "page", "id": str(uuid.uuid4()), "properties": {}}
+                body = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = _handle
+            do_PATCH = _handle
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_notion():
+    server = FakeNotion()
+    yield server
+    server.close()
+
+
+def make_db(server: FakeNotion, rate_limiter: TokenBucket = None, token: str = None, **kwargs) -> NotionDB:
+    db = NotionDB(token or f"test-{uuid.uuid4().hex}", rate_limiter=rate_limiter, **kwargs)
+    db.base_url = server.url
+    db.set_database_ids({'keyword_analysis': 'keyword-db', 'recommendations': 'recommendations-db'})
+    return db
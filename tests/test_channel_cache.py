@@ -0,0 +1,65 @@
+"""
+channel_cache.ChannelCache 테스트 (yt-dlp 대신 가짜 extract 사용)
+"""
+
+import pytest
+
+from channel_cache import ChannelCache
+
+CHANNEL = 'https://www.youtube.com/channel/UC123'
+
+
+class FakeChannel:
+    """URL 별 목록을 돌려주는 extract 대역 (없는 URL 은 빈 목록)"""
+
+    def __init__(self, listings):
+        self.listings = listings
+        self.calls = []
+
+    def __call__(self, url, limit):
+        self.calls.append(url)
+        entries = self.listings.get(url, [])
+        return {'uploader': 'U', 'entries': list(entries[:limit] if limit else entries)}
+
+
+def entries(*ids):
+    return [{'id': video_id, 'title': video_id} for video_id in ids]
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'channels.db')
+
+
+def test_stores_the_url_that_returned_videos(cache_path):
+    # /videos 탭은 비어 있고 채널 URL 에서만 목록이 나오는 채널
+    extract = FakeChannel({CHANNEL: entries('v2', 'v1')})
+    cache = ChannelCache(cache_path, ttl=0, resolver=lambda url: CHANNEL + '/videos', extract=extract)
+
+    assert [e['id'] for e in cache.get('@channel')['entries']] == ['v2', 'v1']
+    assert cache._load('@channel')['resolved_url'] == CHANNEL
+
+    # 증분 갱신도 목록이 나온 URL 로 받아 새 업로드를 찾음
+    extract.listings[CHANNEL] = entries('v3', 'v2', 'v1')
+    extract.calls.clear()
+    assert [e['id'] for e in cache.get('@channel')['entries']] == ['v3', 'v2', 'v1']
+    assert extract.calls == [CHANNEL]
+
+
+def test_failed_resolution_is_retried_on_next_refresh(cache_path):
+    extract = FakeChannel({'@channel': entries('v1'), CHANNEL + '/videos': entries('v2', 'v1')})
+    resolved = []
+
+    def resolver(url):
+        resolved.append(url)
+        return None if len(resolved) == 1 else CHANNEL + '/videos'
+
+    cache = ChannelCache(cache_path, ttl=0, resolver=resolver, extract=extract)
+
+    # 해석 실패 - 입력 URL 로 받고 해석 결과는 저장하지 않음
+    assert [e['id'] for e in cache.get('@channel')['entries']] == ['v1']
+    assert cache._load('@channel')['resolved_url'] == ''
+
+    assert [e['id'] for e in cache.get('@channel')['entries']] == ['v2', 'v1']
+    assert resolved == ['@channel', '@channel']
+    assert cache._load('@channel')['resolved_url'] == CHANNEL + '/videos'
@@ -0,0 +1,47 @@
+"""
+download_archive.DownloadArchive 테스트
+"""
+
+import pytest
+
+from download_archive import DownloadArchive
+
+
+def videos(*ids):
+    return [{'id': video_id, 'url': f'https://www.youtube.com/watch?v={video_id}', 'title': video_id}
+            for video_id in ids]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = DownloadArchive(str(tmp_path))
+    yield archive
+    archive.close()
+
+
+def test_only_new_retries_unfinished_videos(archive, tmp_path):
+    todo, _ = archive.plan(videos('done', 'failed', 'interrupted', 'queued'), only_new=True)
+    assert len(todo) == 4
+
+    path = tmp_path / 'done.mp4'
+    path.write_bytes(b'x')
+    archive.mark_started('done')
+    archive.mark_completed('done', str(path), 1)
+    archive.mark_started('failed')
+    archive.mark_failed('failed', 'HTTP Error 403')
+    archive.mark_started('interrupted')
+
+    todo, skipped = archive.plan(videos('done', 'failed', 'interrupted', 'queued', 'new'), only_new=True)
+    assert [video['id'] for video in todo] == ['failed', 'interrupted', 'queued', 'new']
+    assert [video['id'] for video in skipped] == ['done']
+
+
+def test_deleted_file_is_fetched_again_unless_only_new(archive, tmp_path):
+    path = tmp_path / 'done.mp4'
+    path.write_bytes(b'x')
+    archive.plan(videos('done'))
+    archive.mark_completed('done', str(path), 1)
+    path.unlink()
+
+    assert [video['id'] for video in archive.plan(videos('done'))[0]] == ['done']
+    assert archive.plan(videos('done'), only_new=True)[0] == []
@@ -0,0 +1,80 @@
+"""
+download_service.DownloadService 테스트 (YoutubeDL 대역 사용)
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from download_service import DownloadService
+
+
+class FakeYoutubeDL:
+    """release 가 풀릴 때까지 기다렸다가 빈 파일을 만드는 YoutubeDL 대역"""
+
+    release = threading.Event()
+    downloaded = []
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def download(self, urls):
+        self.release.wait(5)
+        video_id = urls[0].split('=')[1]
+        self.downloaded.append(video_id)
+        path = os.path.join(os.path.dirname(self.opts['outtmpl']), f'{video_id}.mp4')
+        with open(path, 'wb') as f:
+            f.write(b'x')
+        for hook in self.opts['post_hooks']:
+            hook(path)
+
+
+def videos(prefix, count):
+    return [{'id': f'{prefix}{i}', 'url': f'https://www.youtube.com/watch?v={prefix}{i}', 'title': f'{prefix}{i}'}
+            for i in range(count)]
+
+
+@pytest.fixture
+def service(tmp_path):
+    FakeYoutubeDL.release.clear()
+    FakeYoutubeDL.downloaded = []
+    service = DownloadService(str(tmp_path / 'jobs.db'), workers=1, ydl_factory=FakeYoutubeDL)
+    yield service
+    FakeYoutubeDL.release.set()
+    service.close()
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_cancelled_queued_job_is_pruned(service, tmp_path):
+    # 워커 1개를 첫 작업이 붙잡고 있는 동안 두 번째 작업은 대기 중
+    busy = service.submit(videos('a', 1), str(tmp_path / 'A'))
+    queued = service.submit(videos('b', 3), str(tmp_path / 'B'))
+    wait_for(lambda: service.job(busy)['downloading'] == 1)
+
+    assert service.cancel(queued) == 3
+    assert service.job(queued)['status'] == 'cancelled'
+    assert not [job for job in service.scheduler.jobs if job.tag == queued]
+
+    FakeYoutubeDL.release.set()
+    wait_for(lambda: service.job(busy)['status'] == 'finished')
+    assert not service.scheduler.jobs
+
+
+def test_resubmitting_in_flight_videos_downloads_once(service, tmp_path):
+    first = service.submit(videos('a', 3), str(tmp_path / 'A'))
+    second = service.submit(videos('a', 3) + videos('b', 1), str(tmp_path / 'A'))
+
+    assert service.job(second)['total'] == 1
+    assert service.job(second)['skipped'] == 3
+
+    FakeYoutubeDL.release.set()
+    wait_for(lambda: service.job(first)['status'] == service.job(second)['status'] == 'finished')
+    assert sorted(FakeYoutubeDL.downloaded) == ['a0', 'a1', 'a2', 'b0']
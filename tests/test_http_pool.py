@@ -0,0 +1,60 @@
+"""
+http_pool.PooledHTTPClient 통계 테스트
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_pool import PooledHTTPClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    hits = {}
+
+    def do_GET(self):
+        count = self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path == '/flaky' and count == 1:
+            status, headers = 503, {}
+        elif self.path == '/redirect':
+            status, headers = 302, {'Location': '/ok'}
+        else:
+            status, headers = 200, {}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    Handler.hits = {}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_and_redirects_are_not_counted_as_requests(base_url):
+    client = PooledHTTPClient(backoff_factor=0)
+
+    assert client.get(f'{base_url}/flaky').status_code == 200  # 503 후 재시도
+    assert client.get(f'{base_url}/redirect').status_code == 200
+    assert client.get(f'{base_url}/ok').status_code == 200
+
+    stats = client.stats()
+    assert stats['requests'] == 3
+    assert stats['attempts'] == 5
+    assert stats['retries'] == 1
+    assert stats['redirects'] == 1
+    assert stats['connections_created'] == 1
+    assert stats['connections_reused'] == 4
+    assert stats['hosts']['127.0.0.1']['requests'] == 3
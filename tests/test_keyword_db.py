@@ -0,0 +1,63 @@
+"""
+keyword_analyzer.SQLiteConnectionManager 쓰기 버퍼 테스트
+"""
+
+import sqlite3
+
+import pytest
+
+from keyword_analyzer import SQLiteConnectionManager
+
+INSERT = 'INSERT INTO items (name) VALUES (?)'
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLiteConnectionManager(str(tmp_path / 'items.db'), batch_size=1000,
+                                      flush_interval=60, max_buffer=5)
+    with manager.connection() as conn:
+        conn.execute('CREATE TABLE items (name TEXT UNIQUE NOT NULL)')
+    manager._conn.execute('PRAGMA busy_timeout = 50')
+    yield manager
+    manager.close()
+
+
+def count(manager) -> int:
+    with manager.connection() as conn:
+        return conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+
+
+def test_bad_row_is_dead_lettered(manager):
+    manager.enqueue(INSERT, ('a',))
+    manager.enqueue(INSERT, (None,))  # NOT NULL 위반
+    manager.enqueue(INSERT, ('b',))
+
+    # 읽기 전 flush 에서 나쁜 행만 격리되고 나머지는 기록됨
+    assert count(manager) == 2
+    assert [params for _, params, _ in manager.dead_letters] == [(None,)]
+
+    # 이후 쓰기/읽기도 계속 동작
+    manager.enqueue(INSERT, ('c',))
+    assert count(manager) == 3
+
+
+def test_locked_database_keeps_buffer_and_reads_still_work(manager):
+    other = sqlite3.connect(manager.db_path)
+    other.execute('BEGIN IMMEDIATE')
+
+    manager.enqueue(INSERT, ('a',))
+    manager.enqueue(INSERT, ('b',))
+    # 쓰기 잠금 중에도 읽기는 실패하지 않음 (버퍼는 남음)
+    assert count(manager) == 0
+    assert manager._buffered == 2
+
+    # 버퍼가 가득 차면 새 쓰기는 버림
+    for name in 'cdefg':
+        manager.enqueue(INSERT, (name,))
+    assert manager._buffered == 5
+    assert manager.dropped == 2
+
+    other.rollback()
+    other.close()
+    assert count(manager) == 5
+    assert not manager.dead_letters
@@ -0,0 +1,102 @@
+"""
+NotionDB 테스트 (로컬 가짜 Notion 서버 사용)
+"""
+
+import pytest
+
+from conftest import make_db
+from notion_db import pages_to_dataframe
+from rate_limiter import TokenBucket
+
+ARCHIVED = {
+    "object": "error",
+    "status": 400,
+    "code": "validation_error",
+    "message": "Can't edit block that is archived. You must unarchive the block before editing."
+}
+
+
+def indexed_db(server, page_id='old-page'):
+    db = make_db(server, TokenBucket(rate=100, burst=10))
+    db._page_index = {'python': page_id}
+    db._page_index_warm = True
+    return db
+
+
+@pytest.mark.parametrize('gone', [(404, {}), (400, {}, ARCHIVED)])
+def test_gone_page_is_recreated(fake_notion, gone):
+    fake_notion.responses = [gone]
+    db = indexed_db(fake_notion)
+
+    assert db.sync_keyword_analysis('python', {'google_volume': 10})
+
+    assert fake_notion.requests == [('PATCH', '/pages/old-page'), ('POST', '/pages')]
+    assert db._page_index['python'] != 'old-page'
+
+    # 다음 동기화는 새 페이지를 업데이트
+    assert db.sync_keyword_analysis('python', {'google_volume': 20})
+    assert fake_notion.requests[-1] == ('PATCH', f"/pages/{db._page_index['python']}")
+
+
+def test_index_miss_finds_page_created_elsewhere(fake_notion):
+    # 인덱스를 채운 뒤 다른 프로세스 / Notion UI 에서 만든 페이지
+    fake_notion.query_results = [{"object": "page", "id": "other-page", "properties": {}}]
+    db = make_db(fake_notion, TokenBucket(rate=100, burst=10))
+    db._page_index_warm = True
+
+    assert db.sync_keyword_analysis('python', {'google_volume': 10})
+    assert db.sync_keyword_analysis('python', {'google_volume': 20})
+
+    # 한 번만 조회하고 찾은 페이지를 업데이트 (새로 만들지 않음)
+    assert fake_notion.requests == [
+        ('POST', '/databases/keyword-db/query'),
+        ('PATCH', '/pages/other-page'),
+        ('PATCH', '/pages/other-page')
+    ]
+
+
+def test_index_miss_creates_when_no_page_exists(fake_notion):
+    db = make_db(fake_notion, TokenBucket(rate=100, burst=10))
+    db._page_index_warm = True
+
+    assert db.sync_keyword_analysis('python', {'google_volume': 10})
+    assert fake_notion.requests == [('POST', '/databases/keyword-db/query'), ('POST', '/pages')]
+
+
+def test_other_update_errors_keep_index(fake_notion):
+    fake_notion.responses = [(400, {}, {"object": "error", "message": "body failed validation"})]
+    db = indexed_db(fake_notion)
+
+    assert not db.sync_keyword_analysis('python', {'google_volume': 10})
+
+    assert fake_notion.requests == [('PATCH', '/pages/old-page')]
+    assert db._page_index['python'] == 'old-page'
+
+
+def test_projected_dataframe_keeps_dtypes():
+    pages = [
+        {
+            "id": f"page-{i}",
+            "created_time": "2025-01-01T00:00:00.000Z",
+            "last_edited_time": "2025-01-02T00:00:00.000Z",
+            "properties": {
+                "Keyword": {"type": "title", "title": [{"plain_text": f"keyword {i}"}]},
+                "Google Volume": {"type": "number", "number": i * 100},
+                "Status": {"type": "select", "select": {"name": "active"}},
+                "Tracked": {"type": "checkbox", "checkbox": i % 2 == 0},
+                "Last Updated": {"type": "date", "date": {"start": "2025-01-02"}},
+            }
+        }
+        for i in range(3)
+    ]
+    # 첫 페이지에 없는 속성도 나중에 본 타입으로 변환
+    del pages[0]["properties"]["Google Volume"]
+
+    full = pages_to_dataframe(pages)
+    projection = ['Google Volume', 'Status', 'Tracked', 'Last Updated']
+    projected = pages_to_dataframe(pages, projection)
+
+    assert list(projected.columns) == ['page_id', 'created_time', 'last_edited_time'] + projection
+    assert projected.dtypes.to_dict() == full[projected.columns].dtypes.to_dict()
+    assert str(projected['Status'].dtype) == 'category'
+    assert projected['Google Volume'].isna().tolist() == [True, False, False]
@@ -0,0 +1,71 @@
+"""
+notion_mirror.NotionMirror 테스트 (로컬 가짜 Notion 서버 사용)
+"""
+
+import threading
+
+import pytest
+
+from conftest import make_db
+from notion_mirror import NotionMirror
+
+
+def keyword_page(page_id, keyword):
+    return {
+        "object": "page",
+        "id": page_id,
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": "2025-01-02T00:00:00.000Z",
+        "parent": {"type": "database_id", "database_id": "keyword-db"},
+        "properties": {
+            "Keyword": {"type": "title", "title": [{"plain_text": keyword}]},
+            "Google Volume": {"type": "number", "number": 100}
+        }
+    }
+
+
+@pytest.fixture
+def mirror(fake_notion, tmp_path):
+    fake_notion.query_results = [keyword_page('page-1', 'python')]
+    mirror = NotionMirror(make_db(fake_notion), path=str(tmp_path / 'mirror.db'), max_staleness=60)
+    yield mirror
+    mirror.close()
+
+
+def queries(fake_notion):
+    return [path for method, path in fake_notion.requests if path.endswith('/query')]
+
+
+def test_concurrent_reads_sync_once(mirror, fake_notion):
+    barrier = threading.Barrier(8)
+
+    def read():
+        barrier.wait()
+        mirror.ensure_fresh('keyword_analysis')
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert queries(fake_notion) == ['/databases/keyword-db/query']
+    assert mirror.counters['syncs'] == 1
+
+
+def test_unconfigured_database_is_skipped(mirror, fake_notion, capsys):
+    # make_db 는 trend_data 를 설정하지 않음
+    assert mirror.get_trend_history('python') == []
+    assert fake_notion.requests == []
+    assert mirror.counters['sync_errors'] == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_notion_get_keyword_analysis_reads_from_mirror(mirror, fake_notion):
+    page = mirror.notion.get_keyword_analysis('python')
+    assert page['page_id'] == 'page-1'
+    assert page['properties']['Google Volume'] == 100
+
+    # 두 번째 조회는 Notion 요청 없이 미러에서
+    assert mirror.notion.get_keyword_analysis('python')['page_id'] == 'page-1'
+    assert len(fake_notion.requests) == 1
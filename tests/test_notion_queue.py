@@ -0,0 +1,77 @@
+"""
+notion_queue.NotionWriteQueue 테스트 (같은 spool 파일을 여러 인스턴스가 공유)
+"""
+
+import collections
+import threading
+import time
+
+from notion_queue import NotionWriteQueue
+
+
+class FakeNotion:
+    """전송 횟수만 세는 NotionDB 대역"""
+
+    def __init__(self, delay: float = 0.0):
+        self.databases = {'keyword_analysis': 'keyword-db', 'recommendations': 'recommendations-db'}
+        self.delay = delay
+        self.sent = collections.Counter()
+        self._lock = threading.Lock()
+
+    def sync_keyword_analysis(self, keyword, analysis_data):
+        time.sleep(self.delay)
+        with self._lock:
+            self.sent[keyword] += 1
+        return True
+
+
+def test_shared_spool_sends_each_job_once(tmp_path):
+    notion = FakeNotion(delay=0.002)
+    path = str(tmp_path / 'queue.db')
+    # 프로세스마다 인스턴스 하나 (연결 / 잠금 / owner 가 각각 따로)
+    queues = [NotionWriteQueue(notion, path=path, workers=4, poll_interval=0.05) for _ in range(3)]
+
+    queues[0].enqueue_many([
+        ('keyword_analysis', {'keyword': f'k{i}', 'data': {}}, f'keyword_analysis:k{i}')
+        for i in range(200)
+    ])
+    for queue in queues:
+        queue.start()
+
+    assert queues[0].drain(timeout=30)
+    for queue in queues:
+        queue.close()
+
+    assert len(notion.sent) == 200
+    assert max(notion.sent.values()) == 1
+    assert sum(queue.counters['sent'] for queue in queues) == 200
+
+
+def test_restart_keeps_live_leases_and_reclaims_expired(tmp_path):
+    notion = FakeNotion()
+    path = str(tmp_path / 'queue.db')
+
+    first = NotionWriteQueue(notion, path=path, workers=0, lease_timeout=60)
+    first.enqueue_keyword_analysis('python', {})
+    stale_job = first._claim()
+    assert stale_job is not None
+
+    # 다른 프로세스가 새로 떠도 살아 있는 임대는 건드리지 않음
+    second = NotionWriteQueue(notion, path=path, workers=0, lease_timeout=60)
+    assert second._count("status = 'inflight'") == 1
+    assert second._claim() is None
+
+    # 임대가 끝나면 (첫 워커가 멈춘 경우) 다른 워커가 가져감
+    first._conn.execute('UPDATE notion_outbox SET lease_until = ?', (time.time() - 1,))
+    job = second._claim()
+    assert job is not None
+
+    # 늦게 끝난 첫 워커는 다른 워커가 가져간 작업을 지우거나 되돌리지 않음
+    first._process(*stale_job)
+    assert second._count("status = 'inflight' AND claimed_by = ?", second.owner) == 1
+
+    second._process(*job)
+    assert notion.sent['python'] == 2
+    assert second._count('1 = 1') == 0
+    first.close()
+    second.close()
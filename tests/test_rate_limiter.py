@@ -0,0 +1,77 @@
+"""
+rate_limiter.TokenBucket + NotionDB._send 테스트 (로컬 가짜 Notion 서버 사용)
+"""
+
+import threading
+import time
+import uuid
+
+import pytest
+
+from conftest import make_db
+from rate_limiter import TokenBucket, get_shared_bucket
+
+
+def test_retry_after_is_honored(fake_notion):
+    fake_notion.responses = [(429, {'Retry-After': '1'})]
+    db = make_db(fake_notion, TokenBucket(rate=100, burst=10))
+
+    page = db.add_recommendation('keyword', {'keyword': 'keyword tips'})
+
+    assert page.get('id')
+    assert len(fake_notion.hits) == 2
+    assert fake_notion.hits[1] - fake_notion.hits[0] >= 0.95
+    assert db.rate_limiter.throttled == 1
+
+
+def test_throttling_halves_rate_and_success_recovers(fake_notion):
+    # 429 (Retry-After 0) 와 503 (헤더 없음 → 지수 백오프 0.5초) 다음 성공
+    fake_notion.responses = [(429, {'Retry-After': '0'}), (503, {})]
+    bucket = TokenBucket(rate=8, burst=10, recovery=1.0)
+    db = make_db(fake_notion, bucket)
+
+    start = time.monotonic()
+    assert db.add_recommendation('keyword', {'keyword': 'keyword tips'}).get('id')
+
+    assert time.monotonic() - start >= 0.45
+    assert bucket.throttled == 2
+    assert bucket.rate == pytest.approx(8 / 4 + 1.0)  # 8 → 4 → 2, 성공 1회 +1
+
+    # 성공할 때마다 +1 씩 회복해서 5회 뒤 원래 속도
+    for i in range(5):
+        db.add_recommendation('keyword', {'keyword': f'keyword {i}'})
+    assert bucket.rate == pytest.approx(bucket.max_rate)
+
+
+def test_concurrent_batches_share_one_budget(fake_notion):
+    token = f"test-{uuid.uuid4().hex}"
+    rate, burst = 20.0, 5
+    bucket = get_shared_bucket(token, rate=rate, burst=burst)
+
+    first = make_db(fake_notion, token=token, batch_workers=4)
+    second = make_db(fake_notion, token=token, batch_workers=4)
+    assert first.rate_limiter is bucket and second.rate_limiter is bucket
+
+    results = {}
+
+    def run(name, db):
+        recs = [{'keyword': f'{name} {i}'} for i in range(20)]
+        results[name] = db.batch_add_recommendations('keyword', recs)
+
+    threads = [threading.Thread(target=run, args=(name, db))
+               for name, db in (('first', first), ('second', second))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {'first': 20, 'second': 20}
+
+    # 어떤 구간에서도 요청 수 ≤ burst + rate × 구간 길이 (+ 타이밍 오차 1건)
+    hits = sorted(fake_notion.hits)
+    assert len(hits) == 40
+    for i in range(len(hits)):
+        for j in range(i, len(hits)):
+            assert j - i + 1 <= burst + rate * (hits[j] - hits[i]) + 1
+
+    assert hits[-1] - hits[0] >= (40 - burst) / rate * 0.9
@@ -0,0 +1,64 @@
+"""
+response_cache.ResponseCache 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from response_cache import ResponseCache, SQLiteCacheBackend
+
+
+@pytest.mark.parametrize('shared', [False, True])
+def test_leader_disconnect_does_not_cancel_waiters(tmp_path, shared):
+    cache = ResponseCache(SQLiteCacheBackend(str(tmp_path / 'cache.db')) if shared else None)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'value': 42}
+
+    async def run():
+        leader = asyncio.create_task(cache.get_or_compute('key', compute))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_or_compute('key', compute))
+        await asyncio.sleep(0.01)
+
+        # 먼저 온 요청의 클라이언트가 끊김
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        assert await waiter == {'value': 42}
+        assert await cache.get_or_compute('key', compute) == {'value': 42}
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert cache.stats()['coalesced'] == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_failure_reaches_every_waiter_and_is_not_cached():
+    cache = ResponseCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError('upstream failed')
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_compute('key', compute) for _ in range(3)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert [type(result) for result in results] == [ValueError] * 3
+    assert len(calls) == 1
+    assert cache.stats()['errors'] == 1
+
+    # 실패는 캐시하지 않으므로 다시 계산
+    asyncio.run(run())
+    assert len(calls) == 2
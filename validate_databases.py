@@ -5,88 +5,97 @@ Database Validation & Testing Script
 
 사용법:
 python validate_databases.py --config .env.local
+python validate_databases.py --parallel 6 --timeout 10 --json-report validation_timing.json
 """
 
 import os
 import sys
 import argparse
+from functools import partial
 from dotenv import load_dotenv
 from notion_db import NotionDB
+from notion_health import DATABASES, DEFAULT_PARALLELISM, DEFAULT_TIMEOUT, run_checks, write_json_report
 from datetime import datetime
 import json
 
 class DatabaseValidator:
     """Database 검증 클래스"""
 
-    def __init__(self, api_token: str, db_ids: dict):
-        self.notion_db = NotionDB(api_token)
+    def __init__(self, api_token: str, db_ids: dict, request_timeout: float = 30.0):
+        self.notion_db = NotionDB(api_token, request_timeout=request_timeout)
         self.notion_db.set_database_ids(db_ids)
         self.db_ids = db_ids
         self.results = {}
+        self.timing_report = {}
 
-    def validate_all(self) -> bool:
-        """모든 Database 검증"""
+    def validate_all(self, parallelism: int = DEFAULT_PARALLELISM,
+                     timeout: float = DEFAULT_TIMEOUT) -> bool:
+        """
+        모든 Database 검증 (parallelism 개씩 동시에, Database 당 timeout 초 제한)
+        """
         print("\n" + "="*60)
         print("  🔍 Database Validation")
         print("="*60 + "\n")
 
-        databases = {
-            'keyword_analysis': 'Keyword Analysis 🔍',
-            'trend_data': 'Trend Data 📊',
-            'recommendations': 'Recommendations 💡',
-            'competitor_analysis': 'Competitor Analysis ⚔️',
-            'search_intent': 'Search Intent 🔍',
-            'performance_prediction': 'Performance Prediction 📈'
-        }
+        print(f"📋 Validating {len(DATABASES)} databases "
+              f"(parallel: {parallelism}, timeout: {timeout:.0f}s)...\n")
 
-        for db_key, display_name in databases.items():
-            print(f"📋 Validating {display_name}...")
-            self.results[db_key] = self._validate_database(db_key)
-            print()
+        self.timing_report = run_checks(
+            {db_key: partial(self._validate_database, db_key) for db_key in DATABASES},
+            parallelism=parallelism,
+            timeout=timeout
+        )
+        self.results = self.timing_report['databases']
+
+        for db_key, display_name in DATABASES.items():
+            self._print_database_result(display_name, self.results[db_key])
+
+        print(f"⏱️  Total: {self.timing_report['total_ms']:.0f} ms\n")
 
         return self._print_validation_summary()
 
     def _validate_database(self, db_key: str) -> dict:
-        """개별 Database 검증"""
+        """개별 Database 검증 (출력 없이 결과만 반환 - 동시에 실행됨)"""
         db_id = self.db_ids.get(db_key)
 
         if not db_id:
             return {'status': False, 'error': 'Database ID not found'}
 
-        try:
-            # 기본 연결 테스트
-            response = self.notion_db._query_database(db_id)
+        # 기본 연결 테스트
+        response = self.notion_db._query_database(db_id)
 
-            if 'results' not in response:
-                return {'status': False, 'error': 'Invalid response'}
+        if 'has_more' not in response:
+            return {'status': False, 'error': 'Invalid response'}
 
-            result_count = len(response.get('results', []))
+        result_count = len(response.get('results', []))
 
-            # 상세 검증
-            validation = {
-                'status': True,
-                'db_id': db_id[:16] + '...',
-                'total_pages': result_count,
-                'has_data': result_count > 0,
-                'properties': self._count_properties(response),
-                'timestamp': datetime.now().isoformat()
-            }
+        # 상세 검증
+        return {
+            'status': True,
+            'db_id': db_id[:16] + '...',
+            'total_pages': result_count,
+            'has_data': result_count > 0,
+            'properties': self._count_properties(response),
+            'timestamp': datetime.now().isoformat()
+        }
 
-            print(f"  ✅ Connected")
-            print(f"  📊 Total pages: {result_count}")
-            print(f"  🔧 Properties: {validation['properties']}")
+    def _print_database_result(self, display_name: str, result: dict):
+        """Database 하나의 검증 결과 출력"""
+        print(f"📋 {display_name} ({result.get('elapsed_ms', 0):.0f} ms)")
 
-            if result_count > 0:
-                print(f"  ✅ Has data")
-            else:
-                print(f"  ⚠️  No data yet")
+        if not result.get('status', False):
+            print(f"  ❌ Error: {result.get('error', 'Unknown error')}\n")
+            return
 
-            return validation
+        print(f"  ✅ Connected")
+        print(f"  📊 Total pages: {result['total_pages']}")
+        print(f"  🔧 Properties: {result['properties']}")
 
-        except Exception as e:
-            error_msg = str(e)
-            print(f"  ❌ Error: {error_msg}")
-            return {'status': False, 'error': error_msg}
+        if result['has_data']:
+            print(f"  ✅ Has data")
+        else:
+            print(f"  ⚠️  No data yet")
+        print()
 
     def _count_properties(self, response: dict) -> int:
         """속성 개수 카운트"""
@@ -110,12 +119,11 @@ class DatabaseValidator:
             status_icon = "✅" if result.get('status', False) else "❌"
             db_display = db_name.replace('_', ' ').title()
 
+            print(f"{status_icon} {db_display} ({result.get('elapsed_ms', 0):.0f} ms)")
             if result.get('status', False):
-                print(f"{status_icon} {db_display}")
                 print(f"   Pages: {result.get('total_pages', 0)}")
                 print(f"   Properties: {result.get('properties', 0)}")
             else:
-                print(f"{status_icon} {db_display}")
                 print(f"   Error: {result.get('error', 'Unknown error')}")
             print()
 
@@ -282,6 +290,22 @@ def main():
         action='store_true',
         help='Run full validation including API tests'
     )
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help=f'Databases to validate concurrently (default: {DEFAULT_PARALLELISM}, 1 = sequential)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f'Per-database timeout in seconds (default: {DEFAULT_TIMEOUT:.0f})'
+    )
+    parser.add_argument(
+        '--json-report',
+        help='Write a JSON timing report to this path'
+    )
 
     args = parser.parse_args()
 
@@ -307,10 +331,14 @@ def main():
         sys.exit(1)
 
     # Validator 생성
-    validator = DatabaseValidator(api_token, db_ids)
+    validator = DatabaseValidator(api_token, db_ids, request_timeout=args.timeout)
 
     # 기본 검증
-    basic_ok = validator.validate_all()
+    basic_ok = validator.validate_all(parallelism=args.parallel, timeout=args.timeout)
+
+    if args.json_report:
+        write_json_report(validator.timing_report, args.json_report)
+        print(f"📄 Timing report saved to {args.json_report}")
 
     # API 테스트 (선택사항)
     if args.test_api or args.full: